@@ -0,0 +1,251 @@
+"""
+Audacity .aup3 프로젝트 파일에서 레이블을 직접 읽기 위한 유틸리티 함수들
+
+.aup3는 SQLite 데이터베이스이고, 프로젝트 XML은 project(또는 autosave) 테이블의
+dict/doc 열에 Audacity ProjectSerializer의 바이너리 형식으로 저장되어 있습니다.
+"""
+import os
+import csv
+import sqlite3
+import struct
+from contextlib import closing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+from .label_utils import Label, write_labels
+from .file_utils import get_files_path_in_folder_via_ext, rename, atomic_write
+
+# ProjectSerializer 필드 타입 코드
+(FT_CHAR_SIZE, FT_START_TAG, FT_END_TAG, FT_STRING, FT_INT, FT_BOOL, FT_LONG, FT_LONG_LONG,
+ FT_SIZE_T, FT_FLOAT, FT_DOUBLE, FT_DATA, FT_RAW, FT_PUSH, FT_POP, FT_NAME) = range(16)
+
+# FT_CHAR_SIZE 값(wxStringCharType 크기)별 문자열 인코딩
+CHAR_ENCODINGS = {1: 'utf-8', 2: 'utf-16-le', 4: 'utf-32-le'}
+
+_USHORT = struct.Struct('<H')
+_NAME = struct.Struct('<HH')
+_STRING = struct.Struct('<Hi')
+_LENGTH = struct.Struct('<i')
+
+def _value_structs(long_size: int) -> Dict[int, struct.Struct]:
+    # long/size_t 크기는 Audacity 버전과 플랫폼에 따라 4 또는 8바이트입니다.
+    long_format, size_format = ('q', 'Q') if long_size == 8 else ('i', 'I')
+    return {
+        FT_INT: struct.Struct('<Hi'),
+        FT_BOOL: struct.Struct('<HB'),
+        FT_LONG: struct.Struct('<H' + long_format),
+        FT_LONG_LONG: struct.Struct('<Hq'),
+        FT_SIZE_T: struct.Struct('<H' + size_format),
+        FT_FLOAT: struct.Struct('<Hfi'),
+        FT_DOUBLE: struct.Struct('<Hdi'),
+    }
+
+def connect_readonly(aup3_file: str, mmap_size: int = 256 * 1024 * 1024) -> sqlite3.Connection:
+    """
+    .aup3 파일을 읽기 전용(immutable)으로 엽니다. 잠금과 저널을 쓰지 않으므로
+    Audacity가 저장 중인 프로젝트에는 사용하지 마세요.
+
+    Args:
+        aup3_file (str): .aup3 파일 경로
+        mmap_size (int): SQLite 메모리 맵 크기(바이트)
+
+    Returns:
+        sqlite3.Connection: 읽기 전용 연결
+    """
+    uri = Path(os.path.abspath(aup3_file)).as_uri() + '?mode=ro&immutable=1'
+    connection = sqlite3.connect(uri, uri=True)
+    connection.execute(f'PRAGMA mmap_size={int(mmap_size)}')
+    return connection
+
+def read_project_blobs(aup3_file: str, prefer_autosave: bool = False) -> Tuple[bytes, bytes]:
+    """
+    프로젝트의 (dict, doc) 바이너리를 읽습니다.
+    저장된 project 행을 먼저 읽고, 없으면 autosave 행을 읽습니다.
+
+    Args:
+        aup3_file (str): .aup3 파일 경로
+        prefer_autosave (bool): 저장되지 않은 변경(autosave)이 있으면 그것을 먼저 읽을지 여부
+
+    Returns:
+        Tuple[bytes, bytes]: (dict, doc)
+    """
+    tables = ('autosave', 'project') if prefer_autosave else ('project', 'autosave')
+    with closing(connect_readonly(aup3_file)) as connection:
+        for table in tables:
+            try:
+                row = connection.execute(f'SELECT dict, doc FROM {table} WHERE id = 1').fetchone()
+            except sqlite3.OperationalError:
+                continue
+            if row and row[1]:
+                return bytes(row[0] or b''), bytes(row[1])
+    raise ValueError(f'프로젝트 문서가 없습니다: {aup3_file}')
+
+def iter_project_elements(dict_blob: bytes, doc_blob: bytes, long_size: int = 8) -> Iterator[Tuple[str, str, Optional[Dict]]]:
+    """
+    ProjectSerializer 바이너리를 XML 이벤트로 풀어냅니다.
+
+    Args:
+        dict_blob (bytes): 태그/속성 이름 사전
+        doc_blob (bytes): 문서 본문
+        long_size (int): long/size_t 값의 바이트 수 (4 또는 8)
+
+    Yields:
+        Tuple[str, str, Optional[Dict]]: ('start', 태그, 속성) 또는 ('end', 태그, None)
+
+    Raises:
+        ValueError: 형식이 맞지 않을 때
+    """
+    data = memoryview(dict_blob + doc_blob)
+    values = _value_structs(long_size)
+    names = {}
+    encoding = 'utf-16-le'
+    element = None
+    position = 0
+    try:
+        while position < len(data):
+            field = data[position]
+            position += 1
+            if field in values:
+                value_struct = values[field]
+                name_id, value = value_struct.unpack_from(data, position)[:2]
+                position += value_struct.size
+                if element is not None:
+                    element[1][names[name_id]] = value
+            elif field == FT_STRING:
+                name_id, length = _STRING.unpack_from(data, position)
+                position += _STRING.size
+                value = bytes(data[position:position + length]).decode(encoding)
+                position += length
+                if element is not None:
+                    element[1][names[name_id]] = value
+            elif field == FT_START_TAG:
+                name_id, = _USHORT.unpack_from(data, position)
+                position += _USHORT.size
+                if element is not None:
+                    yield ('start',) + element
+                element = (names[name_id], {})
+            elif field == FT_END_TAG:
+                name_id, = _USHORT.unpack_from(data, position)
+                position += _USHORT.size
+                if element is not None:
+                    yield ('start',) + element
+                    element = None
+                yield 'end', names[name_id], None
+            elif field == FT_NAME:
+                name_id, length = _NAME.unpack_from(data, position)
+                position += _NAME.size
+                names[name_id] = bytes(data[position:position + length]).decode(encoding)
+                position += length
+            elif field == FT_CHAR_SIZE:
+                encoding = CHAR_ENCODINGS[data[position]]
+                position += 1
+            elif field in (FT_DATA, FT_RAW):
+                length, = _LENGTH.unpack_from(data, position)
+                position += _LENGTH.size + length
+            elif field in (FT_PUSH, FT_POP):
+                continue
+            else:
+                raise ValueError(f'알 수 없는 필드 타입 {field} (위치 {position - 1})')
+    except (KeyError, IndexError, struct.error, UnicodeDecodeError) as error:
+        raise ValueError(f'프로젝트 문서를 해석할 수 없습니다 (위치 {position}): {error!r}') from error
+    if element is not None:
+        yield ('start',) + element
+
+def decode_label_tracks(dict_blob: bytes, doc_blob: bytes, source: str = '') -> List[Tuple[str, List[Label]]]:
+    """
+    프로젝트 바이너리에서 레이블 트랙들을 꺼냅니다.
+
+    Args:
+        dict_blob (bytes): 태그/속성 이름 사전
+        doc_blob (bytes): 문서 본문
+        source (str): Label.source에 넣을 값
+
+    Returns:
+        List[Tuple[str, List[Label]]]: 트랙 순서대로 (트랙 이름, 레이블들)
+    """
+    error = None
+    for long_size in (8, 4):
+        tracks = []
+        try:
+            for event, tag, attrs in iter_project_elements(dict_blob, doc_blob, long_size):
+                if event == 'start' and tag == 'labeltrack':
+                    tracks.append((attrs.get('name', ''), []))
+                elif event == 'start' and tag == 'label' and tracks:
+                    tracks[-1][1].append(Label(float(attrs.get('t', 0.0)), float(attrs.get('t1', 0.0)),
+                                               str(attrs.get('title', '')), source))
+            return tracks
+        except ValueError as decode_error:
+            error = decode_error
+    raise error
+
+def read_aup3_label_tracks(aup3_file: str, prefer_autosave: bool = False) -> List[Tuple[str, List[Label]]]:
+    """
+    .aup3 파일에서 레이블 트랙들을 읽습니다. Audacity가 필요 없습니다.
+
+    Args:
+        aup3_file (str): .aup3 파일 경로
+        prefer_autosave (bool): 저장되지 않은 변경(autosave)을 먼저 읽을지 여부
+
+    Returns:
+        List[Tuple[str, List[Label]]]: 트랙 순서대로 (트랙 이름, 레이블들)
+    """
+    dict_blob, doc_blob = read_project_blobs(aup3_file, prefer_autosave)
+    return decode_label_tracks(dict_blob, doc_blob, aup3_file)
+
+def read_aup3_labels(aup3_file: str, prefer_autosave: bool = False) -> List[Label]:
+    """
+    .aup3 파일의 모든 레이블을 트랙 순서대로 읽습니다 (Audacity의 레이블 내보내기와 같은 순서).
+
+    Args:
+        aup3_file (str): .aup3 파일 경로
+        prefer_autosave (bool): 저장되지 않은 변경(autosave)을 먼저 읽을지 여부
+
+    Returns:
+        List[Label]: 레이블들
+    """
+    return [label for _, labels in read_aup3_label_tracks(aup3_file, prefer_autosave) for label in labels]
+
+def _extract_aup3_file(aup3_file: str, output_file: Optional[str], precision: Optional[int]) -> Tuple[str, str, List[Tuple[str, List[Label]]]]:
+    # 프로세스 풀 작업 단위: 오류는 결과로 돌려줍니다.
+    try:
+        tracks = read_aup3_label_tracks(aup3_file)
+    except (sqlite3.Error, ValueError, OSError) as error:
+        return aup3_file, f'error: {error}', []
+    if output_file:
+        write_labels(output_file, (label for _, labels in tracks for label in labels), precision, atomic=True)
+    return aup3_file, 'done', tracks
+
+def extract_aup3_labels_in_folder(folder_path: str, recursive: bool = False, write_txt: bool = True,
+                                  output_csv: Optional[str] = None, precision: Optional[int] = 6,
+                                  max_workers: Optional[int] = None) -> List[Tuple[str, str]]:
+    """
+    폴더의 .aup3 파일들에서 레이블을 여러 프로세스로 읽어 저장합니다.
+    레이블 txt는 프로젝트와 같은 이름으로, CSV는 모든 레이블을 한 파일로 저장합니다.
+    모든 파일은 임시 파일을 거쳐 한 번에 교체됩니다.
+
+    Args:
+        folder_path (str): .aup3 파일이 있는 폴더 경로
+        recursive (bool): 하위 폴더까지 탐색할지 여부
+        write_txt (bool): 프로젝트별 레이블 txt를 저장할지 여부
+        output_csv (str, optional): 모든 레이블을 모은 CSV 경로 (utf-8-sig)
+        precision (int, optional): txt에 저장할 시간 소수점 자릿수
+        max_workers (int, optional): 프로세스 수. None이면 CPU 수
+
+    Returns:
+        List[Tuple[str, str]]: 파일별 (경로, 'done' 또는 'error: ...')
+    """
+    aup3_files = get_files_path_in_folder_via_ext(folder_path, 'aup3', recursive)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_extract_aup3_file, aup3_file,
+                                   rename(aup3_file, new_extension='txt') if write_txt else None, precision)
+                   for aup3_file in aup3_files]
+        results = [future.result() for future in futures]
+    if output_csv:
+        with atomic_write(output_csv, encoding='utf-8-sig', newline='') as file:
+            csv_writer = csv.writer(file)
+            csv_writer.writerow(['file', 'track', 'start', 'end', 'text'])
+            for aup3_file, _, tracks in results:
+                for track_name, labels in tracks:
+                    for label in labels:
+                        csv_writer.writerow([aup3_file, track_name, label.start, label.end, label.text])
+    return [(aup3_file, status) for aup3_file, status, _ in results]
@@ -1,35 +1,126 @@
 """
 CSV 파일 처리를 위한 핸들러 클래스
 """
+import io
 import os
 import csv
+import time
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Union, Optional
+from types import MappingProxyType
+from typing import Iterable, List, Dict, Mapping, Union, Optional
+from .file_utils import atomic_write
+from .csv_utils import column_map, get_column_index, forget_header, read_csv_cached, read_header
+
+_VALUE_TYPES = {'float': float, 'int': int}
+
+def _as_type(values: pd.Series, value_type: str) -> pd.Series:
+    # search_value와 같은 방식으로 열/검색 값들을 변환합니다.
+    return values.astype(_VALUE_TYPES.get(value_type, str))
+
+class ColumnIndex:
+    """
+    CSVHandler 열 하나의 조회 인덱스. 같은 값이 여러 번 있으면 첫 행을 가리킵니다.
+    'hash'는 해시 조인, 'sorted'는 정렬된 키 배열의 이진 탐색(np.searchsorted)으로 찾습니다.
+    """
+
+    def __init__(self, keys: pd.Series, kind: str = 'hash'):
+        """
+        Args:
+            keys (pd.Series): 변환이 끝난 열 값들
+            kind (str): 'hash' 또는 'sorted'
+        """
+        if kind not in ('hash', 'sorted'):
+            raise ValueError(f"알 수 없는 인덱스 종류: {kind}")
+        self.kind = kind
+        valid = keys.notna().to_numpy()
+        if kind == 'sorted':
+            positions = np.flatnonzero(valid)
+            values = keys.to_numpy()[positions]
+            # 안정 정렬이므로 같은 값 중에서는 앞 행이 먼저 옵니다.
+            order = np.argsort(values, kind='stable')
+            self.keys = values[order]
+            self.positions = positions[order]
+        else:
+            first = valid & ~keys.duplicated().to_numpy()
+            self.positions = np.flatnonzero(first)
+            self.keys = keys.to_numpy()[first]
+            self._index = pd.Index(self.keys)
+            self._map = dict(zip(self.keys.tolist(), self.positions.tolist()))
+
+    def get(self, key) -> int:
+        """key가 있는 첫 행의 위치, 없으면 -1"""
+        if self.kind == 'hash':
+            return self._map.get(key, -1)
+        if pd.isna(key):
+            return -1
+        i = int(np.searchsorted(self.keys, key, side='left'))
+        return int(self.positions[i]) if i < len(self.keys) and self.keys[i] == key else -1
+
+    def get_many(self, keys: pd.Series) -> np.ndarray:
+        """keys 각각의 첫 행 위치 배열, 없는 키는 -1"""
+        if self.kind == 'hash':
+            found = self._index.get_indexer(keys)
+        else:
+            keys = keys.to_numpy()
+            # 빈 값(None/NaN)은 정렬된 키와 비교할 수 없으므로 찾지 않고 -1로 둡니다.
+            valid = ~pd.isna(keys)
+            found = np.full(len(keys), -1, dtype=np.int64)
+            found[valid] = np.searchsorted(self.keys, keys[valid], side='left')
+            found[found >= len(self.keys)] = -1
+            hit = found >= 0
+            hit[hit] = self.keys[found[hit]] == keys[hit]
+            found[~hit] = -1
+        positions = np.full(len(found), -1, dtype=np.int64)
+        positions[found >= 0] = self.positions[found[found >= 0]]
+        return positions
 
 class CSVHandler:
-    """CSV 파일을 처리하기 위한 핸들러 클래스"""
+    """
+    CSV 파일을 처리하기 위한 핸들러 클래스
+    search_value/lookup_many/to_dict는 만들어 둔 인덱스와 딕셔너리를 재사용합니다.
+    self.data를 통째로 바꾸면 알아서 다시 만들지만, 값을 직접 고쳤다면
+    (예: data.loc[0, 'name'] = 'q') invalidate_indexes()를 호출해야 바뀐 값으로 조회됩니다.
+    """
     
-    def __init__(self, file_path: Optional[str] = None):
+    def __init__(self, file_path: Optional[str] = None, cache: bool = False,
+                 index_columns: Union[List[str], Dict[str, str], None] = None):
         """
         CSVHandler 초기화
         
         Args:
             file_path (str, optional): 처리할 CSV 파일의 경로
+            cache (bool): 로드할 때 CSV 옆의 Feather 캐시를 사용할지 여부 (csv_utils.read_csv_cached 참고)
+            index_columns (List[str] | Dict[str, str], optional): 인덱스를 둘 열 이름들.
+                딕셔너리면 열 이름 -> 'hash' 또는 'sorted' (add_index 참고)
         """
         self.file_path = file_path
+        self.cache = cache
         self.data = None
+        self.index_columns = {}
+        self._indexes = {}
+        self._dicts = {}
+        self._indexed_data = None
+        if isinstance(index_columns, dict):
+            for column_name, kind in index_columns.items():
+                self.add_index(column_name, kind)
+        else:
+            for column_name in index_columns or []:
+                self.add_index(column_name)
         if file_path:
             self.load(file_path)
     
-    def load(self, file_path: str) -> None:
+    def load(self, file_path: str, cache: Optional[bool] = None) -> None:
         """
         CSV 파일을 로드합니다.
         
         Args:
             file_path (str): 로드할 CSV 파일의 경로
+            cache (bool, optional): Feather 캐시를 사용할지 여부. None이면 생성할 때 지정한 값
         """
         self.file_path = file_path
-        self.data = pd.read_csv(file_path, encoding='utf-8-sig')
+        self.data = read_csv_cached(file_path, cache=self.cache if cache is None else cache)
+        self.invalidate_indexes()
     
     def save(self, file_path: Optional[str] = None, index: bool = False) -> str:
         """
@@ -64,6 +155,7 @@ class CSVHandler:
             data (pd.DataFrame): 설정할 데이터
         """
         self.data = data
+        self.invalidate_indexes()
     
     def add_column(self, column_name: str, values: List = None, index: int = 0) -> None:
         """
@@ -77,10 +169,44 @@ class CSVHandler:
         if values is None:
             values = [None] * len(self.data)
         self.data.insert(index, column_name, values)
+        self.invalidate_indexes()
     
     def remove_empty_rows(self) -> None:
         """비어있는 행을 제거합니다."""
         self.data = self.data.dropna(how='all')
+        self.invalidate_indexes()
+
+    def add_index(self, column_name: str, kind: str = 'hash') -> None:
+        """
+        search_value/lookup_many에서 사용할 인덱스를 선언합니다. 인덱스는 처음 조회할 때 만들어지고,
+        load/set_data/add_column/remove_empty_rows로 데이터가 바뀌면 다시 만들어집니다.
+        self.data를 직접 수정했다면 invalidate_indexes()를 호출하세요.
+
+        Args:
+            column_name (str): 인덱스를 둘 열 이름
+            kind (str): 'hash'(정확히 일치하는 값 조회) 또는 'sorted'(정렬된 배열 이진 탐색)
+        """
+        if kind not in ('hash', 'sorted'):
+            raise ValueError(f"알 수 없는 인덱스 종류: {kind}")
+        self.index_columns[column_name] = kind
+        self.invalidate_indexes()
+
+    def invalidate_indexes(self) -> None:
+        """만들어 둔 인덱스와 to_dict 결과를 버립니다."""
+        self._indexes = {}
+        self._dicts = {}
+        self._indexed_data = self.data
+
+    def _check_indexes(self) -> None:
+        # self.data가 통째로 바뀌었으면 인덱스를 버립니다.
+        if self._indexed_data is not self.data:
+            self.invalidate_indexes()
+
+    def _index(self, column_name: str, value_type: str, kind: str) -> ColumnIndex:
+        key = (column_name, value_type, kind)
+        if key not in self._indexes:
+            self._indexes[key] = ColumnIndex(_as_type(self.data[column_name], value_type), kind)
+        return self._indexes[key]
     
     def search_value(self, search_column: str, search_value: Union[str, int, float], 
                     target_column: str, value_type: str = 'str') -> Optional[str]:
@@ -96,6 +222,11 @@ class CSVHandler:
         Returns:
             Optional[str]: 검색된 값이 있으면 해당 행의 target_column 값, 없으면 None
         """
+        self._check_indexes()
+        if search_column in self.index_columns:
+            index = self._index(search_column, value_type, self.index_columns[search_column])
+            position = index.get(_VALUE_TYPES.get(value_type, str)(search_value))
+            return self.data[target_column].iloc[position] if position >= 0 else None
         if value_type == 'float':
             mask = self.data[search_column].astype(float) == float(search_value)
         elif value_type == 'int':
@@ -106,18 +237,50 @@ class CSVHandler:
         result = self.data[mask][target_column]
         return result.iloc[0] if not result.empty else None
     
-    def to_dict(self, key_column: str, value_column: str) -> Dict:
+    def to_dict(self, key_column: str, value_column: str) -> Mapping:
         """
-        데이터를 딕셔너리로 변환합니다.
+        데이터를 딕셔너리로 변환합니다. 결과는 만들어 둔 딕셔너리의 읽기 전용 뷰라서
+        다시 호출해도 복사하지 않습니다. 수정하려면 dict(...)로 복사해서 쓰세요.
         
         Args:
             key_column (str): 키로 사용할 열의 이름
             value_column (str): 값으로 사용할 열의 이름
             
         Returns:
-            Dict: 변환된 딕셔너리
+            Mapping: 변환된 읽기 전용 딕셔너리 (같은 키가 여러 번 있으면 마지막 행의 값)
         """
-        return dict(zip(self.data[key_column], self.data[value_column]))
+        self._check_indexes()
+        key = (key_column, value_column)
+        if key not in self._dicts:
+            self._dicts[key] = dict(zip(self.data[key_column], self.data[value_column]))
+        return MappingProxyType(self._dicts[key])
+
+    def lookup_many(self, search_column: str, search_values: Iterable, target_column: str,
+                    value_type: str = 'str') -> List:
+        """
+        여러 값을 한 번에 검색합니다. search_value를 값마다 호출한 것과 같은 결과를
+        인덱스와의 조인 한 번으로 구합니다.
+
+        Args:
+            search_column (str): 검색할 열의 이름
+            search_values (Iterable): 검색할 값들
+            target_column (str): 반환할 열의 이름
+            value_type (str): 검색 값의 타입 ('str', 'int', 'float')
+
+        Returns:
+            List: search_values 순서대로 target_column 값, 없는 값은 None
+        """
+        self._check_indexes()
+        kind = self.index_columns.get(search_column, 'hash')
+        if search_column in self.index_columns:
+            index = self._index(search_column, value_type, kind)
+        else:
+            index = ColumnIndex(_as_type(self.data[search_column], value_type), kind)
+        positions = index.get_many(_as_type(pd.Series(list(search_values), dtype=object), value_type))
+        result = np.full(len(positions), None, dtype=object)
+        found = positions >= 0
+        result[found] = self.data[target_column].to_numpy()[positions[found]]
+        return result.tolist()
     
     def to_list(self) -> List[Dict]:
         """
@@ -128,11 +291,344 @@ class CSVHandler:
         """
         return self.data.to_dict('records') 
     
+class CSVTable:
+    """
+    CSV 파일을 한 번만 읽어 메모리에서 조회/수정하는 테이블
+    검색 열마다 해시 인덱스를 만들어 두고, 수정 사항은 모아 두었다가
+    flush() 때(또는 flush_every번 수정마다) 임시 파일을 거쳐 한 번에 저장합니다.
+    """
+
+    def __init__(self, csv_file: str, encoding: str = 'utf-8-sig', flush_every: int = 0):
+        """
+        CSVTable 초기화
+
+        Args:
+            csv_file (str): CSV 파일의 경로
+            encoding (str): 파일 인코딩
+            flush_every (int): 이 횟수만큼 수정할 때마다 자동 저장 (0이면 flush()를 호출할 때만 저장)
+        """
+        self.csv_file = csv_file
+        self.encoding = encoding
+        self.flush_every = flush_every
+        self.dirty = False
+        self._pending = 0
+        self.load()
+
+    def load(self) -> 'CSVTable':
+        """파일을 다시 읽습니다. 저장하지 않은 수정 사항은 버려집니다."""
+        with open(self.csv_file, 'r', newline='', encoding=self.encoding) as file:
+            rows = list(csv.reader(file))
+        self.header = rows[0] if rows else []
+        self.rows = rows[1:]
+        self._columns = column_map(self.header)
+        self._indexes = {}
+        self.dirty = False
+        self._pending = 0
+        self.stat = self._file_stat()
+        return self
+
+    def _file_stat(self):
+        stat = os.stat(self.csv_file)
+        return stat.st_mtime_ns, stat.st_size
+
+    def is_stale(self) -> bool:
+        """다른 곳에서 파일이 바뀌었는지 여부"""
+        return os.path.exists(self.csv_file) and self._file_stat() != self.stat
+
+    def column_index(self, column_name: str) -> int:
+        """열 이름의 인덱스(0부터 시작), 없으면 -1"""
+        return self._columns.get(column_name, -1)
+
+    def index(self, column_name: str) -> Dict[str, int]:
+        """
+        열 값(앞뒤 공백 제거) -> 행 번호 해시 인덱스를 반환합니다. 같은 값이 여러 번 있으면 첫 행을 가리킵니다.
+        """
+        if column_name not in self._indexes:
+            column = self.column_index(column_name)
+            index = {}
+            for i, row in enumerate(self.rows):
+                if column < len(row):
+                    index.setdefault(row[column].strip(), i)
+            self._indexes[column_name] = index
+        return self._indexes[column_name]
+
+    def find_row(self, search_column: str, search_value) -> Optional[List[str]]:
+        """search_column 값이 search_value인 첫 행, 없으면 None"""
+        if self.column_index(search_column) == -1:
+            return None
+        position = self.index(search_column).get(str(search_value).strip())
+        return None if position is None else self.rows[position]
+
+    def get(self, search_column: str, search_value, target_column: str, default=None):
+        """검색한 행의 target_column 값, 행이나 열이 없으면 default"""
+        row = self.find_row(search_column, search_value)
+        target = self.column_index(target_column)
+        if row is None or target == -1:
+            return default
+        return row[target] if target < len(row) else ''
+
+    def set(self, search_column: str, search_value, target_column: str, value) -> bool:
+        """검색한 행의 target_column 값을 바꿉니다. 행이나 열이 없으면 False"""
+        row = self.find_row(search_column, search_value)
+        target = self.column_index(target_column)
+        if row is None or target == -1:
+            return False
+        if target >= len(row):
+            row.extend([''] * (target + 1 - len(row)))
+        row[target] = value
+        # 값이 바뀐 열의 인덱스는 다음 조회 때 다시 만듭니다.
+        self._indexes.pop(target_column, None)
+        self._touch()
+        return True
+
+    def append_row(self, values: Union[List, Dict]) -> None:
+        """행을 추가합니다. values가 딕셔너리면 열 이름으로 배치합니다."""
+        if isinstance(values, dict):
+            row = [''] * len(self.header)
+            for column_name, value in values.items():
+                if column_name in self._columns:
+                    row[self._columns[column_name]] = value
+        else:
+            row = list(values)
+        self.rows.append(row)
+        for column_name, index in self._indexes.items():
+            column = self.column_index(column_name)
+            if column < len(row):
+                index.setdefault(str(row[column]).strip(), len(self.rows) - 1)
+        self._touch()
+
+    def get_or_set_value(self, search_column: str, search_value, target_column: str, replacement_value=None):
+        """
+        CSVHelper.get_or_set_value와 같은 결과를 메모리에서 돌려줍니다.
+        값이 비어 있으면 False, 있으면 그 값, 행이나 열이 없으면 None
+        replacement_value가 있으면 그 값을 대입합니다.
+        """
+        row = self.find_row(search_column, search_value)
+        target = self.column_index(target_column)
+        if row is None or target == -1:
+            return None
+        previous = row[target] if target < len(row) else ''
+        if replacement_value:
+            self.set(search_column, search_value, target_column, replacement_value)
+        if not previous:
+            return False
+        return replacement_value or previous
+
+    def _touch(self) -> None:
+        self.dirty = True
+        self._pending += 1
+        if self.flush_every and self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> bool:
+        """수정 사항이 있으면 임시 파일을 거쳐 한 번에 저장합니다. 저장했으면 True"""
+        if not self.dirty:
+            return False
+        with atomic_write(self.csv_file, encoding=self.encoding, newline='') as file:
+            csv_writer = csv.writer(file)
+            csv_writer.writerow(self.header)
+            csv_writer.writerows(self.rows)
+        forget_header(self.csv_file)
+        self.dirty = False
+        self._pending = 0
+        self.stat = self._file_stat()
+        return True
+
+    def __enter__(self) -> 'CSVTable':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+
+def _last_record_end(csv_file: str, chunk_size: int = 1024 * 1024) -> int:
+    """
+    파일에서 마지막으로 완전히 쓰인 행이 끝나는 위치(바이트)를 찾습니다.
+    따옴표 수가 짝수면 마지막 행이 줄바꿈 없이 끝나도 완전한 행으로 보고 파일 크기를 반환합니다.
+    홀수면(따옴표 안에서 잘림) 앞쪽 따옴표 수가 짝수인 마지막 줄바꿈을 찾습니다.
+    따옴표와 줄바꿈이 ASCII 바이트인 인코딩(utf-8, cp949 등)을 가정합니다.
+    """
+    quotes = 0
+    with open(csv_file, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            quotes += chunk.count(b'"')
+        size = file.tell()
+        if quotes % 2 == 0:
+            return size
+        end = size
+        while end > 0:
+            start = max(0, end - chunk_size)
+            file.seek(start)
+            chunk = file.read(end - start)
+            position = len(chunk)
+            while True:
+                newline = chunk.rfind(b'\n', 0, position)
+                quotes -= chunk.count(b'"', newline + 1, position)
+                if newline == -1:
+                    break
+                if quotes % 2 == 0:
+                    return start + newline + 1
+                position = newline
+            end = start
+    return 0
+
+class CSVAppender:
+    """
+    헤더가 정해진 CSV에 행을 이어 쓰는 기록기. 파일 전체를 다시 쓰지 않으므로 행마다 비용이 일정합니다.
+    행은 buffer_rows개씩 모아 한 번에 쓰고, fsync_interval초마다 디스크에 동기화합니다.
+    이미 있는 파일에 이어 쓸 때는 비정상 종료로 잘린 마지막 행을 먼저 잘라냅니다.
+    """
+
+    def __init__(self, csv_file: str, header: Optional[List[str]] = None, encoding: str = 'utf-8-sig',
+                 buffer_rows: int = 1000, fsync_interval: Optional[float] = None, overwrite: bool = False):
+        """
+        CSVAppender 초기화
+
+        Args:
+            csv_file (str): CSV 파일의 경로
+            header (List[str], optional): 열 이름들. None이면 기존 파일의 헤더를 사용
+            encoding (str): 파일 인코딩
+            buffer_rows (int): 이 개수만큼 행이 모이면 파일에 씀
+            fsync_interval (float, optional): fsync 간격(초). None이면 fsync하지 않고, 0이면 쓸 때마다 fsync
+            overwrite (bool): 기존 파일을 지우고 새로 시작할지 여부
+
+        Raises:
+            ValueError: 헤더가 없거나 기존 파일의 헤더와 다를 때
+        """
+        self.csv_file = csv_file
+        self.encoding = encoding
+        self.buffer_rows = buffer_rows
+        self.fsync_interval = fsync_interval
+        self.truncated = 0
+        self.rows_appended = 0
+        resume = not overwrite and os.path.exists(csv_file) and os.path.getsize(csv_file) > 0
+        end = _last_record_end(csv_file) if resume else 0
+        # 헤더를 확인하기 전에는 파일을 고치지 않습니다.
+        existing = read_header(csv_file, encoding) if end > 0 else []
+        if existing and header is not None and list(header) != existing:
+            raise ValueError(f"헤더가 기존 파일과 다릅니다: {existing} != {list(header)}")
+        header = header if header is not None else existing or None
+        if header is None:
+            raise ValueError(f"헤더가 없습니다: {csv_file}")
+        if resume:
+            self.truncated = self._repair(end)
+        self.header = list(header)
+        self._columns = column_map(self.header)
+        self._block = io.StringIO()
+        self._writer = csv.writer(self._block)
+        self._pending = 0
+        self._synced_at = time.monotonic()
+        self.file = open(csv_file, 'a' if resume else 'w', newline='', encoding=encoding)
+        if self.file.tell() == 0:
+            self._writer.writerow(self.header)
+            self.flush()
+
+    def _repair(self, end: int) -> int:
+        # end 뒤의 잘린 행을 잘라내고, 마지막 행에 줄바꿈이 없으면 붙입니다. 잘라낸 바이트 수를 반환합니다.
+        size = os.path.getsize(self.csv_file)
+        with open(self.csv_file, 'r+b') as file:
+            if end < size:
+                file.truncate(end)
+            if end > 0:
+                file.seek(end - 1)
+                if file.read(1) != b'\n':
+                    file.write(b'\r\n')
+        forget_header(self.csv_file)
+        return size - end
+
+    def append(self, row: Union[List, Dict]) -> None:
+        """
+        행 하나를 추가합니다.
+
+        Args:
+            row (List | Dict): 값 리스트 또는 열 이름 -> 값 딕셔너리 (없는 열은 빈 칸)
+
+        Raises:
+            ValueError: 딕셔너리에 헤더에 없는 열이 있을 때
+        """
+        if isinstance(row, dict):
+            unknown = [key for key in row if key not in self._columns]
+            if unknown:
+                raise ValueError(f"헤더에 없는 열: {unknown}")
+            row = [row.get(name, '') for name in self.header]
+        self._writer.writerow(row)
+        self._pending += 1
+        self.rows_appended += 1
+        if self._pending >= self.buffer_rows:
+            self.flush()
+
+    def append_many(self, rows: Iterable[Union[List, Dict]]) -> None:
+        """여러 행을 추가합니다."""
+        for row in rows:
+            self.append(row)
+
+    def flush(self, fsync: bool = False) -> None:
+        """
+        모아 둔 행들을 파일에 씁니다. fsync가 True이거나 fsync_interval이 지났으면 디스크에 동기화합니다.
+        """
+        block = self._block.getvalue()
+        if block:
+            self.file.write(block)
+            self._block.seek(0)
+            self._block.truncate()
+            self._pending = 0
+        self.file.flush()
+        now = time.monotonic()
+        if fsync or (self.fsync_interval is not None and now - self._synced_at >= self.fsync_interval):
+            os.fsync(self.file.fileno())
+            self._synced_at = now
+
+    def close(self) -> None:
+        """남은 행을 쓰고 파일을 닫습니다."""
+        if self.file.closed:
+            return
+        self.flush(fsync=self.fsync_interval is not None)
+        self.file.close()
+
+    def __enter__(self) -> 'CSVAppender':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # 예외가 나도 이미 추가한 행은 완전한 행이므로 저장합니다.
+        self.close()
+
 class CSVHelper:
-    def __init__(self, worker_code=None, csv_file_path=None):
+    def __init__(self, worker_code=None, csv_file_path=None, flush_every=0):
+        # flush_every : get_or_set_value로 바꾼 값을 몇 번마다 파일에 저장할지 (1이면 매번)
+        #   0이면 모아 두었다가 flush()/close() 때, 파일을 직접 읽거나 쓰는 메서드를 부르기 전,
+        #   또는 객체가 사라질 때 저장합니다.
+        self.flush_every = flush_every
+        self._tables = {}
         if csv_file_path: self.set_csv_file_path(csv_file_path)
         if worker_code: self.set_worker_code(worker_code)
 
+    def table(self, csv_file=None) -> CSVTable:
+        """
+        csv_file의 CSVTable을 반환합니다. 한 번 읽은 파일은 다시 읽지 않고,
+        다른 곳에서 파일이 바뀐 경우에만 다시 읽습니다.
+        """
+        csv_file = csv_file or self.csv_file_path
+        table = self._tables.get(csv_file)
+        if table is None or (not table.dirty and table.is_stale()):
+            table = CSVTable(csv_file, flush_every=self.flush_every)
+            self._tables[csv_file] = table
+        return table
+
+    def flush(self):
+        """get_or_set_value로 모아둔 수정 사항을 모두 저장합니다."""
+        for table in self._tables.values():
+            table.flush()
+
+    def close(self):
+        """모아둔 수정 사항을 저장합니다. flush()와 같습니다."""
+        self.flush()
+
+    def __del__(self):
+        # close()를 부르지 않았어도 모아둔 수정 사항을 잃지 않도록 저장합니다.
+        try:
+            self.flush()
+        except Exception:
+            pass
+
     def set_csv_file_path(self, csv_file_path):
         self.csv_file_path = csv_file_path
         return self
@@ -165,13 +661,15 @@ class CSVHelper:
             return
 
         txt_file = self.change_extension(csv_file, 'txt')
-        # CSV 파일 읽기
+        # CSV 파일 읽기 (모아둔 수정 사항을 먼저 저장)
+        self.flush()
         df = pd.read_csv(csv_file)
 
         # 탭으로 구분된 텍스트 파일로 변환하여 출력
         df.to_csv(txt_file, sep='\t', index=False)
 
     def read_csv_and_get_rows(self, csv_file):
+        self.flush()
         with open(csv_file, 'r', newline='', encoding='utf-8-sig') as file:
             csv_reader = csv.reader(file)
             rows = list(csv_reader)
@@ -208,10 +706,12 @@ class CSVHelper:
         :param column_name: 값을 추가할 컬럼의 이름
         :param values: 추가할 값들의 리스트
         """
+        # 모아둔 수정 사항을 먼저 저장해야 덮어쓰지 않습니다.
+        self.flush()
         rows = self.read_csv_and_get_rows(csv_file)
         
-        # 컬럼 인덱스를 찾기 위해 컬럼 이름을 사용합니다.
-        column_index = self.find_column_index(csv_file, column_name)
+        # 컬럼 인덱스를 찾기 위해 컬럼 이름을 사용합니다. (이미 읽은 헤더 사용)
+        column_index = self.find_column_index(csv_file, column_name, header=rows[0] if rows else None)
         
         if column_index != -1:
             # 컬럼 인덱스가 유효한 경우에만 값을 추가합니다.
@@ -240,10 +740,11 @@ class CSVHelper:
         :return: 값이 있는 셀의 개수 (검색한 열 제외)
         """
         csv_file = csv_file or self.csv_file_path
+        self.flush()
         rows = self.read_csv_and_get_rows(csv_file)
 
         # search_column의 인덱스를 찾습니다.
-        col_index_search = self.find_column_index(csv_file, search_column)
+        col_index_search = self.find_column_index(csv_file, search_column, header=rows[0] if rows else None)
         print("col_index:\t",col_index_search)
         if col_index_search == -1:
             # 만약 해당 열이 존재하지 않는다면 None을 반환합니다.
@@ -282,48 +783,24 @@ class CSVHelper:
         if not csv_file:
             print("csv_file_path is None")
             return None
-        rows = self.read_csv_and_get_rows(csv_file)
-
-        # search_column과 target_column의 인덱스를 찾습니다.
-        col_index_search = self.find_column_index(csv_file, search_column)
-        # print("col_index search\t", col_index_search)
-        col_index_target = self.find_column_index(csv_file, target_column)
-        # print("col_index target\t", col_index_target)
+        # 파일을 매번 다시 읽지 않고, 한 번 읽어 둔 테이블의 해시 인덱스로 찾습니다.
+        table = self.table(csv_file)
 
-        if col_index_search == -1 or col_index_target == -1:
+        if table.column_index(search_column) == -1 or table.column_index(target_column) == -1:
             # 만약 해당 열이 존재하지 않는다면 None을 반환합니다.
             print("Not exist.")
             return None
 
-        for row in rows:
-            if str(row[col_index_search]).strip() == str(search_value).strip():
-                # search_value 값이 있는 행을 찾았습니다.
-                if not row[col_index_target]:
-                    # target_column 열의 값이 없고, replacement_value 값이 주어진 경우 replacement_value 값을 대입합니다.
-                    if replacement_value:
-                        row[col_index_target] = replacement_value
-                        self.write_rows(csv_file, rows)
-                    return False
-                else:
-                    if replacement_value:
-                        row[col_index_target] = replacement_value
-                        self.write_rows(csv_file, rows)
-                    return row[col_index_target]
-
-        # 해당 값을 찾지 못한 경우 None을 반환합니다.
-        print("Can't find.")
-        return None
+        result = table.get_or_set_value(search_column, search_value, target_column, replacement_value)
+        if result is None:
+            # 해당 값을 찾지 못한 경우 None을 반환합니다.
+            print("Can't find.")
+        return result
 
 
-    def find_column_index(self, csv_file, column_name):
-        with open(csv_file, 'r', newline='', encoding='utf-8-sig') as file:
-            reader = csv.reader(file)
-            first_row = next(reader)  # 첫 번째 행 읽기
-            
-            for i, column in enumerate(first_row):# 컬럼 인덱스는 1부터 시작?
-                if column == column_name:
-                    return i
-        return -1  # 컬럼을 찾지 못한 경우 -1 반환    
+    def find_column_index(self, csv_file, column_name, header=None):
+        # 컬럼 인덱스는 0부터 시작. 헤더는 캐시되고, header를 주면 파일을 읽지 않습니다.
+        return get_column_index(csv_file, column_name, header)
 
     def write_rows(self, csv_file, rows):
         """
@@ -332,6 +809,10 @@ class CSVHelper:
         :param csv_file: CSV 파일의 경로
         :param rows: 쓸 행들의 리스트
         """
+        # 모아둔 수정 사항을 먼저 저장하고, 읽어 둔 테이블은 버려서 나중에 덮어쓰지 않게 합니다.
+        self.flush()
         with open(csv_file, 'w', newline='', encoding='utf-8-sig') as file:
             csv_writer = csv.writer(file)
             csv_writer.writerows(rows)
+        self._tables.pop(csv_file, None)
+        forget_header(csv_file)
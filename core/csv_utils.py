@@ -5,8 +5,25 @@ import os
 import sys
 import pandas as pd
 import csv
-from typing import List, Dict, Optional, Union
-from junLib import path_exist
+import glob
+from collections import deque
+from functools import partial
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Sequence, Tuple, Union
+from .file_utils import path_exist, atomic_write
+from .encoding_utils import open_text
+
+# pyarrow가 있으면 CSV 옆에 Feather(Arrow IPC) 캐시를 둘 수 있습니다. 없으면 항상 CSV를 읽습니다.
+try:
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:
+    pa = None
+    feather = None
+
+# 헤더 캐시: 절대 경로 -> ((수정 시각, 크기, 인코딩), 헤더, 열 이름 -> 인덱스(0부터))
+_HEADER_CACHE: Dict[str, Tuple[Tuple, List[str], Dict[str, int]]] = {}
 
 def get_csv_file_path(csv_file: str) -> str:
     """
@@ -16,18 +33,18 @@ def get_csv_file_path(csv_file: str) -> str:
         csv_file = os.path.join(os.path.dirname(__file__), csv_file)
     return csv_file
 
-def read_csv_and_get_rows(csv_file: str, encoding: str = 'utf-8-sig') -> List[List[str]]:
+def read_csv_and_get_rows(csv_file: str, encoding: Optional[str] = 'utf-8-sig') -> List[List[str]]:
     """
     CSV 파일을 읽어서 행들의 리스트를 반환합니다.
     
     Args:
         csv_file (str): 읽을 CSV 파일의 경로
-        encoding (str): 파일 인코딩
+        encoding (str, optional): 파일 인코딩. None이면 내용으로 판단 (encoding_utils.detect_encoding)
         
     Returns:
         List[List[str]]: CSV 파일의 행들의 리스트
     """
-    with open(csv_file, 'r', newline='', encoding=encoding) as file:
+    with open_text(csv_file, encoding) as file:
         csv_reader = csv.reader(file)
         rows = list(csv_reader)
     return rows
@@ -47,27 +64,352 @@ def write_rows(csv_file: str, rows: List[List[str]], encoding: str = 'utf-8-sig'
     with open(csv_file, 'w', newline='', encoding=encoding) as file:
         csv_writer = csv.writer(file)
         csv_writer.writerows(rows)
+    forget_header(csv_file)
     return csv_file
 
-def find_column_index(csv_file: str, column_name: str) -> int:
+def iter_csv_rows(csv_file: str, encoding: Optional[str] = 'utf-8-sig') -> Iterator[List[str]]:
+    """
+    CSV 파일의 행들을 하나씩 읽습니다. 파일 전체를 메모리에 올리지 않습니다.
+
+    Args:
+        csv_file (str): 읽을 CSV 파일의 경로
+        encoding (str, optional): 파일 인코딩. None이면 내용으로 판단 (encoding_utils.detect_encoding)
+
+    Yields:
+        List[str]: 행
+    """
+    with open_text(csv_file, encoding) as file:
+        yield from csv.reader(file)
+
+def _unique_header(header: List[str]) -> List[str]:
+    # pd.read_csv처럼 중복 열 이름에 .1, .2를 붙입니다.
+    seen = {}
+    unique = []
+    for name in header:
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        seen.setdefault(name, 0)
+        unique.append(name)
+    return unique
+
+def _read_csv_file(csv_file: str, encoding: str) -> Tuple[str, List[str], List[List[str]]]:
+    rows = [row for row in iter_csv_rows(csv_file, encoding) if row]
+    return csv_file, (_unique_header(rows[0]) if rows else []), rows[1:]
+
+def _read_many(csv_files: Iterable[str], encoding: str, max_workers: Optional[int]) -> Iterator[Tuple[str, List[str], List[List[str]]]]:
+    # 파일 읽기(I/O)는 스레드로 겹치고, 결과는 csv_files 순서대로 돌려줍니다.
+    # 미리 읽어 두는 파일은 스레드 수만큼만 두고, 하나를 돌려줄 때마다 다음 파일을 맡깁니다.
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    read = partial(_read_csv_file, encoding=encoding)
+    files = iter(csv_files)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        window = deque(executor.submit(read, csv_file) for csv_file in islice(files, workers))
+        while window:
+            result = window.popleft().result()
+            for csv_file in islice(files, 1):
+                window.append(executor.submit(read, csv_file))
+            yield result
+
+def iter_many_csv_rows(csv_files: Iterable[str], encoding: Optional[str] = 'utf-8-sig', source_column: str = 'source_file',
+                       max_workers: Optional[int] = None) -> Iterator[Dict[str, str]]:
+    """
+    여러 CSV 파일의 행들을 파일 순서대로 하나씩 읽습니다. 파일은 스레드 풀에서 스레드 수만큼만 미리 읽습니다.
+
+    Args:
+        csv_files (Iterable[str]): CSV 파일 경로들
+        encoding (str, optional): 파일 인코딩. None이면 파일마다 내용으로 판단 (encoding_utils.detect_encoding)
+        source_column (str): 원본 파일 경로를 넣을 키
+        max_workers (int, optional): 스레드 수. None이면 ThreadPoolExecutor 기본값
+
+    Yields:
+        Dict[str, str]: 열 이름 -> 값 (그 파일에 없는 열은 키가 없음)
+    """
+    for csv_file, header, rows in _read_many(csv_files, encoding, max_workers):
+        for row in rows:
+            record = dict(zip(header, row))
+            record[source_column] = csv_file
+            yield record
+
+def load_many(csv_files: Iterable[str], encoding: Optional[str] = 'utf-8-sig', source_column: str = 'source_file',
+              max_workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    여러 CSV 파일을 스레드 풀로 읽어 하나의 DataFrame으로 합칩니다.
+    파일마다 열 구성이 달라도 열 이름으로 맞추고, 처음 나온 순서대로 열을 둡니다.
+    값은 read_csv_and_get_rows처럼 문자열 그대로이고, 그 파일에 없는 열이나 짧은 행의 빈 칸은 결측값입니다.
+    헤더보다 긴 행의 나머지 칸과 빈 줄은 버립니다.
+
+    Args:
+        csv_files (Iterable[str]): CSV 파일 경로들
+        encoding (str, optional): 파일 인코딩. None이면 파일마다 내용으로 판단 (encoding_utils.detect_encoding)
+        source_column (str): 원본 파일 경로를 넣을 첫 열의 이름
+        max_workers (int, optional): 스레드 수. None이면 ThreadPoolExecutor 기본값
+
+    Returns:
+        pd.DataFrame: 합친 데이터
+
+    Raises:
+        ValueError: CSV에 source_column과 같은 이름의 열이 있을 때
+    """
+    source = []
+    columns: Dict[str, List] = {}
+    for csv_file, header, rows in _read_many(csv_files, encoding, max_workers):
+        if source_column in header:
+            raise ValueError(f"{csv_file}에 이미 '{source_column}' 열이 있습니다. source_column을 바꿔주세요.")
+        for name in header:
+            if name not in columns:
+                columns[name] = [None] * len(source)
+        for i, name in enumerate(header):
+            columns[name].extend([row[i] if i < len(row) else None for row in rows])
+        for name, column in columns.items():
+            if len(column) == len(source):
+                column.extend([None] * len(rows))
+        source.extend([csv_file] * len(rows))
+    return pd.DataFrame({source_column: source, **columns})
+
+def concat_folder(folder_path: str, pattern: str = '*.csv', recursive: bool = False, **kwargs) -> pd.DataFrame:
+    """
+    폴더에서 pattern에 맞는 CSV 파일들을 이름순으로 찾아 load_many로 합칩니다.
+
+    Args:
+        folder_path (str): 폴더 경로
+        pattern (str): 파일 이름 패턴 (glob)
+        recursive (bool): 하위 폴더까지 탐색할지 여부
+        **kwargs: load_many에 넘길 인자 (encoding, source_column, max_workers)
+
+    Returns:
+        pd.DataFrame: 합친 데이터
+    """
+    search = os.path.join(folder_path, '**', pattern) if recursive else os.path.join(folder_path, pattern)
+    csv_files = sorted(path for path in glob.glob(search, recursive=recursive) if os.path.isfile(path))
+    return load_many(csv_files, **kwargs)
+
+def transform_csv(csv_file: str, stages: Sequence[Callable[[Iterator[List]], Iterable[List]]],
+                  output_file: Optional[str] = None, encoding: str = 'utf-8-sig') -> str:
+    """
+    행들을 변환 단계(제너레이터)들에 차례로 흘려보내며 임시 파일에 쓰고, 끝나면 한 번에 교체합니다.
+    메모리 사용량은 파일 크기와 관계없이 일정합니다. 도중에 오류가 나면 원본은 그대로 남습니다.
+
+    Args:
+        csv_file (str): 원본 CSV 파일의 경로
+        stages (Sequence[Callable]): rows -> rows 변환 단계들
+        output_file (str, optional): 저장할 파일 경로. None이면 원본을 교체
+        encoding (str): 파일 인코딩
+
+    Returns:
+        str: 저장된 파일의 경로
+    """
+    output_file = output_file or csv_file
+    rows = iter_csv_rows(csv_file, encoding)
+    for stage in stages:
+        rows = stage(rows)
+    with atomic_write(output_file, encoding=encoding, newline='') as file:
+        csv.writer(file).writerows(rows)
+    forget_header(output_file)
+    return output_file
+
+def drop_empty_rows(rows: Iterable[List]) -> Iterator[List]:
+    """모든 셀이 비어있는 행을 건너뜁니다."""
+    return (row for row in rows if any(str(field).strip() for field in row))
+
+def number_rows(rows: Iterable[List], column_name: str = 'num') -> Iterator[List]:
+    """헤더 앞에 column_name, 나머지 행 앞에 1부터 시작하는 번호를 붙입니다."""
+    for i, row in enumerate(rows):
+        yield [column_name if i == 0 else i] + row
+
+def prefix_header(rows: Iterable[List], name_row: List[str]) -> Iterator[List]:
+    """첫 행 앞에 name_row를 붙입니다."""
+    for i, row in enumerate(rows):
+        yield list(name_row) + row if i == 0 else row
+
+def replace_in_column(rows: Iterable[List], search_column: str, search_value: str, replace_value: str) -> Iterator[List]:
+    """첫 행(헤더)에서 search_column을 찾아, 그 열의 값이 search_value인 셀을 replace_value로 바꿉니다."""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    search_index = get_column_index(None, search_column, header=header)
+    if search_index == -1:
+        raise ValueError(f"'{search_column}' is not in list")
+    yield header
+    for row in rows:
+        if search_index < len(row) and row[search_index] == search_value:
+            row[search_index] = replace_value
+        yield row
+
+def update_rows(rows: Iterable[List], search_column: str, updates: Dict[str, Dict[str, object]],
+                applied: Optional[List[int]] = None) -> Iterator[List]:
+    """
+    첫 행(헤더)에서 search_column을 찾아, 그 열의 값(앞뒤 공백 제거)이 updates의 키인 행에
+    {열 이름: 새 값}을 대입합니다. 없는 열이 있으면 ValueError를 올립니다.
+
+    Args:
+        rows (Iterable[List]): 헤더를 포함한 행들
+        search_column (str): 키로 찾을 열의 이름
+        updates (Dict[str, Dict[str, object]]): {검색 값: {열 이름: 새 값}}
+        applied (List[int], optional): 주면 바뀐 행 수를 applied[0]에 더합니다
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    columns = column_map(header)
+    if search_column not in columns:
+        raise ValueError(f"'{search_column}' is not in list")
+    missing = {column for values in updates.values() for column in values} - set(columns)
+    if missing:
+        raise ValueError(f"{sorted(missing)} is not in list")
+    search_index = columns[search_column]
+    # 열 이름 대신 인덱스로 바꿔 두어 행마다 찾지 않습니다.
+    indexed = {str(key).strip(): [(columns[column], value) for column, value in values.items()]
+               for key, values in updates.items()}
+    yield header
+    for row in rows:
+        changes = indexed.get(row[search_index].strip()) if search_index < len(row) else None
+        if changes:
+            for index, value in changes:
+                if index >= len(row):
+                    row.extend([''] * (index + 1 - len(row)))
+                row[index] = value
+            if applied is not None:
+                applied[0] += 1
+        yield row
+
+def load_updates(update_source: Union[str, pd.DataFrame], key_column: str, skip_empty: bool = True,
+                 encoding: str = 'utf-8-sig') -> Dict[str, Dict[str, str]]:
+    """
+    업데이트 CSV 파일 또는 DataFrame을 {키: {열 이름: 새 값}}으로 바꿉니다.
+    key_column을 제외한 모든 열이 대입 대상입니다.
+
+    Args:
+        update_source (str | pd.DataFrame): 업데이트 CSV 경로 또는 DataFrame
+        key_column (str): 키 열의 이름
+        skip_empty (bool): 비어있는 값(NaN 포함)은 대입하지 않을지 여부
+        encoding (str): CSV 파일 인코딩
+
+    Returns:
+        Dict[str, Dict[str, str]]: 업데이트 매핑
+    """
+    if isinstance(update_source, pd.DataFrame):
+        records = update_source.astype(object).where(update_source.notna(), '').astype(str).to_dict('records')
+    else:
+        with open(update_source, 'r', newline='', encoding=encoding) as file:
+            records = list(csv.DictReader(file))
+    updates = {}
+    for record in records:
+        key = str(record.pop(key_column)).strip()
+        values = {column: value for column, value in record.items()
+                  if column is not None and not (skip_empty and (value is None or str(value).strip() == ''))}
+        if values:
+            updates.setdefault(key, {}).update(values)
+    return updates
+
+def bulk_update(csv_file: str, search_column: str,
+                updates: Union[Dict[str, Dict[str, object]], str, pd.DataFrame],
+                key_column: Optional[str] = None, output_file: Optional[str] = None,
+                skip_empty: bool = True) -> int:
+    """
+    여러 키의 값을 한 번의 스트리밍 읽기/쓰기로 바꿉니다.
+    search_and_replace_content를 키마다 호출하는 대신 사용합니다.
+
+    Args:
+        csv_file (str): 수정할 CSV 파일의 경로
+        search_column (str): 키로 찾을 열의 이름
+        updates: {검색 값: {열 이름: 새 값}}, 업데이트 CSV 경로 또는 DataFrame
+        key_column (str, optional): 업데이트 CSV/DataFrame의 키 열 이름. None이면 search_column
+        output_file (str, optional): 저장할 파일 경로. None이면 원본을 교체
+        skip_empty (bool): 업데이트 CSV/DataFrame의 빈 값은 대입하지 않을지 여부
+
+    Returns:
+        int: 바뀐 행 수
+    """
+    if not isinstance(updates, dict):
+        updates = load_updates(updates, key_column or search_column, skip_empty)
+    applied = [0]
+    transform_csv(csv_file, [partial(update_rows, search_column=search_column, updates=updates, applied=applied)],
+                  output_file)
+    return applied[0]
+
+def column_map(header: List[str]) -> Dict[str, int]:
+    """
+    헤더로 열 이름 -> 인덱스(0부터 시작) 딕셔너리를 만듭니다. 같은 이름이 여러 번 있으면 첫 열을 씁니다.
+
+    Args:
+        header (List[str]): 헤더 행
+
+    Returns:
+        Dict[str, int]: 열 이름 -> 인덱스
+    """
+    columns = {}
+    for i, column in enumerate(header):
+        columns.setdefault(column, i)
+    return columns
+
+def _cached_header(csv_file: str, encoding: str) -> Tuple[List[str], Dict[str, int]]:
+    path = os.path.abspath(csv_file)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size, encoding)
+    cached = _HEADER_CACHE.get(path)
+    if cached is None or cached[0] != key:
+        # 헤더 한 줄만 읽습니다.
+        with open(path, 'r', newline='', encoding=encoding) as file:
+            header = next(csv.reader(file), [])
+        cached = _HEADER_CACHE[path] = (key, header, column_map(header))
+    return cached[1], cached[2]
+
+def read_header(csv_file: str, encoding: str = 'utf-8-sig') -> List[str]:
+    """
+    CSV 파일의 헤더(첫 행)를 반환합니다. 경로+수정 시각+크기가 같으면 파일을 다시 읽지 않습니다.
+
+    Args:
+        csv_file (str): CSV 파일의 경로
+        encoding (str): 파일 인코딩
+
+    Returns:
+        List[str]: 헤더 행
+    """
+    return list(_cached_header(csv_file, encoding)[0])
+
+def get_column_index(csv_file: Optional[str], column_name: str, header: Optional[List[str]] = None,
+                     encoding: str = 'utf-8-sig') -> int:
+    """
+    열 이름의 인덱스(0부터 시작)를 반환합니다. header를 주면 파일을 읽지 않습니다.
+
+    Args:
+        csv_file (str, optional): CSV 파일의 경로 (header가 없을 때 사용)
+        column_name (str): 찾을 열의 이름
+        header (List[str], optional): 이미 읽은 헤더 행
+        encoding (str): 파일 인코딩
+
+    Returns:
+        int: 열의 인덱스 (0부터 시작), 찾지 못한 경우 -1
+    """
+    if header is not None:
+        return column_map(header).get(column_name, -1)
+    return _cached_header(csv_file, encoding)[1].get(column_name, -1)
+
+def forget_header(csv_file: str) -> None:
+    """
+    헤더 캐시에서 파일을 지웁니다. 수정 시각 해상도가 낮은 파일 시스템에서 같은 크기로 다시 쓴 경우를 위해
+    파일을 쓰는 함수들이 호출합니다.
+    """
+    _HEADER_CACHE.pop(os.path.abspath(csv_file), None)
+
+def find_column_index(csv_file: str, column_name: str, header: Optional[List[str]] = None) -> int:
     """
     CSV 파일에서 특정 열의 인덱스를 찾습니다.
+    헤더는 캐시되므로 같은 파일을 반복해서 조회해도 파일을 다시 읽지 않습니다.
     
     Args:
         csv_file (str): CSV 파일의 경로
         column_name (str): 찾을 열의 이름
+        header (List[str], optional): 이미 읽은 헤더 행
         
     Returns:
         int: 열의 인덱스 (1부터 시작), 찾지 못한 경우 -1
     """
-    with open(csv_file, 'r', newline='', encoding='utf-8-sig') as file:
-        reader = csv.reader(file)
-        first_row = next(reader)
-        
-        for i, column in enumerate(first_row):
-            if column == column_name:
-                return i + 1
-    return -1
+    index = get_column_index(csv_file, column_name, header)
+    return index + 1 if index != -1 else -1
 
 def add_column_names(csv_file: str, name_row: List[str]) -> str:
     """
@@ -80,9 +422,7 @@ def add_column_names(csv_file: str, name_row: List[str]) -> str:
     Returns:
         str: 수정된 파일의 경로
     """
-    rows = read_csv_and_get_rows(csv_file)
-    rows[0] = name_row + rows[0]
-    return write_rows(csv_file, rows)
+    return transform_csv(csv_file, [partial(prefix_header, name_row=name_row)])
 
 def add_row_numbers(csv_file: str) -> str:
     """
@@ -94,13 +434,7 @@ def add_row_numbers(csv_file: str) -> str:
     Returns:
         str: 수정된 파일의 경로
     """
-    rows = read_csv_and_get_rows(csv_file)
-    rows[0] = ['num'] + rows[0]
-    
-    for i in range(1, len(rows)):
-        rows[i] = [i] + rows[i]
-    
-    return write_rows(csv_file, rows)
+    return transform_csv(csv_file, [number_rows])
 
 def dict_to_csv(output_csv: str, data_dict: Dict, key_header: str, value_header: str, 
                 input_csv: Optional[str] = None) -> None:
@@ -144,15 +478,8 @@ def search_and_replace_content(csv_file: str, search_column: str, search_value:
         search_value (str): 검색할 값
         replace_value (str): 대체할 값
     """
-    rows = read_csv_and_get_rows(csv_file)
-    header = rows[0]
-    search_index = header.index(search_column)
-    
-    for row in rows[1:]:
-        if row[search_index] == search_value:
-            row[search_index] = replace_value
-    
-    write_rows(csv_file, rows)
+    transform_csv(csv_file, [partial(replace_in_column, search_column=search_column,
+                                     search_value=search_value, replace_value=replace_value)])
 
 def convert_text_to_csv(text_file: str, csv_file: Optional[str] = None) -> str:
     """
@@ -168,31 +495,35 @@ def convert_text_to_csv(text_file: str, csv_file: Optional[str] = None) -> str:
     if not csv_file:
         csv_file = os.path.splitext(text_file)[0] + '.csv'
 
-    with open(text_file, 'r', encoding='utf-8') as file:
-        lines = file.readlines()
-
-    with open(csv_file, 'w', newline='', encoding='utf-8-sig') as file:
-        csv_writer = csv.writer(file)
-        for line in lines:
+    # 한 줄씩 읽어 바로 씁니다.
+    with open(text_file, 'r', encoding='utf-8') as file, \
+            atomic_write(csv_file, encoding='utf-8-sig', newline='') as output:
+        csv_writer = csv.writer(output)
+        for line in file:
             line = line.replace('\n','').replace('\n','')
             cells = line.strip().split('\t')
             if cells[0]:
                 csv_writer.writerow(cells)
+    forget_header(csv_file)
     return csv_file
 
-def convert_csv_to_text(csv_file: str) -> str:
+def convert_csv_to_text(csv_file: str, chunksize: int = 100000) -> str:
     """
     CSV 파일을 텍스트 파일로 변환합니다.
     
     Args:
         csv_file (str): 변환할 CSV 파일의 경로
+        chunksize (int): 한 번에 읽을 행 수
         
     Returns:
         str: 저장된 텍스트 파일의 경로
     """
     txt_file = os.path.splitext(csv_file)[0] + '.txt'
-    df = pd.read_csv(csv_file)
-    df.to_csv(txt_file, sep='\t', index=False)
+    # chunksize 단위로 읽고 이어서 씁니다. 타입을 덩어리마다 추론하면 같은 열이 덩어리마다
+    # 다르게 쓰이므로(7.0과 9) 모든 값을 CSV에 적힌 문자열 그대로 옮깁니다.
+    with atomic_write(txt_file, newline='') as file:
+        for i, chunk in enumerate(pd.read_csv(csv_file, chunksize=chunksize, dtype=str, keep_default_na=False)):
+            chunk.to_csv(file, sep='\t', index=False, header=(i == 0))
     return txt_file
 
 def remove_empty_rows(csv_file: str) -> str:
@@ -205,20 +536,25 @@ def remove_empty_rows(csv_file: str) -> str:
     Returns:
         str: 수정된 파일의 경로
     """
-    rows = read_csv_and_get_rows(csv_file)
-    non_empty_rows = [row for row in rows if any(field.strip() for field in row)]
-    return write_rows(csv_file, non_empty_rows)
+    return transform_csv(csv_file, [drop_empty_rows])
 
-def csv_to_list(csv_file: str) -> List[Dict]:
+class _Uncacheable(Exception):
+    """열 이름이 중복되거나 헤더보다 긴 행이 있어 표로 캐시할 수 없는 CSV"""
+
+def csv_to_list(csv_file: str, cache: bool = False) -> List[Dict]:
     """
     CSV 파일을 리스트로 변환합니다.
     
     Args:
         csv_file (str): CSV 파일의 경로
+        cache (bool): Feather 캐시를 사용할지 여부 (read_csv_cached 참고)
         
     Returns:
         List[Dict]: 변환된 리스트
     """
+    table = _cached_text_table(csv_file) if cache else None
+    if table is not None:
+        return table.to_pylist()
     result_json_data = []
     with open(csv_file, 'r', encoding='utf-8-sig') as file:
         csv_reader = csv.DictReader(file)
@@ -226,7 +562,7 @@ def csv_to_list(csv_file: str) -> List[Dict]:
             result_json_data.append(row)
     return result_json_data
 
-def csv_to_dict(csv_file: str, key_column: str, value_column: str) -> Dict:
+def csv_to_dict(csv_file: str, key_column: str, value_column: str, cache: bool = False) -> Dict:
     """
     CSV 파일을 딕셔너리로 변환합니다.
     
@@ -234,11 +570,18 @@ def csv_to_dict(csv_file: str, key_column: str, value_column: str) -> Dict:
         csv_file (str): CSV 파일의 경로
         key_column (str): 키로 사용할 열의 이름
         value_column (str): 값으로 사용할 열의 이름
+        cache (bool): Feather 캐시를 사용할지 여부 (read_csv_cached 참고)
         
     Returns:
         Dict: 변환된 딕셔너리
     """
     result_dict = {}
+    table = _cached_text_table(csv_file) if cache else None
+    if table is not None:
+        for key, value in zip(table.column(key_column).to_pylist(), table.column(value_column).to_pylist()):
+            if key not in result_dict:
+                result_dict[key] = value
+        return result_dict
     with open(csv_file, 'r', encoding='utf-8-sig') as file:
         csv_reader = csv.DictReader(file)
         for row in csv_reader:
@@ -248,6 +591,103 @@ def csv_to_dict(csv_file: str, key_column: str, value_column: str) -> Dict:
                 result_dict[key] = value
     return result_dict
 
+def csv_cache_path(csv_file: str, text: bool = False) -> str:
+    """
+    CSV 옆에 두는 Feather 캐시 파일 경로
+    text가 True면 모든 값을 문자열 그대로 담은 캐시(csv_to_list/csv_to_dict용)입니다.
+    """
+    return csv_file + ('.text.feather' if text else '.feather')
+
+def _source_key(csv_file: str, encoding: str) -> Dict[bytes, bytes]:
+    stat = os.stat(csv_file)
+    return {b'source_mtime_ns': str(stat.st_mtime_ns).encode(), b'source_size': str(stat.st_size).encode(),
+            b'source_encoding': encoding.encode()}
+
+def _load_feather(cache_file: str, source_key: Dict[bytes, bytes]):
+    # 원본의 수정 시각/크기/인코딩이 같을 때만 캐시를 메모리 맵으로 읽습니다. 아니면 None
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        table = feather.read_table(cache_file, memory_map=True)
+    except (OSError, pa.ArrowException):
+        return None
+    metadata = table.schema.metadata or {}
+    return table if all(metadata.get(key) == value for key, value in source_key.items()) else None
+
+def _store_feather(cache_file: str, table, source_key: Dict[bytes, bytes]) -> None:
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **source_key})
+    with atomic_write(cache_file, mode='wb') as file:
+        feather.write_feather(table, file)
+
+def _read_text_table(csv_file: str, encoding: str):
+    # csv.DictReader와 같은 값: 문자열 그대로, 짧은 행의 빈 칸은 None, 빈 줄은 건너뜀
+    rows = iter_csv_rows(csv_file, encoding)
+    header = next(rows, [])
+    if len(set(header)) != len(header):
+        raise _Uncacheable(csv_file)
+    columns = [[] for _ in header]
+    for row in rows:
+        if not row:
+            continue
+        if len(row) > len(header):
+            raise _Uncacheable(csv_file)
+        for i, column in enumerate(columns):
+            column.append(row[i] if i < len(row) else None)
+    return pa.table([pa.array(column, pa.string()) for column in columns], names=header)
+
+def _cached_text_table(csv_file: str, encoding: str = 'utf-8-sig'):
+    # csv_to_list/csv_to_dict용 문자열 캐시. pyarrow가 없거나 표로 만들 수 없는 CSV면 None
+    if feather is None:
+        return None
+    cache_file = csv_cache_path(csv_file, text=True)
+    source_key = _source_key(csv_file, encoding)
+    table = _load_feather(cache_file, source_key)
+    if table is None:
+        try:
+            table = _read_text_table(csv_file, encoding)
+        except _Uncacheable:
+            return None
+        try:
+            _store_feather(cache_file, table, source_key)
+        except OSError:
+            pass
+    return table
+
+def read_csv_cached(csv_file: str, cache: bool = True, encoding: str = 'utf-8-sig') -> pd.DataFrame:
+    """
+    pd.read_csv로 CSV를 읽습니다. cache가 True이고 pyarrow가 있으면,
+    원본의 수정 시각/크기가 같은 Feather 캐시를 메모리 맵으로 읽고, 없거나 오래되었으면 CSV를 읽어 캐시를 만듭니다.
+
+    Args:
+        csv_file (str): CSV 파일의 경로
+        cache (bool): 캐시를 사용할지 여부
+        encoding (str): 파일 인코딩
+
+    Returns:
+        pd.DataFrame: 읽은 데이터
+    """
+    if not cache or feather is None:
+        return pd.read_csv(csv_file, encoding=encoding)
+    cache_file = csv_cache_path(csv_file)
+    source_key = _source_key(csv_file, encoding)
+    table = _load_feather(cache_file, source_key)
+    if table is not None:
+        return table.to_pandas()
+    data = pd.read_csv(csv_file, encoding=encoding)
+    try:
+        _store_feather(cache_file, pa.Table.from_pandas(data, preserve_index=False), source_key)
+    except (OSError, pa.ArrowException, ValueError, TypeError):
+        # 타입이 섞인 열 등 Arrow로 바꿀 수 없는 데이터는 캐시하지 않습니다.
+        pass
+    return data
+
+def clear_csv_cache(csv_file: str) -> None:
+    """CSV의 Feather 캐시 파일들을 지웁니다."""
+    for text in (False, True):
+        cache_file = csv_cache_path(csv_file, text)
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+
 if __name__ == "__main__":
     # 테스트용 CSV 파일 생성
     test_data = [
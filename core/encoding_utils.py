@@ -0,0 +1,188 @@
+"""
+파일 인코딩 감지와 변환을 위한 유틸리티 함수들
+
+한국어 레거시 파일은 BOM 없는 cp949(euc-kr)인 경우가 많아서, 파일 앞부분을 보고
+BOM -> UTF-8 -> cp949 순서로 인코딩을 판단하고 그 결과를 파일별로 기억합니다.
+"""
+import os
+import codecs
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from .file_utils import get_files_path_in_folder_via_ext, atomic_write
+
+# 긴 BOM을 먼저 확인해야 합니다 (UTF-32 LE BOM은 UTF-16 LE BOM으로 시작).
+BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# UTF-8도 cp949도 아니면 어떤 바이트든 읽을 수 있는 latin-1로 읽습니다.
+FALLBACK_ENCODING = 'latin-1'
+
+# 인코딩 캐시: 절대 경로 -> ((수정 시각, 크기), 인코딩)
+_ENCODING_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+def _decodes(data: bytes, encoding: str, final: bool) -> bool:
+    # final이 False면 잘린 마지막 글자는 오류로 보지 않습니다.
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(data, final)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+def sniff_encoding(data: bytes, final: bool = True) -> str:
+    """
+    바이트에서 인코딩을 판단합니다. BOM -> UTF-8 -> cp949 순서로 확인합니다.
+
+    Args:
+        data (bytes): 파일 내용 또는 앞부분
+        final (bool): data가 파일 끝까지인지 여부. False면 끝에서 잘린 글자를 허용합니다.
+
+    Returns:
+        str: 인코딩 이름 ('utf-8-sig', 'utf-16', 'utf-32', 'utf-8', 'cp949', 'latin-1')
+    """
+    for bom, encoding in BOMS:
+        if data.startswith(bom):
+            return encoding
+    if data.isascii() or _decodes(data, 'utf-8', final):
+        return 'utf-8'
+    if _decodes(data, 'cp949', final):
+        return 'cp949'
+    return FALLBACK_ENCODING
+
+def _file_key(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+def detect_encoding(file_path: str, sample_size: int = 64 * 1024) -> str:
+    """
+    파일의 인코딩을 앞부분으로 판단합니다. 결과는 파일의 수정 시각/크기와 함께 기억해 두고,
+    파일이 바뀌지 않았으면 다시 읽지 않습니다.
+    앞부분이 모두 ASCII면 sample_size만큼 한 번만 더 읽어 보고, 그래도 ASCII면 'utf-8'로 봅니다.
+    (큰 ASCII 파일을 끝까지 읽지 않기 위해서이며, 그 뒤에 처음 나오는 cp949 글자는 놓칠 수 있습니다.)
+
+    Args:
+        file_path (str): 파일 경로
+        sample_size (int): 읽을 바이트 수 (앞부분이 ASCII면 최대 두 배)
+
+    Returns:
+        str: 인코딩 이름 (sniff_encoding 참고)
+    """
+    path = os.path.abspath(file_path)
+    key = _file_key(path)
+    cached = _ENCODING_CACHE.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    with open(path, 'rb') as file:
+        sample = file.read(sample_size)
+        if sample.isascii():
+            # ASCII는 UTF-8의 일부이므로, 한 번 더 읽어도 ASCII면 끝까지 읽지 않고 utf-8로 봅니다.
+            # 멀티바이트 글자가 두 조각에 걸쳐도 판단할 수 있도록 끝의 몇 바이트를 남깁니다.
+            sample = sample[-3:] + file.read(sample_size)
+        encoding = sniff_encoding(sample, final=not file.read(1))
+    _ENCODING_CACHE[path] = (key, encoding)
+    return encoding
+
+def forget_encoding(file_path: str) -> None:
+    """기억해 둔 파일 인코딩을 지웁니다."""
+    _ENCODING_CACHE.pop(os.path.abspath(file_path), None)
+
+def open_text(file_path: str, encoding: Optional[str] = None, newline: Optional[str] = '',
+              errors: str = 'strict', buffer_size: int = 1024 * 1024):
+    """
+    인코딩을 감지해서 텍스트 읽기 모드로 엽니다. 큰 버퍼로 한 번에 여러 블록씩 디코딩합니다.
+
+    Args:
+        file_path (str): 파일 경로
+        encoding (str, optional): 인코딩. None이면 detect_encoding으로 판단
+        newline (str, optional): newline 옵션 (csv 모듈에는 '')
+        errors (str): 디코딩 오류 처리 방식 ('strict', 'replace' 등)
+        buffer_size (int): 읽기 버퍼 크기(바이트)
+
+    Returns:
+        파일 객체
+    """
+    encoding = encoding or detect_encoding(file_path)
+    return open(file_path, 'r', encoding=encoding, newline=newline, errors=errors, buffering=buffer_size)
+
+def read_text(file_path: str, encoding: Optional[str] = None, errors: str = 'strict') -> str:
+    """
+    인코딩을 감지해서 파일 전체를 읽습니다.
+
+    Args:
+        file_path (str): 파일 경로
+        encoding (str, optional): 인코딩. None이면 detect_encoding으로 판단
+        errors (str): 디코딩 오류 처리 방식
+
+    Returns:
+        str: 파일 내용
+    """
+    with open(file_path, 'rb') as file:
+        data = file.read()
+    return data.decode(encoding or sniff_encoding(data), errors)
+
+def convert_encoding(file_path: str, new_encoding: str = 'utf-8-sig', old_encoding: Optional[str] = None,
+                     output_path: Optional[str] = None) -> Tuple[str, bool]:
+    """
+    파일의 인코딩을 바꿉니다. 파일은 한 번만 읽고, 감지도 읽은 내용으로 합니다.
+    줄바꿈은 바꾸지 않으며, 임시 파일을 거쳐 한 번에 교체합니다.
+
+    Args:
+        file_path (str): 파일 경로
+        new_encoding (str): 바꿀 인코딩
+        old_encoding (str, optional): 현재 인코딩. None이면 내용으로 판단
+        output_path (str, optional): 저장할 경로. None이면 원본을 덮어씀
+
+    Returns:
+        Tuple[str, bool]: (원래 인코딩, 파일을 새로 썼는지 여부)
+
+    Raises:
+        UnicodeError: old_encoding 없이 인코딩을 판단하지 못했을 때 (latin-1로 추측한 파일은 바꾸지 않음)
+    """
+    with open(file_path, 'rb') as file:
+        data = file.read()
+    if not old_encoding:
+        old_encoding = sniff_encoding(data)
+        if old_encoding == FALLBACK_ENCODING:
+            # latin-1은 어떤 바이트든 읽히므로 감지 결과가 아니라 추측입니다. 바꾸면 글자가 깨집니다.
+            raise UnicodeError(f'인코딩을 판단할 수 없습니다 (UTF-8도 cp949도 아님): {file_path}')
+    output_path = output_path or file_path
+    if codecs.lookup(old_encoding).name == codecs.lookup(new_encoding).name and output_path == file_path:
+        return old_encoding, False
+    converted = data.decode(old_encoding).encode(new_encoding)
+    with atomic_write(output_path, mode='wb') as file:
+        file.write(converted)
+    forget_encoding(output_path)
+    return old_encoding, True
+
+def _convert_file(file_path: str, new_encoding: str) -> Tuple[str, str]:
+    # 프로세스 풀 작업 단위: 오류는 결과로 돌려줍니다.
+    try:
+        old_encoding, changed = convert_encoding(file_path, new_encoding)
+    except (OSError, UnicodeError, LookupError) as error:
+        return file_path, f'error: {error}'
+    return file_path, f'{old_encoding} -> {new_encoding}' if changed else old_encoding
+
+def convert_encoding_in_folder(folder_path: str, new_encoding: str = 'utf-8-sig', extension: str = 'csv',
+                               recursive: bool = False, max_workers: Optional[int] = None) -> List[Tuple[str, str]]:
+    """
+    폴더의 파일들을 여러 프로세스로 new_encoding으로 바꿉니다. 이미 new_encoding인 파일은 그대로 둡니다.
+
+    Args:
+        folder_path (str): 폴더 경로
+        new_encoding (str): 바꿀 인코딩
+        extension (str): 대상 파일 확장자
+        recursive (bool): 하위 폴더까지 탐색할지 여부
+        max_workers (int, optional): 프로세스 수. None이면 CPU 수
+
+    Returns:
+        List[Tuple[str, str]]: 파일별 (경로, 상태). 상태는 바꾼 파일이면 '원래 인코딩 -> new_encoding',
+            그대로 둔 파일이면 원래 인코딩, 인코딩을 판단하지 못했거나 실패하면 'error: ...' (파일은 그대로)
+    """
+    file_paths = get_files_path_in_folder_via_ext(folder_path, extension, recursive)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_convert_file, file_path, new_encoding) for file_path in file_paths]
+        return [future.result() for future in futures]
@@ -4,6 +4,7 @@
 import os
 import shutil
 import subprocess
+from contextlib import contextmanager
 from typing import Union, Optional, List, Dict, Any
 
 # junLib의 함수들을 직접 사용
@@ -123,6 +124,49 @@ def rename_folder(old_folder_path: str, new_name: str) -> None:
     except Exception as e:
         print(f"Error renaming folder: {e}")
 
+def _create_temp_file(folder_path: str, prefix: str, suffix: str):
+    # mkstemp는 0600으로 만들기 때문에, open()처럼 0666에 umask가 적용된 권한으로 직접 만듭니다.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        temp_path = os.path.join(folder_path, prefix + os.urandom(4).hex() + suffix)
+        try:
+            return os.open(temp_path, flags, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+@contextmanager
+def atomic_write(file_path: str, mode: str = 'w', encoding: Optional[str] = 'utf-8', newline: Optional[str] = None):
+    """
+    같은 폴더의 임시 파일에 쓴 뒤 os.replace로 한 번에 교체합니다.
+    쓰는 도중 오류가 나면 임시 파일만 지워지고 원래 파일은 그대로 남습니다.
+
+    Args:
+        file_path (str): 저장할 파일 경로
+        mode (str): 'w' 또는 'wb'
+        encoding (str, optional): 텍스트 모드 인코딩
+        newline (str, optional): 텍스트 모드 newline 옵션
+
+    Yields:
+        파일 객체
+    """
+    folder_path = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = _create_temp_file(folder_path, '.' + os.path.basename(file_path) + '.', '.tmp')
+    try:
+        if 'b' in mode:
+            file = os.fdopen(fd, mode)
+        else:
+            file = os.fdopen(fd, mode, encoding=encoding, newline=newline)
+        with file:
+            yield file
+        # 기존 파일이 있으면 그 권한을 그대로 유지합니다.
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
 def path_exist(file_path: str) -> bool:
     """파일이나 폴더가 존재하는지 확인합니다."""
     return os.path.exists(file_path)
@@ -6,7 +6,9 @@ import sys
 import shutil
 import re
 import subprocess
-from typing import Union, Optional, List, Dict, Any
+# 밑줄 이름으로 불러와서 from junLib import *로 np가 새어 나가지 않게 합니다.
+import numpy as _np
+from typing import Union, Optional, List, Dict, Any, Sequence
 from .file_utils import *
 
 # moviepy 직접 임포트
@@ -914,6 +916,86 @@ def seconds_to_ms(seconds: Union[int, float]) -> str:
     seconds = int(seconds % 60)
     return f"{minutes:02d}:{seconds:02d}"
 
+def _format_rows(fmt: str, *columns: _np.ndarray) -> List[str]:
+    """
+    정수 배열들을 행 단위로 fmt(% 형식)에 넣어 문자열 리스트로 만듭니다.
+    모든 행을 하나의 % 연산으로 처리해서 원소마다 파이썬 포맷팅을 호출하지 않습니다.
+    """
+    count = len(columns[0]) if columns else 0
+    if not count:
+        return []
+    for column in columns:
+        if not _np.isfinite(column).all():
+            # 스칼라 버전(int(nan))처럼 잘못된 값을 거부합니다.
+            raise ValueError('NaN 또는 무한대 값은 시간으로 변환할 수 없습니다.')
+    values = _np.stack([column.astype(_np.int64) for column in columns], axis=1).ravel().tolist()
+    return ('\0'.join([fmt] * count) % tuple(values)).split('\0')
+
+def format_time_array(total_seconds: Union[Sequence[float], _np.ndarray]) -> List[str]:
+    """
+    초 배열을 HH:MM:SS,mmm 형식의 문자열 리스트로 한 번에 변환합니다. (format_time의 배열 버전)
+
+    Args:
+        total_seconds (Union[Sequence[float], _np.ndarray]): 변환할 초 배열 또는 리스트
+
+    Returns:
+        List[str]: HH:MM:SS,mmm 형식의 문자열 리스트
+    """
+    total_seconds = _np.asarray(total_seconds, dtype=_np.float64).ravel()
+    seconds = (total_seconds % 3600) % 60
+    milliseconds = _np.trunc((seconds - _np.trunc(seconds)) * 1000)
+    return _format_rows('%02d:%02d:%02d,%03d', total_seconds // 3600, (total_seconds % 3600) // 60,
+                        seconds, milliseconds)
+
+def seconds_to_hms_array(seconds: Union[Sequence[float], _np.ndarray]) -> List[str]:
+    """
+    초 배열을 HH:MM:SS 형식의 문자열 리스트로 한 번에 변환합니다. (seconds_to_hms의 배열 버전)
+
+    Args:
+        seconds (Union[Sequence[float], _np.ndarray]): 변환할 초 배열 또는 리스트
+
+    Returns:
+        List[str]: HH:MM:SS 형식의 문자열 리스트
+    """
+    seconds = _np.asarray(seconds, dtype=_np.float64).ravel()
+    return _format_rows('%02d:%02d:%02d', seconds // 3600, (seconds % 3600) // 60, seconds % 60)
+
+def seconds_to_ms_array(seconds: Union[Sequence[float], _np.ndarray]) -> List[str]:
+    """
+    초 배열을 MM:SS 형식의 문자열 리스트로 한 번에 변환합니다. (seconds_to_ms의 배열 버전)
+
+    Args:
+        seconds (Union[Sequence[float], _np.ndarray]): 변환할 초 배열 또는 리스트
+
+    Returns:
+        List[str]: MM:SS 형식의 문자열 리스트
+    """
+    seconds = _np.asarray(seconds, dtype=_np.float64).ravel()
+    return _format_rows('%02d:%02d', seconds // 60, seconds % 60)
+
+def hms_to_seconds_array(values: Union[Sequence[str], _np.ndarray]) -> _np.ndarray:
+    """
+    HH:MM:SS(.mmm 또는 ,mmm), MM:SS, SS 형식의 문자열 배열을 초(float) 배열로 한 번에 변환합니다.
+
+    Args:
+        values (Union[Sequence[str], _np.ndarray]): 변환할 시간 문자열 배열 또는 리스트
+
+    Returns:
+        _np.ndarray: 초 단위 float 배열
+
+    Raises:
+        ValueError: 숫자로 변환할 수 없는 값이 있을 때
+    """
+    values = _np.asarray(values, dtype=str).ravel()
+    if values.size == 0:
+        return _np.zeros(0, dtype=_np.float64)
+    values = _np.char.replace(_np.char.strip(values), ',', '.')
+    rest, _, seconds = _np.char.rpartition(values, ':').T
+    hours, _, minutes = _np.char.rpartition(rest, ':').T
+    minutes = _np.where(minutes == '', '0', minutes).astype(_np.float64)
+    hours = _np.where(hours == '', '0', hours).astype(_np.float64)
+    return hours * 3600 + minutes * 60 + seconds.astype(_np.float64)
+
 class path_func():
     def __init__(self, file_path) -> None:
         self.file_path = file_path
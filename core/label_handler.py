@@ -0,0 +1,405 @@
+"""
+레이블 트랙과 구간 인덱스를 위한 핸들러 클래스
+"""
+import os
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .label_utils import Label, ClipWindow, read_labels, write_labels, parse_clip_window
+from .file_utils import get_files_path_in_folder_via_ext
+
+class LabelTrack:
+    """레이블 파일 하나를 메모리에 올려 다루기 위한 핸들러 클래스"""
+
+    def __init__(self, labels: Optional[Iterable[Label]] = None, file_path: Optional[str] = None):
+        """
+        LabelTrack 초기화
+
+        Args:
+            labels (Iterable[Label], optional): 레이블들
+            file_path (str, optional): 레이블 파일 경로
+        """
+        self.file_path = file_path
+        self.labels: List[Label] = list(labels) if labels is not None else []
+        self._index = None
+
+    @classmethod
+    def from_file(cls, file_path: str, encoding: str = 'utf-8') -> 'LabelTrack':
+        """
+        레이블 파일을 읽어 LabelTrack을 생성합니다.
+
+        Args:
+            file_path (str): 레이블 파일 경로
+            encoding (str): 파일 인코딩
+
+        Returns:
+            LabelTrack: 생성된 트랙
+        """
+        return cls(read_labels(file_path, encoding), file_path)
+
+    def save(self, file_path: Optional[str] = None, precision: Optional[int] = 6) -> str:
+        """
+        레이블을 파일로 저장합니다.
+
+        Args:
+            file_path (str, optional): 저장할 경로. None이면 현재 파일 경로 사용
+            precision (int, optional): 소수점 자릿수
+
+        Returns:
+            str: 저장된 파일 경로
+        """
+        return write_labels(file_path or self.file_path, self.labels, precision)
+
+    def append(self, label: Label) -> 'LabelTrack':
+        """
+        레이블을 추가합니다.
+
+        Args:
+            label (Label): 추가할 레이블
+
+        Returns:
+            LabelTrack: 체이닝을 위한 self 반환
+        """
+        self.labels.append(label)
+        self._index = None
+        return self
+
+    @property
+    def index(self) -> 'LabelIndex':
+        """트랙의 구간 인덱스 (처음 접근할 때 생성)"""
+        if self._index is None:
+            self._index = LabelIndex(self.labels)
+        return self._index
+
+    def __iter__(self) -> Iterator[Label]:
+        return iter(self.labels)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __getitem__(self, i):
+        return self.labels[i]
+
+class LabelIndex:
+    """
+    레이블 구간 인덱스
+
+    시작 시간으로 정렬한 배열 위에 구간별 최대 종료 시간 트리를 만들어
+    겹침/포함/최근접 질의를 O(log n + k)에 처리합니다.
+    start, end 속성을 가진 레코드(Label, ClipWindow 등)를 모두 다룰 수 있습니다.
+    """
+
+    def __init__(self, items: Iterable):
+        """
+        LabelIndex 초기화
+
+        Args:
+            items (Iterable): start, end 속성을 가진 레코드들
+        """
+        self.items = sorted(items, key=lambda item: (item.start, item.end))
+        self.starts = [item.start for item in self.items]
+        self.ends = [item.end for item in self.items]
+        self._end_order = sorted(range(len(self.items)), key=lambda i: self.ends[i])
+        self._sorted_ends = [self.ends[i] for i in self._end_order]
+        self._size = len(self.items)
+        self._max_end = [float('-inf')] * (4 * self._size if self._size else 1)
+        if self._size:
+            self._build(1, 0, self._size)
+
+    def _build(self, node: int, lo: int, hi: int) -> float:
+        if hi - lo == 1:
+            self._max_end[node] = self.ends[lo]
+        else:
+            mid = (lo + hi) // 2
+            self._max_end[node] = max(self._build(2 * node, lo, mid), self._build(2 * node + 1, mid, hi))
+        return self._max_end[node]
+
+    def _collect(self, stop: int, threshold: float, strict: bool) -> List[int]:
+        """[0, stop) 구간에서 end가 threshold보다 크거나(strict) 같은 위치들을 찾습니다."""
+        result = []
+        if stop <= 0:
+            return result
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= stop:
+                continue
+            max_end = self._max_end[node]
+            if max_end < threshold or (strict and max_end == threshold):
+                continue
+            if hi - lo == 1:
+                result.append(lo)
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+        return result
+
+    def overlapping(self, start: float, end: float) -> List:
+        """
+        [start, end) 구간과 겹치는 레코드들을 반환합니다.
+
+        Args:
+            start (float): 질의 시작 시간
+            end (float): 질의 종료 시간
+
+        Returns:
+            List: 겹치는 레코드들 (시작 시간 순)
+        """
+        stop = bisect_left(self.starts, end)
+        return [self.items[i] for i in self._collect(stop, start, strict=True)]
+
+    def at(self, time: float) -> List:
+        """
+        특정 시점을 포함하는 레코드들을 반환합니다. (start <= time <= end)
+
+        Args:
+            time (float): 질의 시점(초)
+
+        Returns:
+            List: 해당 시점을 포함하는 레코드들
+        """
+        stop = bisect_right(self.starts, time)
+        return [self.items[i] for i in self._collect(stop, time, strict=False)]
+
+    def within(self, start: float, end: float) -> List:
+        """
+        [start, end] 구간 안에 완전히 들어가는 레코드들을 반환합니다.
+
+        Args:
+            start (float): 구간 시작 시간
+            end (float): 구간 종료 시간
+
+        Returns:
+            List: 구간 안의 레코드들
+        """
+        lo = bisect_left(self.starts, start)
+        hi = bisect_right(self.starts, end)
+        return [self.items[i] for i in range(lo, hi) if self.ends[i] <= end]
+
+    def containing(self, start: float, end: float) -> List:
+        """
+        [start, end] 구간을 완전히 덮는 레코드들을 반환합니다.
+
+        Args:
+            start (float): 구간 시작 시간
+            end (float): 구간 종료 시간
+
+        Returns:
+            List: 구간을 덮는 레코드들
+        """
+        stop = bisect_right(self.starts, start)
+        return [self.items[i] for i in self._collect(stop, end, strict=False)]
+
+    def previous(self, time: float):
+        """
+        time 이전에(또는 time에) 끝나는 레코드 중 가장 늦게 끝나는 레코드를 반환합니다.
+
+        Args:
+            time (float): 기준 시점(초)
+
+        Returns:
+            레코드, 없으면 None
+        """
+        position = bisect_right(self._sorted_ends, time) - 1
+        return self.items[self._end_order[position]] if position >= 0 else None
+
+    def next(self, time: float):
+        """
+        time 이후에 시작하는 첫 레코드를 반환합니다.
+
+        Args:
+            time (float): 기준 시점(초)
+
+        Returns:
+            레코드, 없으면 None
+        """
+        position = bisect_left(self.starts, time)
+        return self.items[position] if position < self._size else None
+
+    def nearest(self, time: float) -> List:
+        """
+        time에 가장 가까운 레코드들을 반환합니다.
+        time을 포함하는 레코드가 있으면 그 레코드들을, 없으면 앞/뒤 중 가까운 레코드를 반환합니다.
+
+        Args:
+            time (float): 기준 시점(초)
+
+        Returns:
+            List: 가장 가까운 레코드들
+        """
+        covering = self.at(time)
+        if covering:
+            return covering
+        before = self.previous(time)
+        after = self.next(time)
+        if before is None:
+            return [after] if after is not None else []
+        if after is None:
+            return [before]
+        before_gap = time - before.end
+        after_gap = after.start - time
+        if before_gap == after_gap:
+            return [before, after]
+        return [before] if before_gap < after_gap else [after]
+
+    def overlaps(self) -> List[Tuple]:
+        """
+        서로 겹치는 레코드 쌍을 모두 반환합니다.
+
+        Returns:
+            List[Tuple]: (앞 레코드, 뒤 레코드) 쌍의 리스트
+        """
+        pairs = []
+        for i in range(self._size):
+            stop = bisect_left(self.starts, self.ends[i], i + 1)
+            for j in range(i + 1, stop):
+                if self.ends[j] > self.starts[i]:
+                    pairs.append((self.items[i], self.items[j]))
+        return pairs
+
+    def gaps(self, min_gap: float = 0.0) -> List[Tuple[float, float]]:
+        """
+        레코드 사이의 빈 구간 중 min_gap보다 긴 구간을 반환합니다.
+
+        Args:
+            min_gap (float): 최소 간격(초)
+
+        Returns:
+            List[Tuple[float, float]]: (빈 구간 시작, 빈 구간 끝)의 리스트
+        """
+        result = []
+        if not self._size:
+            return result
+        covered_until = self.ends[0]
+        for i in range(1, self._size):
+            if self.starts[i] - covered_until > min_gap:
+                result.append((covered_until, self.starts[i]))
+            covered_until = max(covered_until, self.ends[i])
+        return result
+
+    def __len__(self) -> int:
+        return self._size
+
+class LabelFolderIndex:
+    """
+    폴더 안의 레이블 파일 전체에 대한 원본 소스 기준 구간 인덱스
+
+    파일 이름의 start_end 구간(ClipWindow)을 소스별로 인덱싱해서
+    "E20200921_00002 원본의 143.5초를 덮는 클립" 같은 질의를 바로 처리합니다.
+    """
+
+    def __init__(self, clips: Iterable[ClipWindow] = (), load_labels: bool = False, encoding: str = 'utf-8'):
+        """
+        LabelFolderIndex 초기화
+
+        Args:
+            clips (Iterable[ClipWindow]): 인덱싱할 클립 구간들
+            load_labels (bool): 레이블 파일 내용까지 원본 기준 시간으로 인덱싱할지 여부
+            encoding (str): 레이블 파일 인코딩
+        """
+        grouped_clips: Dict[str, List[ClipWindow]] = {}
+        grouped_labels: Dict[str, List[Label]] = {}
+        for clip in clips:
+            grouped_clips.setdefault(clip.source, []).append(clip)
+            if load_labels and clip.path:
+                grouped_labels.setdefault(clip.source, []).extend(
+                    label._replace(start=label.start + clip.start, end=label.end + clip.start)
+                    for label in read_labels(clip.path, encoding)
+                )
+        self.clip_indexes = {source: LabelIndex(items) for source, items in grouped_clips.items()}
+        self.label_indexes = {source: LabelIndex(items) for source, items in grouped_labels.items()}
+
+    @classmethod
+    def from_folder(cls, folder_path: str, extension: str = 'txt', recursive: bool = True,
+                    load_labels: bool = False, encoding: str = 'utf-8') -> 'LabelFolderIndex':
+        """
+        폴더의 레이블 파일들로 인덱스를 생성합니다.
+        이름에 start_end 구간이 없는 파일은 건너뜁니다.
+
+        Args:
+            folder_path (str): 레이블 파일이 있는 폴더 경로
+            extension (str): 레이블 파일 확장자
+            recursive (bool): 하위 폴더까지 탐색할지 여부
+            load_labels (bool): 레이블 내용까지 인덱싱할지 여부
+            encoding (str): 레이블 파일 인코딩
+
+        Returns:
+            LabelFolderIndex: 생성된 인덱스
+        """
+        files = get_files_path_in_folder_via_ext(folder_path, extension, recursive)
+        clips = (parse_clip_window(file_path) for file_path in files)
+        return cls((clip for clip in clips if clip is not None), load_labels, encoding)
+
+    @property
+    def sources(self) -> List[str]:
+        """인덱싱된 원본 소스 아이디 목록"""
+        return sorted(self.clip_indexes)
+
+    def clips_at(self, source: str, time: float) -> List[ClipWindow]:
+        """
+        원본 소스의 특정 시점을 덮는 클립들을 반환합니다.
+
+        Args:
+            source (str): 원본 소스 아이디
+            time (float): 원본 기준 시점(초)
+
+        Returns:
+            List[ClipWindow]: 해당 시점을 덮는 클립들
+        """
+        index = self.clip_indexes.get(source)
+        return index.at(time) if index else []
+
+    def clips_overlapping(self, source: str, start: float, end: float) -> List[ClipWindow]:
+        """
+        원본 소스의 [start, end) 구간과 겹치는 클립들을 반환합니다.
+
+        Args:
+            source (str): 원본 소스 아이디
+            start (float): 원본 기준 시작 시간
+            end (float): 원본 기준 종료 시간
+
+        Returns:
+            List[ClipWindow]: 겹치는 클립들
+        """
+        index = self.clip_indexes.get(source)
+        return index.overlapping(start, end) if index else []
+
+    def labels_at(self, source: str, time: float) -> List[Label]:
+        """
+        원본 소스의 특정 시점을 포함하는 레이블들을 원본 기준 시간으로 반환합니다.
+        load_labels=True로 생성한 경우에만 결과가 있습니다.
+
+        Args:
+            source (str): 원본 소스 아이디
+            time (float): 원본 기준 시점(초)
+
+        Returns:
+            List[Label]: 해당 시점을 포함하는 레이블들 (source에 파일 경로 포함)
+        """
+        index = self.label_indexes.get(source)
+        return index.at(time) if index else []
+
+    def overlapping_clips(self) -> Dict[str, List[Tuple[ClipWindow, ClipWindow]]]:
+        """
+        소스별로 서로 겹치는 클립 쌍을 반환합니다.
+
+        Returns:
+            Dict[str, List[Tuple[ClipWindow, ClipWindow]]]: 소스 아이디별 겹치는 클립 쌍
+        """
+        result = {}
+        for source, index in self.clip_indexes.items():
+            pairs = index.overlaps()
+            if pairs:
+                result[source] = pairs
+        return result
+
+if __name__ == "__main__":
+    track = LabelTrack([
+        Label(0.0, 2.5, '안녕하세요'),
+        Label(2.0, 4.0, '겹치는 레이블'),
+        Label(10.0, 12.0, '떨어진 레이블'),
+    ])
+    print("1.5초를 포함하는 레이블:", track.index.at(1.5))
+    print("겹치는 레이블 쌍:", track.index.overlaps())
+    print("3초 이상 빈 구간:", track.index.gaps(3.0))
+    print("7초와 가장 가까운 레이블:", track.index.nearest(7.0))
@@ -0,0 +1,482 @@
+"""
+레이블(Audacity 레이블 txt) 파일 처리를 위한 유틸리티 함수들
+"""
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from .file_utils import get_files_path_in_folder_via_ext, rename, atomic_write
+
+class Label(NamedTuple):
+    """
+    레이블 한 줄을 나타내는 레코드
+
+    Attributes:
+        start (float): 시작 시간(초)
+        end (float): 종료 시간(초)
+        text (str): 레이블 텍스트
+        source (str): 레이블을 읽어온 파일 경로 (없으면 빈 문자열)
+    """
+    start: float
+    end: float
+    text: str = ''
+    source: str = ''
+
+class ClipWindow(NamedTuple):
+    """
+    파일 이름에 포함된 start_end 구간을 나타내는 레코드
+
+    예) E20200921_00002_048_01-143.520_150.200-neutral.mp3
+        -> source='E20200921_00002', start=143.52, end=150.2
+
+    Attributes:
+        source (str): 원본 소스 아이디
+        start (float): 원본 기준 시작 시간(초)
+        end (float): 원본 기준 종료 시간(초)
+        path (str): 클립(레이블) 파일 경로
+    """
+    source: str
+    start: float
+    end: float
+    path: str = ''
+
+# 문장이 끝난 것으로 보고 마침표를 붙일 한국어 어미들
+SENTENCE_ENDINGS = (
+    '세요', '니다', '시다', '어요', '에요', '죠', '거야', '잖아', '데요', '왔어',
+    '이야', '을까', '텐데', '싶다', '이구나', '구만', '없어', '아니야', '예요', '워요',
+    '어떤가요', '해요', '였다', '하고요', '었어', '봐요', '잖아요', '였구나', '더라', '있어',
+    '그랬어', '거든요', '거든', '니요', '겠다', '했어', '않나', '않다', '았어', '해줘',
+    '찮다', '잖니', '많아', '있나', '인가', '뺄까', '빼자', '빼요', '했네', '게요',
+    '아요', '져요', '니까', '갈게', '어디가',
+)
+# 문장 끝 문장부호
+SENTENCE_TERMINATORS = ('.', '?', '!')
+
+# 파일 이름의 '-시작_종료' 구간 (예: -143.520_150.200)
+CLIP_WINDOW_PATTERN = re.compile(r'-(\d+(?:\.\d+)?)_(\d+(?:\.\d+)?)(?=-|$)')
+# 원본 소스 아이디 (예: E20200921_00002)
+CLIP_SOURCE_PATTERN = re.compile(r'^([^_\-]+_[^_\-]+)')
+
+def parse_label_line(line: str, source: str = '') -> Optional[Label]:
+    """
+    레이블 한 줄을 Label로 변환합니다.
+
+    Args:
+        line (str): "시작\\t종료\\t텍스트" 형식의 문자열
+        source (str): 레이블을 읽어온 파일 경로
+
+    Returns:
+        Optional[Label]: 변환된 Label, 빈 줄이나 주파수 정보 줄('\\'로 시작)이면 None
+
+    Raises:
+        ValueError: 시간 값을 숫자로 변환할 수 없을 때
+    """
+    line = line.rstrip('\r\n')
+    if not line.strip() or line.startswith('\\'):
+        return None
+    parts = line.split('\t', 2)
+    if len(parts) < 2:
+        raise ValueError(f"레이블 형식이 올바르지 않습니다: {line}")
+    text = parts[2] if len(parts) > 2 else ''
+    return Label(float(parts[0]), float(parts[1]), text, source)
+
+def iter_labels(label_file: str, encoding: str = 'utf-8') -> Iterator[Label]:
+    """
+    레이블 파일을 한 줄씩 읽어 Label을 yield 합니다.
+
+    Args:
+        label_file (str): 레이블 파일 경로
+        encoding (str): 파일 인코딩
+
+    Yields:
+        Label: 파일의 각 레이블
+    """
+    with open(label_file, 'r', encoding=encoding) as file:
+        for line in file:
+            label = parse_label_line(line, label_file)
+            if label is not None:
+                yield label
+
+def read_labels(label_file: str, encoding: str = 'utf-8') -> List[Label]:
+    """
+    레이블 파일을 읽어 Label 리스트를 반환합니다.
+
+    Args:
+        label_file (str): 레이블 파일 경로
+        encoding (str): 파일 인코딩
+
+    Returns:
+        List[Label]: 파일의 레이블 리스트
+    """
+    return list(iter_labels(label_file, encoding))
+
+def format_label_line(label: Label, precision: Optional[int] = 6) -> str:
+    """
+    Label을 "시작\\t종료\\t텍스트" 형식의 문자열로 변환합니다.
+
+    Args:
+        label (Label): 변환할 레이블
+        precision (int, optional): 소수점 자릿수. None이면 그대로 출력
+
+    Returns:
+        str: 레이블 한 줄
+    """
+    if precision is None:
+        return f"{label.start}\t{label.end}\t{label.text}"
+    return f"{label.start:.{precision}f}\t{label.end:.{precision}f}\t{label.text}"
+
+def write_labels(label_file: str, labels: Iterable[Label], precision: Optional[int] = 6, atomic: bool = False) -> str:
+    """
+    Label들을 레이블 파일로 저장합니다.
+
+    Args:
+        label_file (str): 저장할 파일 경로
+        labels (Iterable[Label]): 저장할 레이블들
+        precision (int, optional): 소수점 자릿수
+        atomic (bool): 임시 파일에 쓴 뒤 한 번에 교체할지 여부
+
+    Returns:
+        str: 저장된 파일 경로
+    """
+    with (atomic_write(label_file) if atomic else open(label_file, 'w', encoding='utf-8')) as file:
+        for label in labels:
+            file.write(format_label_line(label, precision) + '\n')
+    return label_file
+
+def parse_clip_window(file_path: str) -> Optional[ClipWindow]:
+    """
+    파일 이름에서 원본 소스 아이디와 start_end 구간을 추출합니다.
+
+    Args:
+        file_path (str): 클립 파일 경로 또는 이름
+
+    Returns:
+        Optional[ClipWindow]: 추출된 구간, 이름에 구간이 없으면 None
+    """
+    file_name = os.path.splitext(os.path.basename(file_path))[0]
+    window = CLIP_WINDOW_PATTERN.search(file_name)
+    source = CLIP_SOURCE_PATTERN.match(file_name)
+    if not window or not source:
+        return None
+    return ClipWindow(source.group(1), float(window.group(1)), float(window.group(2)), file_path)
+
+class SentenceMergeStats:
+    """merge_sentences의 병합 통계"""
+
+    def __init__(self, source: str = ''):
+        """
+        SentenceMergeStats 초기화
+
+        Args:
+            source (str): 통계 대상 파일 경로
+        """
+        self.source = source
+        self.input_labels = 0
+        self.output_sentences = 0
+        self.merged_labels = 0
+        self.endings_added = 0
+        self.dropped_tail = 0
+
+    def to_dict(self) -> Dict:
+        """
+        통계를 딕셔너리로 반환합니다.
+
+        Returns:
+            Dict: 항목별 통계
+        """
+        return dict(vars(self))
+
+    def __repr__(self) -> str:
+        return f"SentenceMergeStats({self.to_dict()})"
+
+def compile_endings(endings: Iterable[str]) -> tuple:
+    """
+    어미 목록을 str.endswith에 바로 넘길 수 있는 중복 없는 튜플로 만듭니다.
+
+    Args:
+        endings (Iterable[str]): 어미 목록
+
+    Returns:
+        tuple: 컴파일된 어미 튜플
+    """
+    return tuple(dict.fromkeys(ending for ending in endings if ending))
+
+def merge_sentences(labels: Iterable[Label], endings: Sequence[str] = SENTENCE_ENDINGS,
+                    stats: Optional[SentenceMergeStats] = None, keep_tail: bool = False) -> Iterator[Label]:
+    """
+    레이블들을 문장 단위로 이어 붙여 yield 합니다.
+    어미(endings)로 끝나는 텍스트에는 마침표를 붙이고, 문장부호로 끝나는 레이블에서 문장을 끊습니다.
+
+    Args:
+        labels (Iterable[Label]): 레이블들 (LabelTrack도 가능)
+        endings (Sequence[str]): 문장 끝으로 볼 어미 목록
+        stats (SentenceMergeStats, optional): 병합 통계를 기록할 객체
+        keep_tail (bool): 문장부호 없이 끝난 마지막 문장도 내보낼지 여부
+
+    Yields:
+        Label: 문장 단위 레이블
+    """
+    endings = endings if isinstance(endings, tuple) else compile_endings(endings)
+    stats = stats if stats is not None else SentenceMergeStats()
+    new_start = None
+    new_text = None
+    new_source = ''
+    parts = 0
+    for label in labels:
+        stats.input_labels += 1
+        text = label.text.strip()
+        if text.endswith(endings):
+            text += '.'
+            stats.endings_added += 1
+        if text.endswith(SENTENCE_TERMINATORS):
+            if new_text:
+                new_text += ' ' + text
+                parts += 1
+            else:
+                new_text = text
+                new_start = label.start
+                new_source = label.source
+                parts = 1
+            stats.output_sentences += 1
+            stats.merged_labels += parts - 1
+            yield Label(new_start, label.end, new_text, new_source)
+            new_start = None
+            new_text = None
+            parts = 0
+        elif new_text:
+            new_text += ' ' + text
+            parts += 1
+        else:
+            new_start = label.start
+            new_text = text
+            new_source = label.source
+            parts = 1
+        last_end = label.end
+    if new_text:
+        if keep_tail:
+            stats.output_sentences += 1
+            stats.merged_labels += parts - 1
+            yield Label(new_start, last_end, new_text, new_source)
+        else:
+            stats.dropped_tail += parts
+
+def merge_sentence_file(label_file: str, output_file: Optional[str] = None,
+                        endings: Sequence[str] = SENTENCE_ENDINGS, keep_tail: bool = False,
+                        precision: Optional[int] = None) -> SentenceMergeStats:
+    """
+    레이블 파일 하나를 문장 단위로 병합해 저장합니다.
+
+    Args:
+        label_file (str): 레이블 파일 경로
+        output_file (str, optional): 저장할 경로. None이면 '-refined'를 붙인 경로
+        endings (Sequence[str]): 문장 끝으로 볼 어미 목록
+        keep_tail (bool): 문장부호 없이 끝난 마지막 문장도 저장할지 여부
+        precision (int, optional): 시간 소수점 자릿수. None이면 그대로 출력
+
+    Returns:
+        SentenceMergeStats: 병합 통계
+    """
+    output_file = output_file or rename(label_file, suffix='-refined')
+    stats = SentenceMergeStats(label_file)
+    write_labels(output_file, merge_sentences(iter_labels(label_file), endings, stats, keep_tail), precision)
+    return stats
+
+def merge_sentences_in_folder(folder_path: str, extension: str = 'txt', recursive: bool = False,
+                              endings: Sequence[str] = SENTENCE_ENDINGS, keep_tail: bool = False,
+                              suffix: str = '-refined', max_workers: Optional[int] = None) -> List[SentenceMergeStats]:
+    """
+    폴더의 레이블 파일들을 여러 프로세스로 나눠 문장 단위로 병합합니다.
+    이미 suffix가 붙은 결과 파일은 대상에서 제외합니다.
+
+    Args:
+        folder_path (str): 레이블 파일이 있는 폴더 경로
+        extension (str): 레이블 파일 확장자
+        recursive (bool): 하위 폴더까지 탐색할지 여부
+        endings (Sequence[str]): 문장 끝으로 볼 어미 목록
+        keep_tail (bool): 문장부호 없이 끝난 마지막 문장도 저장할지 여부
+        suffix (str): 결과 파일 이름에 붙일 접미사
+        max_workers (int, optional): 프로세스 수. None이면 CPU 수
+
+    Returns:
+        List[SentenceMergeStats]: 파일별 병합 통계
+    """
+    endings = compile_endings(endings)
+    files = [file_path for file_path in get_files_path_in_folder_via_ext(folder_path, extension, recursive)
+             if not os.path.splitext(file_path)[0].endswith(suffix)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(merge_sentence_file, file_path, rename(file_path, suffix=suffix), endings, keep_tail)
+                   for file_path in files]
+        return [future.result() for future in futures]
+
+def shift_labels(labels: Iterable[Label], offset: float) -> Iterator[Label]:
+    """
+    레이블 시간을 offset만큼 이동합니다. (음수면 앞으로)
+
+    Args:
+        labels (Iterable[Label]): 레이블들
+        offset (float): 이동할 시간(초)
+
+    Yields:
+        Label: 이동된 레이블
+    """
+    for label in labels:
+        yield label._replace(start=label.start + offset, end=label.end + offset)
+
+def clamp_labels(labels: Iterable[Label], minimum: float = 0.0) -> Iterator[Label]:
+    """
+    minimum보다 작은 시간을 minimum으로 맞춥니다.
+
+    Args:
+        labels (Iterable[Label]): 레이블들
+        minimum (float): 최소 시간(초)
+
+    Yields:
+        Label: 보정된 레이블
+    """
+    for label in labels:
+        if label.start < minimum or label.end < minimum:
+            label = label._replace(start=max(label.start, minimum), end=max(label.end, minimum))
+        yield label
+
+def round_labels(labels: Iterable[Label], digits: int = 2) -> Iterator[Label]:
+    """
+    레이블 시간을 소수점 digits 자리로 반올림합니다.
+
+    Args:
+        labels (Iterable[Label]): 레이블들
+        digits (int): 소수점 자릿수
+
+    Yields:
+        Label: 반올림된 레이블
+    """
+    for label in labels:
+        yield label._replace(start=round(label.start, digits), end=round(label.end, digits))
+
+def strip_label_text(labels: Iterable[Label]) -> Iterator[Label]:
+    """
+    레이블 텍스트 앞뒤 공백을 제거합니다.
+
+    Args:
+        labels (Iterable[Label]): 레이블들
+
+    Yields:
+        Label: 공백이 제거된 레이블
+    """
+    for label in labels:
+        yield label._replace(text=label.text.strip())
+
+def drop_empty_labels(labels: Iterable[Label]) -> Iterator[Label]:
+    """
+    텍스트가 비어있는 레이블을 제외합니다.
+
+    Args:
+        labels (Iterable[Label]): 레이블들
+
+    Yields:
+        Label: 텍스트가 있는 레이블
+    """
+    for label in labels:
+        if label.text.strip():
+            yield label
+
+def apply_label_transforms(labels: Iterable[Label], transforms: Sequence[Callable]) -> Iterable[Label]:
+    """
+    레이블들에 변환 단계들을 차례로 연결합니다.
+    각 단계는 Label iterable을 받아 Label iterable을 반환하는 함수입니다.
+
+    Args:
+        labels (Iterable[Label]): 레이블들
+        transforms (Sequence[Callable]): 변환 단계들 (예: partial(shift_labels, offset=-1.5))
+
+    Returns:
+        Iterable[Label]: 변환된 레이블들
+    """
+    for transform in transforms:
+        labels = transform(labels)
+    return labels
+
+def default_label_transforms(offset: float = 0.0, digits: Optional[int] = 2,
+                             merge: bool = False) -> List[Callable]:
+    """
+    자주 쓰는 정규화 단계 목록을 만듭니다.
+    (이동 -> 0 미만 보정 -> 반올림 -> 공백 제거 -> 빈 레이블 제거 -> 문장 병합)
+
+    Args:
+        offset (float): 이동할 시간(초)
+        digits (int, optional): 반올림 자릿수. None이면 반올림하지 않음
+        merge (bool): 문장 단위로 병합할지 여부
+
+    Returns:
+        List[Callable]: 변환 단계 목록
+    """
+    transforms = []
+    if offset:
+        transforms.append(partial(shift_labels, offset=offset))
+    transforms.append(partial(clamp_labels, minimum=0.0))
+    if digits is not None:
+        transforms.append(partial(round_labels, digits=digits))
+    transforms.append(strip_label_text)
+    transforms.append(drop_empty_labels)
+    if merge:
+        transforms.append(merge_sentences)
+    return transforms
+
+def normalize_label_file(label_file: str, output_file: str, transforms: Sequence[Callable],
+                         precision: Optional[int] = 2, force: bool = False) -> Tuple[str, str]:
+    """
+    레이블 파일 하나에 변환 단계들을 적용해 임시 파일을 거쳐 저장합니다.
+    결과 파일이 원본보다 새로우면 건너뜁니다.
+
+    Args:
+        label_file (str): 원본 레이블 파일 경로
+        output_file (str): 저장할 파일 경로
+        transforms (Sequence[Callable]): 변환 단계들
+        precision (int, optional): 저장할 시간 소수점 자릿수
+        force (bool): 결과 파일이 최신이어도 다시 만들지 여부
+
+    Returns:
+        Tuple[str, str]: (원본 경로, 'done' 또는 'skipped')
+    """
+    if not force and os.path.exists(output_file) and os.path.getmtime(output_file) >= os.path.getmtime(label_file):
+        return label_file, 'skipped'
+    labels = apply_label_transforms(iter_labels(label_file), transforms)
+    write_labels(output_file, labels, precision, atomic=True)
+    return label_file, 'done'
+
+def normalize_label_folder(folder_path: str, transforms: Sequence[Callable], extension: str = 'txt',
+                           recursive: bool = False, suffix: str = '-refined', output_folder: Optional[str] = None,
+                           precision: Optional[int] = 2, force: bool = False,
+                           max_workers: Optional[int] = None) -> List[Tuple[str, str]]:
+    """
+    폴더의 레이블 파일들에 변환 단계들을 여러 프로세스로 적용합니다.
+    transforms는 프로세스로 넘길 수 있도록 모듈 함수나 functools.partial이어야 합니다.
+
+    Args:
+        folder_path (str): 레이블 파일이 있는 폴더 경로
+        transforms (Sequence[Callable]): 변환 단계들
+        extension (str): 레이블 파일 확장자
+        recursive (bool): 하위 폴더까지 탐색할지 여부
+        suffix (str): 결과 파일 이름에 붙일 접미사 (output_folder가 있으면 무시)
+        output_folder (str, optional): 결과를 저장할 폴더. 원본 폴더 구조를 유지합니다.
+        precision (int, optional): 저장할 시간 소수점 자릿수
+        force (bool): 결과 파일이 최신이어도 다시 만들지 여부
+        max_workers (int, optional): 프로세스 수. None이면 CPU 수
+
+    Returns:
+        List[Tuple[str, str]]: 파일별 (원본 경로, 'done' 또는 'skipped')
+    """
+    jobs = []
+    for label_file in get_files_path_in_folder_via_ext(folder_path, extension, recursive):
+        if output_folder:
+            output_file = os.path.join(output_folder, os.path.relpath(label_file, folder_path))
+            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        elif os.path.splitext(label_file)[0].endswith(suffix):
+            continue
+        else:
+            output_file = rename(label_file, suffix=suffix)
+        jobs.append((label_file, output_file))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(normalize_label_file, label_file, output_file, list(transforms), precision, force)
+                   for label_file, output_file in jobs]
+        return [future.result() for future in futures]
@@ -0,0 +1,299 @@
+"""
+SQLite에 매니페스트를 저장하고 조회하기 위한 저장소
+
+CSV 매니페스트를 처음부터 끝까지 훑는 대신, 날짜/이름/파일 이름에 인덱스를 둔 테이블에서 찾습니다.
+기존 CSV 형식(원본 파일 이름 목록 "yymmdd","name.mp4", 구간 매니페스트 MANIFEST_COLUMNS)으로
+가져오기/내보내기를 할 수 있습니다.
+"""
+import os
+import csv
+import sqlite3
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+from .file_utils import atomic_write
+from .manifest_utils import Segment, read_manifest, write_manifest
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS origin_files (
+    date TEXT NOT NULL,
+    name TEXT NOT NULL,
+    folder TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (date, name)
+);
+CREATE INDEX IF NOT EXISTS origin_files_name ON origin_files (name);
+CREATE INDEX IF NOT EXISTS origin_files_folder ON origin_files (folder);
+CREATE TABLE IF NOT EXISTS scanned_folders (
+    folder TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    source TEXT NOT NULL,
+    "index" INTEGER NOT NULL,
+    start REAL NOT NULL,
+    "end" REAL NOT NULL,
+    text TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    output_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (source, "index")
+);
+CREATE INDEX IF NOT EXISTS segments_filename ON segments (filename);
+'''
+
+# 같은 SQL 문자열을 재사용해야 sqlite3의 문장 캐시(prepared statement)가 적중합니다.
+# 폴더 없이(folder='') 가져온 레코드가 스캔으로 찾은 레코드의 폴더를 지우지 않도록, 빈 폴더로는 덮어쓰지 않습니다.
+_INSERT_ORIGIN = ('INSERT INTO origin_files (date, name, folder) VALUES (?, ?, ?) '
+                  "ON CONFLICT (date, name) DO UPDATE SET folder = COALESCE(NULLIF(excluded.folder, ''), folder)")
+_INSERT_SEGMENT = ('INSERT OR REPLACE INTO segments (source, "index", start, "end", text, filename, output_path) '
+                   'VALUES (?, ?, ?, ?, ?, ?, ?)')
+_SEGMENT_COLUMNS = '"index", start, "end", text, filename, source, output_path'
+
+def _batches(records: Iterable, batch_size: int) -> Iterator[List]:
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+class ManifestStore:
+    """
+    SQLite(WAL 모드) 매니페스트 저장소
+    원본 파일 이름 목록(origin_files)과 잘라낸 구간 목록(segments)을 저장합니다.
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 1000, timeout: float = 30.0):
+        """
+        ManifestStore 초기화
+
+        Args:
+            db_path (str): SQLite 파일 경로 (없으면 만듦)
+            batch_size (int): 한 트랜잭션에 넣을 행 수
+            timeout (float): 다른 연결이 쓰는 중일 때 기다릴 시간(초)
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(db_path, timeout=timeout)
+        # WAL: 쓰는 동안에도 다른 프로세스가 읽을 수 있고, 커밋마다 fsync하지 않습니다(synchronous=NORMAL).
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def _insert_many(self, sql: str, records: Iterable[Tuple]) -> int:
+        count = 0
+        for batch in _batches(records, self.batch_size):
+            with self.connection:
+                self.connection.executemany(sql, batch)
+            count += len(batch)
+        return count
+
+    # 원본 파일 이름 목록
+
+    def add_origin_files(self, records: Iterable[Tuple[str, str]], folder: str = '') -> int:
+        """
+        (날짜, 파일 이름) 레코드들을 추가합니다. 이미 있는 (날짜, 파일 이름)은 folder를 바꾸되,
+        folder가 비어 있으면 기존 폴더를 유지합니다. (폴더가 사라질 때 scan_origin_folders가 지울 수 있도록)
+
+        Args:
+            records (Iterable[Tuple[str, str]]): (yymmdd, 파일 이름) 레코드들
+            folder (str): 레코드를 찾은 resource 폴더 경로 (모르면 빈 문자열)
+
+        Returns:
+            int: 추가한 레코드 수
+        """
+        return self._insert_many(_INSERT_ORIGIN, ((date, name, folder) for date, name in records))
+
+    def scan_resource_folder(self, resource_folder: str, extension: str = 'mp4', force: bool = False) -> Optional[int]:
+        """
+        resource 폴더의 파일들을 (날짜, 파일 이름)으로 저장합니다. 날짜는 resource 폴더의 상위 폴더 이름(yymmdd)입니다.
+        폴더의 수정 시각이 지난번과 같으면 다시 읽지 않습니다 (파일을 추가/삭제하면 폴더 수정 시각이 바뀝니다).
+
+        Args:
+            resource_folder (str): resource 폴더 경로
+            extension (str): 대상 파일 확장자
+            force (bool): 수정 시각과 관계없이 다시 읽을지 여부
+
+        Returns:
+            Optional[int]: 저장한 파일 수. 바뀌지 않아 건너뛰었으면 None
+        """
+        folder = os.path.abspath(resource_folder)
+        mtime_ns = os.stat(folder).st_mtime_ns
+        row = self.connection.execute('SELECT mtime_ns FROM scanned_folders WHERE folder = ?', (folder,)).fetchone()
+        if row and row[0] == mtime_ns and not force:
+            return None
+        date = os.path.basename(os.path.dirname(folder))
+        suffix = '.' + extension.lower()
+        names = sorted(f'{os.path.splitext(entry.name)[0]}.{extension}' for entry in os.scandir(folder)
+                       if entry.is_file() and entry.name.lower().endswith(suffix))
+        with self.connection:
+            self.connection.execute('DELETE FROM origin_files WHERE folder = ?', (folder,))
+            self.connection.executemany(_INSERT_ORIGIN, ((date, name, folder) for name in names))
+            self.connection.execute('INSERT OR REPLACE INTO scanned_folders (folder, mtime_ns) VALUES (?, ?)',
+                                    (folder, mtime_ns))
+        return len(names)
+
+    def scan_origin_folders(self, parent_folder_path: str, extension: str = 'mp4',
+                            resource_name: str = 'resource') -> Tuple[int, int]:
+        """
+        상위 폴더 아래의 모든 resource 폴더를 증분으로 저장합니다.
+        바뀐 폴더만 다시 읽고, 사라진 폴더의 레코드는 지웁니다.
+
+        Args:
+            parent_folder_path (str): 상위 폴더 경로 (예: yyyymm 폴더 또는 여러 해의 상위 폴더)
+            extension (str): 대상 파일 확장자
+            resource_name (str): 파일이 들어 있는 폴더 이름
+
+        Returns:
+            Tuple[int, int]: (다시 읽은 폴더 수, 건너뛴 폴더 수)
+        """
+        parent = os.path.abspath(parent_folder_path)
+        scanned, skipped = 0, 0
+        found = set()
+        for root, dirs, _ in os.walk(parent):
+            if resource_name in dirs:
+                folder = os.path.join(root, resource_name)
+                found.add(folder)
+                if self.scan_resource_folder(folder, extension) is None:
+                    skipped += 1
+                else:
+                    scanned += 1
+                # resource 폴더 안의 파일 목록은 scan_resource_folder가 읽으므로 더 내려가지 않습니다.
+                dirs.remove(resource_name)
+        prefix = os.path.join(parent, '')
+        known = [folder for folder, in self.connection.execute('SELECT folder FROM scanned_folders')
+                 if folder.startswith(prefix)]
+        removed = [(folder,) for folder in known if folder not in found]
+        with self.connection:
+            self.connection.executemany('DELETE FROM origin_files WHERE folder = ?', removed)
+            self.connection.executemany('DELETE FROM scanned_folders WHERE folder = ?', removed)
+        return scanned, skipped
+
+    def find_by_date(self, date: str) -> List[str]:
+        """날짜(yymmdd)의 파일 이름들"""
+        return [name for name, in self.connection.execute(
+            'SELECT name FROM origin_files WHERE date = ? ORDER BY name', (date,))]
+
+    def find_by_name(self, name: str) -> List[str]:
+        """파일 이름이 있는 날짜(yymmdd)들"""
+        return [date for date, in self.connection.execute(
+            'SELECT date FROM origin_files WHERE name = ? ORDER BY date', (name,))]
+
+    def iter_origin_files(self, date_prefix: str = '') -> Iterator[Tuple[str, str]]:
+        """
+        (날짜, 파일 이름) 레코드들을 날짜, 이름 순으로 읽습니다.
+
+        Args:
+            date_prefix (str): 날짜 앞부분 (예: '2406'이면 2024년 6월). 비어 있으면 전체
+        """
+        if date_prefix:
+            # 날짜 기본 키 인덱스로 범위를 찾습니다 (LIKE는 인덱스를 쓰지 못할 수 있음).
+            return iter(self.connection.execute(
+                'SELECT date, name FROM origin_files WHERE date >= ? AND date < ? ORDER BY date, name',
+                (date_prefix, date_prefix + '\uffff')))
+        return iter(self.connection.execute('SELECT date, name FROM origin_files ORDER BY date, name'))
+
+    def import_origin_csv(self, csv_file: str, encoding: str = 'utf-8') -> int:
+        """
+        "yymmdd","name.mp4" 형식(헤더 없음)의 CSV를 가져옵니다.
+
+        Args:
+            csv_file (str): CSV 파일 경로
+            encoding (str): 파일 인코딩
+
+        Returns:
+            int: 가져온 레코드 수
+        """
+        with open(csv_file, 'r', newline='', encoding=encoding) as file:
+            return self.add_origin_files((row[0], row[1]) for row in csv.reader(file) if len(row) >= 2)
+
+    def export_origin_csv(self, csv_file: str, date_prefix: str = '', encoding: str = 'utf-8') -> str:
+        """
+        make_csv_origin_file_name_database와 같은 "yymmdd","name.mp4" 형식(헤더 없음)으로 내보냅니다.
+
+        Args:
+            csv_file (str): 저장할 CSV 파일 경로
+            date_prefix (str): 날짜 앞부분. 비어 있으면 전체
+            encoding (str): 파일 인코딩
+
+        Returns:
+            str: 저장된 파일 경로
+        """
+        with atomic_write(csv_file, encoding=encoding, newline='') as file:
+            csv.writer(file, quoting=csv.QUOTE_ALL, lineterminator='\n').writerows(self.iter_origin_files(date_prefix))
+        return csv_file
+
+    # 구간 매니페스트
+
+    def add_segments(self, segments: Iterable[Segment]) -> int:
+        """
+        구간들을 추가합니다. 같은 (원본, 번호)는 덮어씁니다.
+
+        Args:
+            segments (Iterable[Segment]): 구간들
+
+        Returns:
+            int: 추가한 구간 수
+        """
+        return self._insert_many(_INSERT_SEGMENT, ((segment.source, segment.index, segment.start, segment.end,
+                                                    segment.text, segment.filename, segment.output_path)
+                                                   for segment in segments))
+
+    def import_manifest(self, manifest_path: str, source: str = '') -> int:
+        """
+        매니페스트 파일(CSV 또는 JSONL)을 가져옵니다.
+
+        Args:
+            manifest_path (str): 매니페스트 경로
+            source (str): source 열이 없는 매니페스트(CSV)에 넣을 원본 경로. 비어 있으면 매니페스트 경로
+
+        Returns:
+            int: 가져온 구간 수
+        """
+        source = source or manifest_path
+        return self.add_segments(Segment(int(record['index']), float(record['start']), float(record['end']),
+                                         record.get('text') or '', record['filename'],
+                                         record.get('source') or source, record.get('output_path') or '')
+                                 for record in read_manifest(manifest_path))
+
+    def get_segments(self, source: Optional[str] = None) -> List[Segment]:
+        """
+        구간들을 원본, 번호 순으로 읽습니다.
+
+        Args:
+            source (str, optional): 원본 경로. None이면 전체
+        """
+        if source is None:
+            rows = self.connection.execute(f'SELECT {_SEGMENT_COLUMNS} FROM segments ORDER BY source, "index"')
+        else:
+            rows = self.connection.execute(f'SELECT {_SEGMENT_COLUMNS} FROM segments WHERE source = ? ORDER BY "index"',
+                                           (source,))
+        return [Segment(*row) for row in rows]
+
+    def find_segment(self, filename: str) -> Optional[Segment]:
+        """잘라낸 결과 파일 이름으로 구간을 찾습니다. 없으면 None"""
+        row = self.connection.execute(f'SELECT {_SEGMENT_COLUMNS} FROM segments WHERE filename = ? LIMIT 1',
+                                      (filename,)).fetchone()
+        return Segment(*row) if row else None
+
+    def export_manifest(self, manifest_path: str, source: Optional[str] = None,
+                        columns: Optional[List[str]] = None) -> str:
+        """
+        구간들을 매니페스트 파일(CSV 또는 JSONL)로 내보냅니다. 형식은 write_manifest와 같습니다.
+
+        Args:
+            manifest_path (str): 저장할 매니페스트 경로
+            source (str, optional): 원본 경로. None이면 전체
+            columns (List[str], optional): 저장할 열 이름. None이면 CSV는 MANIFEST_COLUMNS
+
+        Returns:
+            str: 저장된 파일 경로
+        """
+        return write_manifest(manifest_path, self.get_segments(source), columns)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'ManifestStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,104 @@
+"""
+레이블 -> 구간(segment) -> 매니페스트(CSV/JSONL) 변환을 위한 유틸리티 함수들
+"""
+import os
+import csv
+import json
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from .label_utils import Label
+from .file_utils import atomic_write
+
+class Segment(NamedTuple):
+    """
+    잘라낼 구간 하나를 나타내는 매니페스트 레코드
+
+    Attributes:
+        index (int): 파일 안에서의 구간 번호 (1부터 시작)
+        start (float): 시작 시간(초)
+        end (float): 종료 시간(초)
+        text (str): 구간 텍스트
+        filename (str): 잘라낸 결과 파일 이름
+        source (str): 원본 미디어 파일 경로
+        output_path (str): 잘라낸 결과 파일 경로
+    """
+    index: int
+    start: float
+    end: float
+    text: str
+    filename: str
+    source: str = ''
+    output_path: str = ''
+
+# 기존 '-csv' 매니페스트와 같은 열 순서
+MANIFEST_COLUMNS = ['index', 'start', 'end', 'text', 'filename']
+
+def build_segments(labels: Iterable[Label], source_file: str, output_folder: Optional[str] = None,
+                   extension: str = 'mp3', name_format: str = '{base}_{index:04d}') -> List[Segment]:
+    """
+    레이블들로 잘라낼 구간 목록을 만듭니다. 파일은 만들지 않습니다.
+
+    Args:
+        labels (Iterable[Label]): 레이블들
+        source_file (str): 원본 미디어 파일 경로
+        output_folder (str, optional): 결과 파일 폴더. None이면 원본 이름의 하위 폴더
+        extension (str): 결과 파일 확장자
+        name_format (str): 결과 파일 이름 형식 (base, index, start, end 사용 가능)
+
+    Returns:
+        List[Segment]: 구간 목록
+    """
+    base = os.path.splitext(os.path.basename(source_file))[0]
+    output_folder = output_folder or os.path.join(os.path.dirname(source_file), base)
+    segments = []
+    for index, label in enumerate(labels, 1):
+        filename = name_format.format(base=base, index=index, start=label.start, end=label.end) + '.' + extension
+        segments.append(Segment(index, label.start, label.end, label.text.strip(), filename,
+                                source_file, os.path.join(output_folder, filename)))
+    return segments
+
+def write_manifest(manifest_path: str, segments: Iterable[Segment], columns: Optional[List[str]] = None) -> str:
+    """
+    구간 목록을 매니페스트 파일로 한 번에 저장합니다.
+    확장자가 .jsonl이면 JSON Lines, 그 외에는 CSV(utf-8-sig)로 저장합니다.
+
+    Args:
+        manifest_path (str): 저장할 매니페스트 경로
+        segments (Iterable[Segment]): 저장할 구간들
+        columns (List[str], optional): 저장할 열 이름. None이면 CSV는 MANIFEST_COLUMNS, JSONL은 전체 열
+
+    Returns:
+        str: 저장된 파일 경로
+    """
+    if manifest_path.lower().endswith('.jsonl'):
+        with atomic_write(manifest_path) as file:
+            for segment in segments:
+                record = segment._asdict()
+                if columns:
+                    record = {column: record[column] for column in columns}
+                file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        return manifest_path
+
+    columns = columns or MANIFEST_COLUMNS
+    with atomic_write(manifest_path, encoding='utf-8-sig', newline='') as file:
+        csv_writer = csv.writer(file)
+        csv_writer.writerow(columns)
+        for segment in segments:
+            record = segment._asdict()
+            csv_writer.writerow([record[column] for column in columns])
+    return manifest_path
+
+def read_manifest(manifest_path: str) -> List[Dict]:
+    """
+    매니페스트 파일(CSV 또는 JSONL)을 읽어 딕셔너리 리스트로 반환합니다.
+
+    Args:
+        manifest_path (str): 매니페스트 경로
+
+    Returns:
+        List[Dict]: 레코드 리스트
+    """
+    if manifest_path.lower().endswith('.jsonl'):
+        with open(manifest_path, 'r', encoding='utf-8') as file:
+            return [json.loads(line) for line in file if line.strip()]
+    with open(manifest_path, 'r', encoding='utf-8-sig', newline='') as file:
+        return list(csv.DictReader(file))
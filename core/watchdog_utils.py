@@ -3,6 +3,7 @@
 """
 import os
 import time
+import threading
 from typing import Callable, Optional
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -70,6 +71,66 @@ def watch_folder_with_interval(folder_path: str, action: Callable,
     except KeyboardInterrupt:
         stop_observer(observer)
 
+def wait_for_file(file_path: str, timeout: Optional[float] = None, since: Optional[float] = None,
+                  settle: float = 0.5) -> bool:
+    """
+    파일이 생성되거나 쓰기 후 닫힐 때까지 폴링 없이 기다립니다.
+    닫힘(close-after-write) 이벤트나 이동(임시 파일 교체)은 바로 완료로 보고,
+    이를 지원하지 않는 플랫폼에서는 생성/수정 이벤트가 settle초 동안 멈추면 완료로 봅니다.
+
+    Args:
+        file_path (str): 기다릴 파일 경로 (상위 폴더는 있어야 합니다)
+        timeout (float, optional): 최대 대기 시간(초). None이면 무한정 대기
+        since (float, optional): 이 시각(time.time()) 이후에 수정된 파일이면 이미 저장된 것으로 봅니다.
+                                 None이면 호출 시점
+        settle (float): 수정 이벤트 후 쓰기가 끝났다고 볼 시간(초)
+
+    Returns:
+        bool: 파일이 저장되었으면 True, 시간 초과면 False
+    """
+    file_path = os.path.abspath(file_path)
+    since = time.time() if since is None else since
+    wake = threading.Event()
+    state = {'closed': False, 'changed': False, 'last': 0.0}
+
+    class FileWaitHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            path = getattr(event, 'dest_path', '') if event.event_type == 'moved' else event.src_path
+            if os.path.abspath(path) != file_path:
+                return
+            if event.event_type in ('closed', 'moved'):
+                state['closed'] = True
+            elif event.event_type in ('created', 'modified'):
+                state['changed'] = True
+                state['last'] = time.monotonic()
+            wake.set()
+
+    observer = Observer()
+    observer.schedule(FileWaitHandler(), os.path.dirname(file_path), recursive=False)
+    observer.start()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        # 감시를 시작하기 전에 이미 저장된 경우
+        if os.path.exists(file_path) and os.path.getmtime(file_path) >= since:
+            return True
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            wait_time = settle if state['changed'] else remaining
+            if remaining is not None and wait_time is not None:
+                wait_time = min(wait_time, remaining)
+            wake.wait(wait_time)
+            wake.clear()
+            if state['closed']:
+                return True
+            if state['changed'] and time.monotonic() - state['last'] >= settle:
+                return True
+    finally:
+        stop_observer(observer)
+
 if __name__ == "__main__":
     def test_action():
         print("파일이 수정되었습니다!")
@@ -5,6 +5,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(os.path.dirname(__file__)))))))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))))
 from _workplace.library.junLib import *
+from _workplace.library.manifest_store import ManifestStore
 
 def process(file_path):
     yymmdd_folder_path = parent_path(parent_path(file_path))
@@ -43,16 +44,12 @@ def run(select='', folder_path=None, file_path=None, parent_folder_path=None, ex
         elif select == '2':
             if not parent_folder_path:
                 parent_folder_path = strip_quotes(input('Enter parent folder path: '))
-            folders = sub_path(parent_folder_path)
-            if folders:
-                for i, folder in enumerate(folders):
-                    folder_path = get_specific_sub_folder_path(folder, 'resource')
-                    files = get_files_path_in_folder_via_ext(folder_path, 'mp4')
-                    for i, file_path in enumerate(files):
-                        text = process(file_path)
-                        text_lines.append(text)
-                write_to_file(join_folder_path(parent_folder_path, os.path.basename(parent_folder_path)+'.csv'), text_lines)
-            text_lines=None
+            csv_file = join_folder_path(parent_folder_path, os.path.basename(parent_folder_path)+'.csv')
+            # 같은 이름의 .db에 폴더별로 저장해두고, 다음 실행부터는 바뀐 resource 폴더만 다시 읽습니다.
+            with ManifestStore(rename(csv_file, new_extension='db')) as store:
+                scanned, skipped = store.scan_origin_folders(parent_folder_path, 'mp4')
+                store.export_origin_csv(csv_file)
+            print(f'scanned : {scanned}, unchanged : {skipped}')
 
             select = None
             parent_folder_path = None
@@ -9,6 +9,10 @@ from _workplace.util.audacity.pipeclient_jun import PipeClient_jun
 from _workplace.util.media_files_control import transfer_mp4_to_mp3 as transfer
 import time  # time 모듈을 추가합니다.
 from _workplace.util.audacity.save_label_txt import run as transfer_to_txt
+from _workplace.library.label_utils import read_labels, iter_labels
+from _workplace.library.watchdog_utils import wait_for_file
+from _workplace.util.audacity.conversion_cache import ConversionCache, BackgroundConverter
+from functools import partial
 
 
 
@@ -31,20 +35,19 @@ def convert_audio(input_file, output_file=None, extension='wav', ffmpeg_path=ffm
     subprocess.run(cmd, check=True)
     return output_file
 
-def get_track_info(client: PipeClient_jun):
-    # Audacity에서 트랙 정보를 가져옵니다.
-    client.write("GetInfo: Type=Tracks Format=JSON")
-    
-    # 응답을 받아옵니다.
-    response = client.read()
-    
-    # 응답을 분석하여 필요한 정보를 추출합니다. (예: 파일 경로)
-    # 이 부분은 Audacity의 응답 형식에 따라 파싱 코드를 작성해야 합니다.
-    # LISP 형식의 응답을 파싱하는 코드를 추가해야 합니다.
+# convert_audio의 변환 설정 이름 (설정을 바꾸면 캐시가 섞이지 않도록 이름도 바꿉니다)
+CONVERT_PROFILE = 'wav_44100_pcm_f32le'
 
-    return response
+def create_converter(lookahead=2, max_workers=2, cache_folder=None):
+    # 변환 결과를 원본 해시로 캐시하고, 다음 파일들을 미리 변환하는 변환기를 만듭니다.
+    cache = ConversionCache(partial(convert_audio, ffmpeg_path=ffmpeg_path), CONVERT_PROFILE, 'wav', cache_folder)
+    return BackgroundConverter(cache, lookahead=lookahead, max_workers=max_workers)
+
+def get_track_info(client: PipeClient_jun):
+    # Audacity에서 트랙 정보를 JSON으로 받아 AudacityTrack 리스트로 반환합니다.
+    return client.get_tracks()
 
-def import_mp3_and_set_labels_from_input(client:PipeClient_jun, mp3_file_path=None, new_wav_file_path=None, convert=True):
+def import_mp3_and_set_labels_from_input(client:PipeClient_jun, mp3_file_path=None, new_wav_file_path=None, convert=True, import_file=True, converter:BackgroundConverter=None): # type:ignore
     # 사용자로부터 mp3 파일 경로와 레이블 txt 파일 경로를 입력받습니다.
     # mp3_file_path = "E20200921_00002_048_01-143.520_150.200-neutral_aeng_keo_nam_02.mp3" or strip_quotes(input("Enter mp3 file path: "))
     mp3_file_path = mp3_file_path or strip_quotes(input("Enter mp3 file path: "))
@@ -62,75 +65,90 @@ def import_mp3_and_set_labels_from_input(client:PipeClient_jun, mp3_file_path=No
     # if convert:
         # convert_audio(mp3_file_path, new_wav_file_path, ffmpeg_path=ffmpeg_path, overwrite='-y')
     # copy_and_rename_file(mp3_file_path, new_wav_file_path)
-    new_wav_file_path = str(os.path.abspath(mp3_file_path)).replace('\\', '/')
-    client.write(f'Import2: Filename="{new_wav_file_path}"')
-    time.sleep(1)  # 오디오 파일을 가져온 후 약간의 지연 시간을 둡니다.
+    track_name = os.path.splitext(os.path.basename(os.path.abspath(mp3_file_path)))[0]
+    if converter:
+        # 미리 변환된 WAV가 캐시에 있으면 바로 가져오고, 없으면 변환이 끝날 때까지 기다립니다.
+        new_wav_file_path = str(converter.get(mp3_file_path)).replace('\\', '/')
+    else:
+        new_wav_file_path = str(os.path.abspath(mp3_file_path)).replace('\\', '/')
+    # 가져오기가 끝났다는 응답이 올 때까지 기다립니다.
+    client.send(f'Import2: Filename="{new_wav_file_path}"', timeout=120.0)
+    if converter:
+        # 캐시 파일 이름 대신 원본 이름을 트랙 이름으로 씁니다.
+        client.send(f'SetTrackStatus: Name="{track_name}"')
+    labels = read_labels(label_file_path)
+    if import_file:
+        # 레이블 파일 하나를 Import2로 가져와 레이블 트랙을 한 번에 만듭니다.
+        client.import_labels(labels, track_name=track_name)
+        return client
 
-    # 새로운 레이블 트랙을 생성합니다.
-    client.write("NewLabelTrack")
-    client.write("LastTrack")
-    client.write(f"SetTrackStatus: Name={os.path.splitext(os.path.basename(os.path.abspath(mp3_file_path)))[0]}")
-
-    # txt 파일에서 레이블 정보를 읽어옵니다.
-    with open(label_file_path, 'r', encoding='utf-8') as txt_file:
-        for i, line in enumerate(txt_file):
-            # 여기서는 간단하게 각 줄을 레이블로 추가한다고 가정합니다.
-            # 실제로는 txt 파일의 형식에 따라 파싱이 필요할 수 있습니다.
-            if line.strip():
-                start_time, end_time, text = line.strip().split("\t")
-                print(start_time, "\t", end_time, "\t", text)
-                client.write(f'SelectTime: End={end_time} Start={start_time}')
-                client.write(f'AddLabel')
-                client.write(f'SetLabel: End={end_time} Start={start_time} Text="{text}" Label="{i}')
+    # 레이블마다 명령을 보내는 경우에도 묶어서 보내고 응답은 파이프라인으로 받습니다.
+    with client.batch():
+        client.queue("NewLabelTrack")
+        client.queue("LastTrack")
+        client.queue(f"SetTrackStatus: Name={track_name}")
+        for i, label in enumerate(labels):
+            client.queue(f'SelectTime: End={label.end} Start={label.start}')
+            client.queue(f'AddLabel')
+            client.queue(f'SetLabel: End={label.end} Start={label.start} Text="{label.text.strip()}" Label="{i}')
     return client
 
-def run(client:PipeClient_jun=PipeClient_jun(), mp3_file_path=None, new_wav_file_path=None, convert=False): # type:ignore
+def run(client:PipeClient_jun=PipeClient_jun(), mp3_file_path=None, new_wav_file_path=None, convert=False, converter:BackgroundConverter=None): # type:ignore
     client.delete_all()
-    client = import_mp3_and_set_labels_from_input(client=client, mp3_file_path=mp3_file_path, new_wav_file_path=new_wav_file_path, convert=convert)
+    client = import_mp3_and_set_labels_from_input(client=client, mp3_file_path=mp3_file_path, new_wav_file_path=new_wav_file_path, convert=convert, converter=converter)
     input("Enter to continue")
     txt_file_path = rename(mp3_file_path, new_extension='txt')
     client.set_txt_file_path(txt_file_path)
-    client.save_to_label()
-    print(f"==========\nfolder: {os.path.dirname(txt_file_path)}\n==========")
-    print(f"==========\n{os.path.basename(txt_file_path)}\n==========")
-    input("Enter to continue after save label")
-    clear()
+    """
+        빈 레이블 검사 코드
+    """
+    # 저장된 txt를 다시 읽지 않고 Audacity의 레이블 트랙을 바로 검사합니다.
+    print("빈 레이블이 있는지 검사합니다.")
+    empty_labels = client.find_empty_labels()
+    while(empty_labels):
+        print(f"레이블 중 {empty_labels[0].index + 1}번째 레이블({empty_labels[0].start:.2f}s)에 빈 레이블이 있습니다. Audacity에서 수정 후 진행 바랍니다.")
+        input("Enter to continue")
+        empty_labels = client.find_empty_labels()
+    print("빈 레이블 없음. 통과.")
     """
         저장 여부 검사 코드
     """
-    
     print("레이블 파일을 올바른 위치에 저장했는지 검사합니다.")
-    while(not path_exist(rename(mp3_file_path, new_extension='txt.bak'))):
-        clear()
-        print("저장이 되지 않았습니다.\n저장 후 진행 바랍니다.")
+    since = time.time()
+    if not client.save_to_label().rstrip().endswith('OK'):
+        # 파이프로 내보내지 못하면 사용자가 직접 저장할 때까지 CPU를 쓰지 않고 기다립니다.
+        print("저장이 되지 않았습니다.\n저장하면 바로 진행됩니다.")
         print(f"==========\nfolder: {os.path.dirname(txt_file_path)}\n==========")
         print(f"==========\n{os.path.basename(txt_file_path)}\n==========")
-        input("Enter to continue after save label")
-    """
-        빈 레이블 검사 코드
-    """
-    print("빈 레이블이 있는지 검사합니다.")
-    need_to_check_empty_text = True
-    while(need_to_check_empty_text):
-        while_break_flag = True
-        lines = read_lines(txt_file_path)
-        target = 0
-        for i, line in enumerate(lines, 1):
-            if line.strip().__contains__('\t'):
-                start, end, text = line.split('\t')
-                if not text.strip():
-                    while_break_flag = False
-                    target = i
-                    break
-        if while_break_flag: break
-        else:
-            print(f"레이블 중 {target}번째 줄에 빈 레이블이 있습니다. 레이블/텍스트 파일 수정 및 저장 후 진행 바랍니다.")
-            input("Enter to continue")
-    print("빈 레이블 없음. 통과.")
+        wait_for_file(txt_file_path, since=since)
+    # 저장된 파일은 한 번만 읽으며, 빈 레이블을 찾으면 그 자리에서 멈추고 다음 저장을 기다립니다.
+    while True:
+        empty_line = next((i for i, label in enumerate(iter_labels(txt_file_path), 1) if not label.text.strip()), None)
+        if empty_line is None:
+            break
+        print(f"레이블 중 {empty_line}번째 레이블이 비어 있습니다. 수정 후 저장하면 바로 진행됩니다.")
+        since = time.time()
+        wait_for_file(txt_file_path, since=since)
+    print(f"==========\n{os.path.basename(txt_file_path)} 저장 완료\n==========")
 
     client.delete_all()
     return client
 
+def run_folder(client:PipeClient_jun=None, folder_path=None, extension='mp3', lookahead=2): # type:ignore
+    # 폴더의 파일을 차례로 검수하며, 검수하는 동안 다음 lookahead개 파일을 미리 WAV로 변환합니다.
+    client = client or PipeClient_jun()
+    folder_path = folder_path or strip_quotes(input("Enter folder path: "))
+    file_paths = get_files_path_in_folder_via_ext(folder_path, extension)
+    converter = create_converter(lookahead=lookahead)
+    try:
+        for i, mp3_file_path in enumerate(file_paths):
+            converter.submit(mp3_file_path)
+            converter.prefetch(file_paths[i + 1:])
+            run(client, mp3_file_path, converter=converter)
+    finally:
+        converter.close(wait=False)
+    return client
+
 if __name__ == "__main__":
     # 사용 예제
     # client = PipeClient()
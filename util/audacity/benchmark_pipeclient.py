@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+from __init__ import *
+sys.path.append(source_code_path)
+from _workplace.library.junLib import *
+from _workplace.library.label_utils import Label, write_labels
+from _workplace.util.audacity.fake_pipe_server import SimulatedAudacity, default_pipe_names
+import time
+import shutil
+import tempfile
+import argparse
+
+# Audacity 없이 SimulatedAudacity(가짜 mod-script-pipe 서버)를 띄워
+# PipeClient의 명령 처리량과 레이블 가져오기 시간을 측정합니다.
+# 기본 파이프 이름(/tmp/audacity_script_pipe.to/from.<uid>)을 사용하므로 Audacity가 실행 중이면 안 됩니다.
+
+def _result(name, count, seconds):
+    return {'name': name, 'count': count, 'seconds': round(seconds, 4),
+            'per_sec': round(count / seconds, 1) if seconds else float('inf')}
+
+def bench_send(client, count=500, command='GetInfo: Type=Tracks Format=JSON'):
+    """명령을 하나씩 보내고 응답을 기다리는 경우의 초당 명령 수"""
+    start = time.perf_counter()
+    for _ in range(count):
+        client.send(command)
+    return _result('send', count, time.perf_counter() - start)
+
+def bench_pipelined(client, count=500, command='GetInfo: Type=Tracks Format=JSON', timeout=60.0):
+    """명령을 한 번에 보내고 응답을 파이프라인으로 받는 경우의 초당 명령 수"""
+    start = time.perf_counter()
+    futures = client.write_many([command] * count)
+    for future in futures:
+        future.result(timeout=timeout)
+    return _result('write_many', count, time.perf_counter() - start)
+
+def bench_label_import(client, server, label_count=1000, import_file=True):
+    """
+    auto_mp3_label의 mp3 + 레이블 가져오기를 처음부터 끝까지 실행한 시간
+    import_file이 False면 레이블마다 명령을 보내는 방식으로 측정합니다.
+    """
+    # auto_mp3_label은 불러올 때 기본 파이프에 연결하므로 서버를 띄운 뒤에 불러옵니다.
+    from _workplace.util.audacity.auto_mp3_label import import_mp3_and_set_labels_from_input
+    temp_folder = tempfile.mkdtemp(prefix='audacity_bench_')
+    try:
+        mp3_file_path = os.path.join(temp_folder, 'bench.mp3')
+        open(mp3_file_path, 'wb').close()
+        labels = [Label(i * 1.5, i * 1.5 + 1.0, f'label {i}') for i in range(label_count)]
+        write_labels(rename(mp3_file_path, new_extension='txt'), labels)
+        client.delete_all()
+        start = time.perf_counter()
+        import_mp3_and_set_labels_from_input(client, mp3_file_path, import_file=import_file)
+        seconds = time.perf_counter() - start
+        imported = len(server.labels())
+        if imported != label_count:
+            raise RuntimeError(f'레이블 {label_count}개 중 {imported}개만 가져왔습니다.')
+        return _result('import_labels' if import_file else 'per_label_commands', label_count, seconds)
+    finally:
+        shutil.rmtree(temp_folder, ignore_errors=True)
+
+def run(count=500, label_count=1000, latency=0.0, force=False):
+    if any(os.path.exists(name) for name in default_pipe_names()) and not force:
+        print('Audacity 파이프가 이미 있습니다. Audacity를 종료하거나 --force를 사용하세요.')
+        return []
+    server = SimulatedAudacity(latency=latency).start()
+    try:
+        # 서버가 파이프를 만든 뒤에 연결합니다.
+        from _workplace.util.audacity.pipeclient_jun import PipeClient_jun
+        client = PipeClient_jun()
+        results = [
+            bench_send(client, count),
+            bench_pipelined(client, count),
+            bench_label_import(client, server, label_count, import_file=True),
+            bench_label_import(client, server, label_count, import_file=False),
+        ]
+    finally:
+        server.stop()
+    print(f"==========\nlatency: {latency}s\n==========")
+    for result in results:
+        print(f"{result['name']:<20} {result['count']:>6}  {result['seconds']:>8.3f}s  {result['per_sec']:>10.1f}/s")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PipeClient benchmark against a simulated Audacity')
+    parser.add_argument('-n', '--count', type=int, default=500, help='commands per throughput run')
+    parser.add_argument('-l', '--labels', type=int, default=1000, help='labels per import run')
+    parser.add_argument('--latency', type=float, default=0.0, help='simulated seconds per command')
+    parser.add_argument('--force', action='store_true', help='replace existing Audacity pipes')
+    args = parser.parse_args()
+    run(args.count, args.labels, args.latency, args.force)
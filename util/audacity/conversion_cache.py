@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+import os
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# 원본 내용 해시와 변환 설정(profile)으로 변환 결과를 재사용하는 디스크 캐시와,
+# 검수하는 동안 다음 파일들을 미리 변환해두는 백그라운드 변환기
+
+DEFAULT_CACHE_FOLDER = os.path.join(tempfile.gettempdir(), 'audacity_conversion_cache')
+
+def file_digest(file_path, chunk_size=1024 * 1024):
+    """파일 내용의 sha256 해시(hex)를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ConversionCache:
+    """
+    내용 주소(content-addressed) 변환 캐시
+    결과 파일 경로 : cache_folder/<해시 앞 2자리>/<해시>-<profile>.<extension>
+    """
+
+    LOCK_STRIPES = 64
+    # 기억해 둘 해시 수. 넘으면 가장 오래 쓰지 않은 것부터 잊습니다.
+    MAX_DIGESTS = 4096
+
+    def __init__(self, convert, profile, extension='wav', cache_folder=None):
+        """
+        convert : convert(input_file, output_file)로 호출되는 변환 함수
+        profile : 변환 설정을 나타내는 이름. 설정이 바뀌면 이름도 바꿔야 합니다.
+        """
+        self.convert = convert
+        self.profile = profile
+        self.extension = extension
+        self.cache_folder = cache_folder or DEFAULT_CACHE_FOLDER
+        # 같은 파일을 다시 해시하지 않도록 (경로, 크기, 수정 시각)별 해시를 MAX_DIGESTS개까지 기억합니다. (LRU)
+        self._digests = OrderedDict()
+        # 내용이 같은 파일이 동시에 변환되지 않도록 결과 경로의 해시로 고른 잠금을 씁니다.
+        # 잠금 수가 정해져 있어서 파일이 많아도 늘어나지 않습니다. (다른 경로가 같은 잠금을 나눠 쓸 수는 있음)
+        self._path_locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+        self._lock = threading.Lock()
+
+    def digest(self, file_path):
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if key in self._digests:
+                self._digests.move_to_end(key)
+                return self._digests[key]
+        digest = file_digest(file_path)
+        with self._lock:
+            self._digests[key] = digest
+            if len(self._digests) > self.MAX_DIGESTS:
+                self._digests.popitem(last=False)
+        return digest
+
+    def path_for(self, file_path):
+        digest = self.digest(file_path)
+        return os.path.join(self.cache_folder, digest[:2], f'{digest}-{self.profile}.{self.extension}')
+
+    def get(self, file_path):
+        """캐시에 변환 결과가 있으면 경로를, 없으면 None을 반환합니다."""
+        cached_path = self.path_for(file_path)
+        return cached_path if os.path.exists(cached_path) else None
+
+    def convert_cached(self, file_path):
+        """캐시에 없으면 변환해서 저장하고, 변환 결과 경로를 반환합니다."""
+        cached_path = self.path_for(file_path)
+        path_lock = self._path_locks[hash(cached_path) % self.LOCK_STRIPES]
+        with path_lock:
+            if os.path.exists(cached_path):
+                return cached_path
+            return self._convert(file_path, cached_path)
+
+    def _convert(self, file_path, cached_path):
+        os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+        # 변환 중인 파일이 캐시로 보이지 않도록 임시 파일에 변환한 뒤 교체합니다.
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cached_path), suffix='.' + self.extension)
+        os.close(fd)
+        try:
+            self.convert(file_path, temp_path)
+            os.replace(temp_path, cached_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return cached_path
+
+class BackgroundConverter:
+    """현재 파일을 검수하는 동안 다음 lookahead개 파일을 병렬로 미리 변환합니다."""
+
+    def __init__(self, cache: ConversionCache, lookahead=2, max_workers=2):
+        self.cache = cache
+        self.lookahead = lookahead
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def submit(self, file_path):
+        """변환을 예약하고 Future를 반환합니다. 이미 예약된 파일이면 같은 Future를 반환합니다."""
+        key = os.path.abspath(file_path)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._executor.submit(self.cache.convert_cached, file_path)
+                self._futures[key] = future
+            return future
+
+    def prefetch(self, file_paths):
+        """다음 파일들 중 앞의 lookahead개를 미리 변환합니다."""
+        return [self.submit(file_path) for file_path in list(file_paths)[:self.lookahead]]
+
+    def get(self, file_path, timeout=None):
+        """변환된 파일 경로를 반환합니다. 아직 변환 중이면 끝날 때까지 기다립니다."""
+        future = self.submit(file_path)
+        try:
+            return future.result(timeout=timeout)
+        finally:
+            if future.done():
+                with self._lock:
+                    self._futures.pop(os.path.abspath(file_path), None)
+
+    def close(self, wait=True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Fake mod-script-pipe server for running PipeClient without Audacity.
+
+Creates a pair of FIFOs and answers every command with
+'BatchCommand finished: OK', the same framing Audacity uses
+(reply lines followed by an empty line).
+
+SimulatedAudacity keeps an in-memory model of tracks and labels and
+answers the commands used by the scripts in this folder (Import2,
+AddLabel, SetLabel, GetInfo, ExportLabels, ...). Replies can be
+delayed to simulate Audacity's command latency.
+
+Example
+-------
+
+    >>> server = FakePipeServer('/tmp/fake_pipe.to', '/tmp/fake_pipe.from')
+    >>> server.start()
+    >>> client = PipeClient(write_name=server.to_name, read_name=server.from_name)
+    >>> client.send('Help: Command=Help')
+    >>> server.stop()
+
+    # Stand in for Audacity on the default pipe names:
+    >>> server = SimulatedAudacity(latency=0.002).start()
+    >>> PipeClient().send('GetInfo: Type=Labels Format=JSON')
+
+Linux and Mac only (uses os.mkfifo).
+"""
+
+import os
+import re
+import json
+import time
+import threading
+
+
+PIPE_BASE = '/tmp/audacity_script_pipe.'
+OK = 'BatchCommand finished: OK'
+FAILED = 'BatchCommand finished: Failed!'
+
+
+class FakePipeServer():
+    """Answer mod-script-pipe commands on a pair of FIFOs.
+
+    Parameters
+    ----------
+        to_name : string
+            FIFO the client writes commands to
+        from_name : string
+            FIFO the client reads replies from
+        enc : string, optional
+            Encoding of the pipes
+        latency : float, optional
+            Seconds to wait before every reply
+        command_latency : dict, optional
+            Extra seconds per command name, e.g. {'Import2': 0.5}
+
+    Attributes
+    ----------
+        commands : list of string
+            Every command received, in order
+
+    """
+
+    def __init__(self, to_name, from_name, enc='utf-8', latency=0.0,
+                 command_latency=None):
+        self.to_name = to_name
+        self.from_name = from_name
+        self.enc = enc
+        self.latency = latency
+        self.command_latency = command_latency or {}
+        self.commands = []
+        self._thread = None
+        self._stopping = False
+
+    def start(self):
+        """Create the FIFOs and start answering in a daemon thread."""
+        for name in (self.to_name, self.from_name):
+            if os.path.exists(name):
+                os.remove(name)
+            os.mkfifo(name)
+        self._stopping = False
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        """Close the server's ends of the FIFOs, wait for the server
+        thread, then remove the FIFOs.
+
+        The client's reader sees end-of-file (PipeClient sets
+        reader_pipe_broken and fails pending commands) and later writes
+        fail with a broken pipe.
+        """
+        self._stopping = True
+        deadline = time.time() + timeout
+        while (self._thread is not None and self._thread.is_alive()
+               and time.time() < deadline):
+            self._wake(min(0.05, max(deadline - time.time(), 0)))
+        for name in (self.to_name, self.from_name):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def _wake(self, wait):
+        # Unblock the server thread wherever it waits: opening the reply
+        # FIFO, opening the command FIFO or reading a command. Opening
+        # fails while the thread has not reached that point yet, so
+        # stop() retries until the thread has ended.
+        wake = []
+        for name, flags in ((self.from_name, os.O_RDONLY),
+                            (self.to_name, os.O_WRONLY)):
+            try:
+                wake.append(os.open(name, flags | os.O_NONBLOCK))
+            except OSError:
+                pass
+        try:
+            if len(wake) == 2:
+                os.write(wake[1], b'\n')
+            self._thread.join(wait)
+        finally:
+            for fd in wake:
+                os.close(fd)
+
+    def handle(self, command):
+        """Return the reply lines for one command.
+
+        Override to simulate specific commands.
+        """
+        return [OK]
+
+    def delay(self, command):
+        """Return the seconds to wait before answering command."""
+        name = command.split(':', 1)[0].strip()
+        return self.latency + self.command_latency.get(name, 0.0)
+
+    def _serve(self):
+        with open(self.to_name, 'r', encoding=self.enc) as read_pipe, \
+                open(self.from_name, 'w', encoding=self.enc) as write_pipe:
+            for line in read_pipe:
+                if self._stopping:
+                    break
+                command = line.rstrip('\r\n\0')
+                if not command:
+                    continue
+                self.commands.append(command)
+                delay = self.delay(command)
+                if delay > 0:
+                    time.sleep(delay)
+                try:
+                    write_pipe.write('\n'.join(self.handle(command)) + '\n\n')
+                    write_pipe.flush()
+                except BrokenPipeError:
+                    # The client closed its read pipe; nobody is listening.
+                    break
+
+
+def fake_pipe_names(tag):
+    """Return a (to_name, from_name) pair of FIFO paths for tag."""
+    base = '/tmp/audacity_fake_pipe.{0}.{1}.'.format(tag, os.getuid())
+    return base + 'to', base + 'from'
+
+
+def default_pipe_names():
+    """Return the (to_name, from_name) pair Audacity uses for this user."""
+    uid = str(os.getuid())
+    return PIPE_BASE + 'to.' + uid, PIPE_BASE + 'from.' + uid
+
+
+def parse_command(command):
+    """Split 'Name: Key=Value Key="quoted value"' into (name, params)."""
+    name, _, rest = command.partition(':')
+    params = {}
+    for match in re.finditer(r'(\w+)=("[^"]*"|\S*)', rest):
+        params[match.group(1)] = match.group(2).strip('"')
+    return name.strip(), params
+
+
+class SimulatedAudacity(FakePipeServer):
+    """FakePipeServer with an in-memory model of Audacity's tracks.
+
+    Serves the default Audacity pipe names unless others are given.
+    Unknown commands fail the way Audacity does, so typos in scripts
+    show up in tests.
+
+    Attributes
+    ----------
+        tracks : list of dict
+            'name', 'kind' ('wave' or 'label'), 'start', 'end',
+            'selected' and, for label tracks, 'labels' as
+            [start, end, text] lists
+        project_name : string
+            Last name set with SetProject
+
+    """
+
+    def __init__(self, to_name=None, from_name=None, enc='utf-8',
+                 latency=0.0, command_latency=None):
+        default_to, default_from = default_pipe_names()
+        super().__init__(to_name or default_to, from_name or default_from,
+                         enc, latency, command_latency)
+        self.tracks = []
+        self.project_name = ''
+        self.focus = -1
+        self.selection = (0.0, 0.0)
+        self._handlers = {
+            'SelAllTracks': self._sel_all_tracks,
+            'RemoveTracks': self._remove_tracks,
+            'SetProject': self._set_project,
+            'Import2': self._import,
+            'NewLabelTrack': self._new_label_track,
+            'LastTrack': self._last_track,
+            'SetTrackStatus': self._set_track_status,
+            'SelectTime': self._select_time,
+            'AddLabel': self._add_label,
+            'SetLabel': self._set_label,
+            'GetInfo': self._get_info,
+            'ExportLabels': self._export_labels,
+            'SaveProject2': lambda params: [],
+            'Exit': lambda params: [],
+        }
+
+    def handle(self, command):
+        name, params = parse_command(command)
+        handler = self._handlers.get(name)
+        if handler is None:
+            return ['Your batch command of {0} was not recognized.'.format(name), FAILED]
+        try:
+            return handler(params) + [OK]
+        except (KeyError, ValueError, IndexError, OSError) as err:
+            return ['{0}: {1}'.format(name, err), FAILED]
+
+    def labels(self):
+        """Return all labels as (track_index, start, end, text), in track order."""
+        return [(index, label[0], label[1], label[2])
+                for index, track in enumerate(self.tracks) if track['kind'] == 'label'
+                for label in track['labels']]
+
+    def _add_track(self, name, kind, end=0.0):
+        track = {'name': name, 'kind': kind, 'start': 0.0, 'end': end, 'selected': True}
+        if kind == 'label':
+            track['labels'] = []
+        self.tracks.append(track)
+        self.focus = len(self.tracks) - 1
+        return track
+
+    def _label_track(self):
+        # AddLabel uses the focused label track, or creates one like Audacity.
+        if 0 <= self.focus < len(self.tracks) and self.tracks[self.focus]['kind'] == 'label':
+            return self.tracks[self.focus]
+        return self._add_track('Label Track', 'label')
+
+    def _sel_all_tracks(self, params):
+        for track in self.tracks:
+            track['selected'] = True
+        return []
+
+    def _remove_tracks(self, params):
+        self.tracks = [track for track in self.tracks if not track['selected']]
+        self.focus = len(self.tracks) - 1
+        return []
+
+    def _set_project(self, params):
+        self.project_name = params.get('Name', self.project_name)
+        return []
+
+    def _import(self, params):
+        file_name = params['Filename']
+        if not os.path.exists(file_name):
+            raise OSError('file not found: ' + file_name)
+        track_name = os.path.splitext(os.path.basename(file_name))[0]
+        if not file_name.lower().endswith('.txt'):
+            self._add_track(track_name, 'wave')
+            return []
+        track = self._add_track(track_name, 'label')
+        with open(file_name, 'r', encoding='utf-8') as file:
+            for line in file:
+                if not line.strip() or line.startswith('\\'):
+                    continue
+                fields = line.rstrip('\n').split('\t', 2) + ['']
+                track['labels'].append([float(fields[0]), float(fields[1]), fields[2]])
+        return []
+
+    def _new_label_track(self, params):
+        self._add_track('Label Track', 'label')
+        return []
+
+    def _last_track(self, params):
+        self.focus = len(self.tracks) - 1
+        return []
+
+    def _set_track_status(self, params):
+        if 'Name' in params:
+            self.tracks[self.focus]['name'] = params['Name']
+        return []
+
+    def _select_time(self, params):
+        self.selection = (float(params.get('Start', self.selection[0])),
+                          float(params.get('End', self.selection[1])))
+        return []
+
+    def _add_label(self, params):
+        self._label_track()['labels'].append([self.selection[0], self.selection[1], ''])
+        return []
+
+    def _set_label(self, params):
+        # Label is the index over all label tracks, as in Audacity.
+        index = int(params['Label'])
+        for track in self.tracks:
+            if track['kind'] != 'label':
+                continue
+            if index < len(track['labels']):
+                start, end, text = track['labels'][index]
+                track['labels'][index] = [float(params.get('Start', start)),
+                                          float(params.get('End', end)),
+                                          params.get('Text', text)]
+                return []
+            index -= len(track['labels'])
+        raise IndexError('label {0} does not exist'.format(params['Label']))
+
+    def _get_info(self, params):
+        info_type = params.get('Type', 'Commands')
+        if info_type == 'Tracks':
+            info = [{'name': track['name'], 'kind': track['kind'], 'start': track['start'],
+                     'end': track['end'], 'selected': int(track['selected']),
+                     'focused': int(index == self.focus)}
+                    for index, track in enumerate(self.tracks)]
+        elif info_type == 'Labels':
+            info = [[index, track['labels']] for index, track in enumerate(self.tracks)
+                    if track['kind'] == 'label']
+        else:
+            info = []
+        return [json.dumps(info)]
+
+    def _export_labels(self, params):
+        file_name = params.get('FileName') or params['Filename']
+        with open(file_name, 'w', encoding='utf-8') as file:
+            for _, start, end, text in self.labels():
+                file.write('{0:.6f}\t{1:.6f}\t{2}\n'.format(start, end, text))
+        return []
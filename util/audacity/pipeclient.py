@@ -11,7 +11,7 @@ Requires Python 2.7 or later. Python 3 strongly recommended.
 Command Line Interface
 ======================
 
-    usage: pipeclient.py [-h] [-t] [-s ] [-d]
+    usage: pipeclient.py [-h] [-t] [-s ] [-d] [-j]
 
 Arguments
 ---------
@@ -23,6 +23,8 @@ Arguments
         show command execution time (default: True)
     -d, --docs: optional
         show this documentation and exit
+    -j, --stats-json: string, optional
+        write per-command latency statistics (JSON) to this file on quit
 
 Example
 -------
@@ -58,10 +60,19 @@ Example
     # Read the last reply:
     >>> print(client.read())
 
+    # Or send a command and block until its reply arrives:
+    >>> print(client.send("GetInfo: Type=Tracks", timeout=10))
+
+    # Or await it from asyncio code:
+    >>> reply = await client.send_async("GetInfo: Type=Labels Format=JSON")
+
 See Also
 --------
 PipeClient.write : Write a command to _write_pipe.
 PipeClient.read : Read Audacity's reply from pipe.
+PipeClient.submit : Write a command and return a Future for its reply.
+PipeClient.send : Write a command and wait for its reply.
+PipeClient.send_async : Write a command and await its reply (asyncio).
 
 Copyright Steve Daulton 2018
 Released under terms of the GNU General Public License version 2:
@@ -73,8 +84,16 @@ import os
 import sys
 import threading
 import time
+import json
+import math
 import errno
+import asyncio
+import logging
 import argparse
+import selectors
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 
 if sys.version_info[0] < 3 and sys.version_info[1] < 7:
@@ -93,18 +112,118 @@ else:
     EOL = '\n'
 
 
+class CommandStats():
+    """Per-command-type latency histograms for PipeClient.
+
+    Latency is measured from writing a command to receiving its reply,
+    so pipelined commands (write_many) include their time in the queue.
+    Samples go into log-scale buckets, each 10% wider than the last
+    (FACTOR), so memory stays constant however long the session is.
+    Percentiles report the upper edge of their bucket (capped by the
+    real maximum), so they may read up to 10% high.
+
+    Attributes
+    ----------
+        callbacks : list of callable
+            Called as callback(command_name, seconds) for every reply, on
+            the reader thread after the reply has been delivered.
+            Exceptions are logged and do not stop the reader.
+
+    Example
+    -------
+        >>> client.stats.callbacks.append(lambda name, sec: print(name, sec))
+        >>> print(client.stats.summary()['Import2']['p95'])
+        >>> client.stats.dump('pipeclient_stats.json')
+
+    """
+
+    BASE = 1e-6
+    FACTOR = 1.1
+
+    def __init__(self):
+        self.callbacks = []
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, command, seconds):
+        """Add one reply latency for command."""
+        name = command.split(':', 1)[0].strip()
+        bucket = 0
+        if seconds > self.BASE:
+            bucket = int(math.log(seconds / self.BASE, self.FACTOR)) + 1
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                stat = self._stats[name] = {'count': 0, 'total': 0.0,
+                                            'max': 0.0, 'buckets': {}}
+            stat['count'] += 1
+            stat['total'] += seconds
+            stat['max'] = max(stat['max'], seconds)
+            stat['buckets'][bucket] = stat['buckets'].get(bucket, 0) + 1
+        for callback in self.callbacks:
+            try:
+                callback(name, seconds)
+            except Exception:
+                logging.getLogger(__name__).exception(
+                    'PipeClient: stats callback %r failed.', callback)
+
+    def _percentile(self, stat, fraction):
+        rank = fraction * stat['count']
+        seen = 0
+        for bucket in sorted(stat['buckets']):
+            seen += stat['buckets'][bucket]
+            if seen >= rank:
+                # Upper edge of the bucket, capped by the real maximum.
+                return min(self.BASE * self.FACTOR ** bucket, stat['max'])
+        return stat['max']
+
+    def summary(self):
+        """Return {command_name: {count, total, mean, p50, p95, p99, max}} in seconds."""
+        with self._lock:
+            stats = {name: dict(stat, buckets=dict(stat['buckets']))
+                     for name, stat in self._stats.items()}
+        return {name: {'count': stat['count'],
+                       'total': stat['total'],
+                       'mean': stat['total'] / stat['count'],
+                       'p50': self._percentile(stat, 0.50),
+                       'p95': self._percentile(stat, 0.95),
+                       'p99': self._percentile(stat, 0.99),
+                       'max': stat['max']}
+                for name, stat in sorted(stats.items(),
+                                         key=lambda item: -item[1]['total'])}
+
+    def dump(self, file_name):
+        """Write summary() as JSON to file_name."""
+        with open(file_name, 'w', encoding='utf-8') as file:
+            json.dump(self.summary(), file, indent=2)
+        return file_name
+
+    def reset(self):
+        """Forget all samples."""
+        with self._lock:
+            self._stats = {}
+
+
 class PipeClient():
     """Write / read client access to Audacity via named pipes.
 
     Normally there should be just one instance of this class. If
-    more instances are created, they all share the same state.
+    more instances are created for the same pipe names, they all share
+    the same state. Instances created with other pipe names (another
+    Audacity instance) get a state of their own.
 
     __init__ calls _write_thread_start() and _read_thread_start() on
-    first instantiation.
+    first instantiation only; later instances for the same pipes reuse
+    the open pipes, reply queue and reader thread.
 
     Parameters
     ----------
-        None
+        enc : string, optional
+            Encoding of the pipes
+        write_name : string, optional
+            Pipe to write commands to (default: WRITE_NAME)
+        read_name : string, optional
+            Pipe to read replies from (default: READ_NAME)
 
     Attributes
     ----------
@@ -116,11 +235,16 @@ class PipeClient():
             When true, time the command execution (default False)
         reply : string
             message received when Audacity completes the command
+        stats : CommandStats
+            latency histograms per command type
 
     See Also
     --------
     write : Write a command to _write_pipe.
     read : Read Audacity's reply from pipe.
+    submit : Write a command and return a Future for its reply.
+    send : Write a command and wait for its reply.
+    send_async : Write a command and await its reply (asyncio).
 
     """
 
@@ -128,20 +252,44 @@ class PipeClient():
     reply_ready = threading.Event()
 
     _shared_state = {}
+    # Shared state per (write_name, read_name) pair.
+    _shared_states = {(WRITE_NAME, READ_NAME): _shared_state}
 
-    def __new__(cls, enc='', *p, **k):
-        self = object.__new__(cls, *p, **k)
-        self.__dict__ = cls._shared_state
+    def __new__(cls, enc='', write_name=None, read_name=None):
+        self = object.__new__(cls)
+        key = (write_name or WRITE_NAME, read_name or READ_NAME)
+        self.__dict__ = PipeClient._shared_states.setdefault(key, {})
         return self
 
-    def __init__(self, enc='utf-8'):
+    def __init__(self, enc='utf-8', write_name=None, read_name=None):
+        if '_pending' in self.__dict__:
+            # Already connected: every instance for these pipes shares the
+            # write pipe, the reply queue and the single reader thread.
+            # Resetting them here would hand pending replies to the wrong
+            # command and start a second reader on the same FIFO.
+            return
+        self.write_name = write_name or WRITE_NAME
+        self.read_name = read_name or READ_NAME
+        if (self.write_name, self.read_name) == (WRITE_NAME, READ_NAME):
+            # Keep the class-level events for the default pipes so that
+            # PipeClient.reply_ready keeps working for existing callers.
+            self.reader_pipe_broken = PipeClient.reader_pipe_broken
+            self.reply_ready = PipeClient.reply_ready
+        elif 'reply_ready' not in self.__dict__:
+            self.reader_pipe_broken = threading.Event()
+            self.reply_ready = threading.Event()
         self.timer = False
         self._start_time = 0
         self._write_pipe = None
         self.reply = ''
         self.enc = enc
-        if not self._write_pipe:
-            self._write_thread_start()
+        # Futures of commands still waiting for a reply, oldest first.
+        # mod-script-pipe answers commands in order, so the next reply
+        # always belongs to the head of this queue.
+        self._pending = deque()
+        self._pending_lock = threading.Lock()
+        self.stats = CommandStats()
+        self._write_thread_start()
         self._read_thread_start()
 
     def _write_thread_start(self):
@@ -159,10 +307,10 @@ class PipeClient():
     def _write_pipe_open(self):
         """Open _write_pipe."""
         if self.enc:
-            self._write_pipe = open(WRITE_NAME, 'w', newline='',
+            self._write_pipe = open(self.write_name, 'w', newline='',
                                     encoding=self.enc)
         else:
-            self._write_pipe = open(WRITE_NAME, 'w', newline='')
+            self._write_pipe = open(self.write_name, 'w', newline='')
 
     def _read_thread_start(self):
         """Start read_pipe thread."""
@@ -180,6 +328,11 @@ class PipeClient():
             timer : bool, optional
                 If true, time the execution of the command
 
+        Returns
+        -------
+        Future
+            Resolved with the reply to this command.
+
         Example
         -------
             write("GetInfo: Type=Labels", timer=True):
@@ -187,55 +340,263 @@ class PipeClient():
         """
         self.timer = timer
         print('Sending command:', command)
-        self._write_pipe.write(command + EOL) # type: ignore
         # Check that read pipe is alive
-        if PipeClient.reader_pipe_broken.is_set():
+        if self.reader_pipe_broken.is_set():
             sys.exit('PipeClient: Read-pipe error.')
+        future = Future()
+        future.command = command
+        future.sent_at = time.perf_counter()
+        # Clear the reply state *before* sending, otherwise a fast reply
+        # can arrive in between and be wiped out.
+        with self._pending_lock:
+            self.reply = ''
+            self.reply_ready.clear()
+            self._pending.append(future)
         try:
-            self._write_pipe.flush() # type: ignore
             if self.timer:
                 self._start_time = time.time()
+            self._write_pipe.write(command + EOL) # type: ignore
+            self._write_pipe.flush() # type: ignore
+        except IOError as err:
+            with self._pending_lock:
+                self._pending.remove(future)
+            if err.errno == errno.EPIPE:
+                sys.exit('PipeClient: Write-pipe error.')
+            else:
+                raise
+        return future
+
+    def write_many(self, commands):
+        """Write several commands to _write_pipe with a single flush.
+
+        Replies are pipelined: every command gets its own Future and
+        Audacity answers them in order.
+
+        Parameters
+        ----------
+            commands : list of string
+                The commands to send to Audacity
+
+        Returns
+        -------
+        list of Future
+            One Future per command, in the same order.
+
+        """
+        commands = list(commands)
+        if not commands:
+            return []
+        print('Sending {0} commands'.format(len(commands)))
+        if self.reader_pipe_broken.is_set():
+            sys.exit('PipeClient: Read-pipe error.')
+        futures = []
+        for command in commands:
+            future = Future()
+            future.command = command
+            futures.append(future)
+        sent_at = time.perf_counter()
+        for future in futures:
+            future.sent_at = sent_at
+        with self._pending_lock:
             self.reply = ''
-            PipeClient.reply_ready.clear()
+            self.reply_ready.clear()
+            self._pending.extend(futures)
+        try:
+            self._write_pipe.write(EOL.join(commands) + EOL) # type: ignore
+            self._write_pipe.flush() # type: ignore
         except IOError as err:
+            with self._pending_lock:
+                for future in futures:
+                    self._pending.remove(future)
             if err.errno == errno.EPIPE:
                 sys.exit('PipeClient: Write-pipe error.')
             else:
                 raise
+        return futures
+
+    def submit(self, command, timer=False):
+        """Write a command and return a Future for its reply.
+
+        Parameters
+        ----------
+            command : string
+                The command to send to Audacity
+            timer : bool, optional
+                If true, time the execution of the command
+
+        Returns
+        -------
+        Future
+            Resolved with the reply string; ``future.command`` holds
+            the command it belongs to.
+
+        """
+        return self.write(command, timer=timer)
+
+    def send(self, command, timeout=10.0, timer=False):
+        """Write a command and block until its reply is received.
+
+        Parameters
+        ----------
+            command : string
+                The command to send to Audacity
+            timeout : float, optional
+                Seconds to wait for the reply (None waits forever)
+            timer : bool, optional
+                If true, time the execution of the command
+
+        Returns
+        -------
+        string
+            The reply to this command.
+
+        Raises
+        ------
+        TimeoutError
+            If Audacity did not answer within timeout.
+
+        """
+        future = self.write(command, timer=timer)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise TimeoutError('PipeClient: Reply timed-out: ' + command)
+
+    def wait_reply(self, timeout=10.0):
+        """Block until the reply to the last command is received.
+
+        Parameters
+        ----------
+            timeout : float, optional
+                Seconds to wait for the reply (None waits forever)
+
+        Returns
+        -------
+        string
+            The reply from the last command, or null string if it was
+            not received within timeout.
+
+        """
+        if not self.reply_ready.wait(timeout):
+            return ''
+        return self.reply
 
     def _reader(self):
         """Read FIFO in worker thread."""
-        # Thread will wait at this read until it connects.
+        # Thread will wait at this open until it connects.
         # Connection should occur as soon as _write_pipe has connected.
-        read_pipe = None
-        if self.enc:
-            read_pipe = open(READ_NAME, 'r', newline='', encoding=self.enc)
-        else:
-            read_pipe = open(READ_NAME, 'r', newline='', encoding='utf-8')
-        message = ''
-        pipe_ok = True
-        while pipe_ok:
-            try:
-                line = read_pipe.readline()
-                # Stop timer as soon as we get first line of response.
-                stop_time = time.time()
-                while pipe_ok and line != '\n':
-                    message += line
-                    line = read_pipe.readline()
-                    if line == '':
-                        # No data in read_pipe indicates that the pipe is broken
-                        # (Audacity may have crashed).
-                        PipeClient.reader_pipe_broken.set()
-                        pipe_ok = False
-                if self.timer:
-                    xtime = (stop_time - self._start_time) * 1000
-                    message += 'Execution time: {0:.2f}ms'.format(xtime)
-            except:
-                pass
+        enc = self.enc or 'utf-8'
+        try:
+            read_fd = os.open(self.read_name,
+                              os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        except OSError:
+            self.reader_pipe_broken.set()
+            self._fail_pending('PipeClient: Read-pipe error.')
+            return
+        # Replies are framed by an empty line. Bytes are collected in a
+        # bytearray and every reply is decoded once, so long replies
+        # (e.g. GetInfo JSON) are handled in linear time.
+        buffer = bytearray()
+        scan_from = 0
+        stop_time = 0
+        try:
+            for chunk in _read_chunks(read_fd):
+                if not buffer:
+                    # Stop timer as soon as we get first bytes of response.
+                    stop_time = time.time()
+                buffer += chunk
+                while True:
+                    if buffer[:1] == b'\n':
+                        end = 0
+                    else:
+                        end = buffer.find(b'\n\n', scan_from)
+                        if end < 0:
+                            scan_from = max(len(buffer) - 1, 0)
+                            break
+                        end += 1
+                    message = buffer[:end].decode(enc, errors='replace')
+                    del buffer[:end + 1]
+                    scan_from = 0
+                    if self.timer:
+                        xtime = (stop_time - self._start_time) * 1000
+                        message += 'Execution time: {0:.2f}ms'.format(xtime)
+                    self._deliver(message)
+                    stop_time = time.time()
+        except OSError:
+            pass
+        finally:
+            os.close(read_fd)
+        # No data in read_pipe indicates that the pipe is broken
+        # (Audacity may have crashed).
+        self.reader_pipe_broken.set()
+        self._fail_pending('PipeClient: Read-pipe error.')
+
+    async def send_async(self, command, timeout=10.0):
+        """Write a command and await its reply (asyncio).
+
+        Parameters
+        ----------
+            command : string
+                The command to send to Audacity
+            timeout : float, optional
+                Seconds to wait for the reply (None waits forever)
+
+        Returns
+        -------
+        string
+            The reply to this command.
+
+        Raises
+        ------
+        TimeoutError
+            If Audacity did not answer within timeout.
+
+        """
+        future = asyncio.wrap_future(self.write(command))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError('PipeClient: Reply timed-out: ' + command)
+
+    async def send_many_async(self, commands, timeout=60.0):
+        """Write several commands at once and await all replies (asyncio).
+
+        Returns
+        -------
+        list of string
+            The replies, in the same order as commands.
+
+        """
+        futures = [asyncio.wrap_future(future) for future in self.write_many(commands)]
+        if not futures:
+            return []
+        try:
+            return await asyncio.wait_for(asyncio.gather(*futures), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError('PipeClient: {0} replies timed-out.'.format(len(futures)))
+
+    def _deliver(self, message):
+        """Store a reply and resolve the Future of its command."""
+        with self._pending_lock:
             self.reply = message
-            PipeClient.reply_ready.set()
-            message = ''
-        read_pipe.close()
+            future = self._pending.popleft() if self._pending else None
+            self.reply_ready.set()
+        if future is None:
+            return
+        seconds = time.perf_counter() - future.sent_at
+        if not future.done():
+            future.set_result(message)
+        self.stats.record(future.command, seconds)
+
+    def _fail_pending(self, reason):
+        """Fail every command still waiting for a reply."""
+        with self._pending_lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            self.reply_ready.set()
+        for future in pending:
+            if not future.done():
+                future.set_exception(BrokenPipeError(reason))
 
     def read(self):
         """Read Audacity's reply from pipe.
@@ -248,11 +609,34 @@ class PipeClient():
             is still processing the last command.
 
         """
-        if not PipeClient.reply_ready.is_set():
+        if not self.reply_ready.is_set():
             return ''
         return self.reply
 
 
+def _read_chunks(read_fd, size=65536):
+    """Yield chunks read from read_fd until the pipe is closed."""
+    if sys.platform == 'win32':
+        # selectors only works with sockets on Windows.
+        while True:
+            chunk = os.read(read_fd, size)
+            if not chunk:
+                return
+            yield chunk
+    os.set_blocking(read_fd, False)
+    with selectors.DefaultSelector() as selector:
+        selector.register(read_fd, selectors.EVENT_READ)
+        while True:
+            selector.select()
+            try:
+                chunk = os.read(read_fd, size)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                return
+            yield chunk
+
+
 def bool_from_string(strval):
     """Return boolean value from string"""
     if strval.lower() in ('true', 't', '1', 'yes', 'y'):
@@ -276,6 +660,8 @@ def main():
                         help='show documentation and exit')
     parser.add_argument('-e', '--pipe-encoding', type=str, default='',
                         help='non-default encoding to use for r/w pipes')
+    parser.add_argument('-j', '--stats-json', type=str, default='',
+                        help='write command latency statistics to this file on quit')
     args = parser.parse_args()
 
     if args.docs:
@@ -289,19 +675,17 @@ def main():
             message = raw_input("\nEnter command or 'Q' to quit: ")
         else:
             message = input("\nEnter command or 'Q' to quit: ")
-        start = time.time()
         if message.upper() == 'Q':
+            if args.stats_json:
+                client.stats.dump(args.stats_json)
             sys.exit(0)
         elif message == '':
             pass
         else:
-            client.write(message, timer=args.show)
-            while reply == '':
-                time.sleep(0.1)  # allow time for reply
-                if time.time() - start > args.timeout:
-                    reply = 'PipeClient: Reply timed-out.'
-                else:
-                    reply = client.read()
+            try:
+                reply = client.send(message, timeout=args.timeout, timer=args.show)
+            except TimeoutError:
+                reply = 'PipeClient: Reply timed-out.'
             print(reply)
 
 
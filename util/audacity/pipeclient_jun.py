@@ -5,7 +5,12 @@ from __init__ import *
 sys.path.append(source_code_path)
 from _workplace.library.junLib import *
 from _workplace.util.audacity.pipeclient import PipeClient
-import time
+import json
+import shutil
+import tempfile
+from contextlib import contextmanager
+from concurrent.futures import wait
+from typing import NamedTuple
 
 if sys.version_info[0] < 3 and sys.version_info[1] < 7:
     sys.exit('PipeClient Error: Python 2.7 or later required')
@@ -22,33 +27,151 @@ else:
     READ_NAME = PIPE_BASE + 'from.' + str(os.getuid())
     EOL = '\n'
 
+class AudacityTrack(NamedTuple):
+    """GetInfo: Type=Tracks 결과의 트랙 하나"""
+    index: int
+    name: str
+    kind: str
+    start: float = 0.0
+    end: float = 0.0
+    selected: bool = False
+    focused: bool = False
+
+class TrackLabel(NamedTuple):
+    """GetInfo: Type=Labels 결과의 레이블 하나 (index는 전체 레이블 번호, SetLabel의 Label 값)"""
+    index: int
+    track: int
+    start: float
+    end: float
+    text: str = ''
+
 class PipeClient_jun(PipeClient):
 
-    def __init__(self, enc='utf-8'):
-        super().__init__(enc)
+    def __init__(self, enc='utf-8', write_name=None, read_name=None):
+        super().__init__(enc, write_name, read_name)
+        if 'batch_size' in self.__dict__:
+            # 같은 파이프의 다른 인스턴스가 이미 초기화한 공유 상태입니다.
+            return
         self.project_name = None
         self.project_path = None
         self.txt_file_path = None
+        self._batch = None
+        self._batch_futures = []
+        self.batch_size = 500
+
+    @contextmanager
+    def batch(self, timeout=60.0):
+        """
+        with 블록 안에서 queue()로 모은 명령을 큰 묶음으로 한 번에 보내고,
+        블록이 끝날 때 모든 응답을 기다립니다. 블록 안에서는 명령별 Future 리스트를 받습니다.
+        """
+        self._batch = []
+        self._batch_futures = []
+        try:
+            yield self._batch_futures
+            self.flush()
+        finally:
+            futures = self._batch_futures
+            self._batch = None
+            self._batch_futures = []
+        done, not_done = wait(futures, timeout=timeout)
+        if not_done:
+            raise TimeoutError(f'PipeClient: {len(not_done)} replies timed-out.')
+
+    def queue(self, command):
+        """배치 중이면 명령을 모아두고(batch_size마다 전송), 아니면 바로 보냅니다."""
+        if self._batch is None:
+            return self.submit(command)
+        self._batch.append(command)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+        return None
+
+    def flush(self):
+        """모아둔 명령을 한 번의 write/flush로 보내고 Future 리스트를 반환합니다."""
+        if not self._batch:
+            return []
+        commands = self._batch[:]
+        self._batch.clear()
+        futures = self.write_many(commands)
+        self._batch_futures.extend(futures)
+        return futures
+
+    def send_checked(self, command, timeout=10.0):
+        """
+        명령을 보내고 응답을 기다립니다. Audacity가 실패를 알리면('BatchCommand finished: Failed!')
+        RuntimeError를 올립니다.
+        """
+        reply = self.send(command, timeout=timeout)
+        _, _, status = reply.rpartition('BatchCommand finished:')
+        if status.strip().startswith('Failed'):
+            raise RuntimeError(f"{command.split(':', 1)[0]} 실패: {reply.strip()}")
+        return reply
+
+    def import_labels(self, labels, track_name=None, timeout=60.0):
+        """
+        레이블들을 임시 레이블 파일로 저장한 뒤 Import2 명령 한 번으로 레이블 트랙을 만듭니다.
+        Audacity는 .txt 파일을 레이블 트랙으로 가져오고 파일 이름을 트랙 이름으로 씁니다.
+        labels : (start, end, text)를 가진 레코드들 (Label 등)
+        """
+        temp_folder = tempfile.mkdtemp(prefix='audacity_labels_')
+        label_file_path = os.path.join(temp_folder, (track_name or 'labels') + '.txt')
+        try:
+            with open(label_file_path, 'w', encoding='utf-8') as file:
+                for label in labels:
+                    file.write(f"{label[0]}\t{label[1]}\t{label[2]}\n")
+            import_path = os.path.abspath(label_file_path).replace('\\', '/')
+            return self.send_checked(f'Import2: Filename="{import_path}"', timeout=timeout)
+        finally:
+            shutil.rmtree(temp_folder, ignore_errors=True)
 
-    def save_to_label(self, txt_file_path=None):
+    def get_info(self, info_type='Tracks', timeout=30.0):
+        """
+        GetInfo를 JSON 형식으로 요청하고 응답의 JSON 부분을 파싱해 반환합니다.
+        명령이 실패하면 RuntimeError를 올립니다.
+        """
+        reply = self.send(f'GetInfo: Type={info_type} Format=JSON', timeout=timeout)
+        json_text, _, status = reply.rpartition('BatchCommand finished:')
+        if not status.strip().startswith('OK'):
+            raise RuntimeError(f'GetInfo 실패: {reply.strip()}')
+        return json.loads(json_text) if json_text.strip() else []
+
+    def get_tracks(self, timeout=30.0):
+        """현재 프로젝트의 트랙들을 AudacityTrack 리스트로 반환합니다."""
+        return [AudacityTrack(index, track.get('name', ''), track.get('kind', ''),
+                              float(track.get('start', 0.0)), float(track.get('end', 0.0)),
+                              bool(track.get('selected', 0)), bool(track.get('focused', 0)))
+                for index, track in enumerate(self.get_info('Tracks', timeout))]
+
+    def get_labels(self, timeout=30.0):
+        """현재 프로젝트의 모든 레이블을 트랙 순서대로 TrackLabel 리스트로 반환합니다."""
+        labels = []
+        for track_index, track_labels in self.get_info('Labels', timeout):
+            for start, end, text in track_labels:
+                labels.append(TrackLabel(len(labels), track_index, float(start), float(end), text))
+        return labels
+
+    def find_empty_labels(self, timeout=30.0):
+        """텍스트가 비어있는 레이블들을 반환합니다."""
+        return [label for label in self.get_labels(timeout) if not label.text.strip()]
+
+    def save_to_label(self, txt_file_path=None, timeout=30.0):
         self.txt_file_path = txt_file_path or self.txt_file_path
-        self.write(f'ExportLabels: FileName={self.txt_file_path}')
+        return self.send(f'ExportLabels: FileName={self.txt_file_path}', timeout=timeout)
     
-    def read_json(self):
-        text = self.read()
-        time.sleep(5)  # 약간의 지연 시간을 둡니다.
+    def read_json(self, timeout=10.0):
+        # 고정 sleep 대신 마지막 명령의 응답이 올 때까지 기다립니다.
+        text = self.wait_reply(timeout)
         print(text)
-        input("Enter to continue.")
         return text
 
     def set_txt_file_path(self, txt_file_path):
         self.txt_file_path = txt_file_path
 
-    def save_project(self, path=None):
+    def save_project(self, path=None, timeout=60.0):
         if path:
             # 지정된 경로에 프로젝트 저장
-            self.write(f"SaveProject2: Path={path}\n")
-            time.sleep(3)  # 약간의 지연 시간을 둡니다.
+            self.send(f"SaveProject2: Path={path}", timeout=timeout)
             self.project_path = path
             return self
         # else:
@@ -61,16 +184,34 @@ class PipeClient_jun(PipeClient):
 
     def set_project_name(self, project_name:str=None): # type: ignore
         if project_name:
-            self.write(f'SetProject: Name="{project_name}"')
+            self.send(f'SetProject: Name="{project_name}"')
             self.project_name = project_name
         return self
     
     def get_project_name(self):
         return self.project_name
 
+    def open_audio_with_labels(self, audio_file_path, label_file_path=None, timeout=120.0):
+        """
+        현재 트랙을 모두 지우고 오디오 파일과 레이블 파일을 가져옵니다.
+        label_file_path가 없으면 오디오 파일과 같은 이름의 .txt를 사용합니다.
+        지우기나 가져오기가 실패하면(파일이 없거나 읽을 수 없는 경우 등) RuntimeError를 올립니다.
+        """
+        label_file_path = label_file_path or os.path.splitext(audio_file_path)[0] + '.txt'
+        track_name = os.path.splitext(os.path.basename(os.path.abspath(audio_file_path)))[0]
+        self.delete_all()
+        self.set_project_name(track_name)
+        audio_path = os.path.abspath(audio_file_path).replace('\\', '/')
+        self.send_checked(f'Import2: Filename="{audio_path}"', timeout=timeout)
+        if os.path.exists(label_file_path):
+            with open(label_file_path, 'r', encoding='utf-8') as file:
+                labels = [line.rstrip('\n').split('\t', 2) for line in file if line.strip()]
+            self.import_labels([label + [''] * (3 - len(label)) for label in labels], track_name=track_name, timeout=timeout)
+        return self
+
     def delete_all(self):
-        self.write(f"SelAllTracks")
-        self.write(f"RemoveTracks")
+        self.send_checked(f"SelAllTracks")
+        self.send_checked(f"RemoveTracks")
 
     def exit(self):
         self.write(f"Exit")
@@ -78,6 +219,6 @@ class PipeClient_jun(PipeClient):
     def _write_pipe_open(self):
         """Open _write_pipe."""
         if self.enc:
-            self._write_pipe = open(WRITE_NAME, 'w', newline='', encoding=self.enc)
+            self._write_pipe = open(self.write_name, 'w', newline='', encoding=self.enc)
         else:
-            self._write_pipe = open(WRITE_NAME, 'w', newline='', encoding='utf-8')
+            self._write_pipe = open(self.write_name, 'w', newline='', encoding='utf-8')
@@ -23,32 +23,18 @@ import xml.etree.ElementTree as ET
 
 ffmpeg_path = join_folder_path(root_folder_path, '_resource', 'ffmpeg-n5.1-latest-win64-lgpl-5.1', 'bin') + '\\ffmpeg'
 
-import sqlite3
+from _workplace.library.aup3_utils import read_aup3_labels, extract_aup3_labels_in_folder
+from _workplace.library.label_utils import write_labels
 
 def extract_labels_from_aup3(aup3_filename, output_txt_filename):
-    # SQLite 데이터베이스 연결
-    conn = sqlite3.connect(aup3_filename)
-    cursor = conn.cursor()
+    # .aup3(SQLite)를 읽기 전용으로 열어 프로젝트 문서의 레이블 트랙을 직접 읽습니다.
+    labels = read_aup3_labels(aup3_filename)
 
-    # 레이블 정보를 저장할 리스트
-    labels = []
-
-    # 레이블 정보 조회 (SQL 쿼리는 .aup3 파일의 구조에 따라 조정이 필요할 수 있습니다)
-    cursor.execute("SELECT start_time, end_time, title FROM labels")
-    for row in cursor.fetchall():
-        start_time, end_time, title = row
-        labels.append((start_time, end_time, title))
-
-    # 데이터베이스 연결 종료
-    conn.close()
-
-    # 레이블 정보를 .txt 파일로 저장
+    # 기존 txt는 백업해두고, 레이블 정보는 임시 파일을 거쳐 한 번에 교체합니다.
     if path_exist(output_txt_filename):
         copy_and_rename_file(output_txt_filename, rename(output_txt_filename, new_extension='txt.bak'))
-        delete_file(output_txt_filename)
-    with open(output_txt_filename, 'w', encoding='utf-8') as f:
-        for label in labels:
-            f.write(f"{label[0]}\t{label[1]}\t{label[2]}\n")
+    write_labels(output_txt_filename, labels, atomic=True)
+    return labels
 
 def save(client, aup_file_path=None):
     # .aup 파일 경로를 사용자로부터 입력받음
@@ -63,6 +49,16 @@ def save(client, aup_file_path=None):
     # 원본 .aup 파일 삭제
     os.remove(aup_file_path)
 
+def save_folder(folder_path=None, output_csv=None, recursive=False):
+    # 폴더의 모든 .aup3에서 레이블 txt(와 전체 CSV)를 만듭니다. 원본 .aup3는 지우지 않습니다.
+    folder_path = folder_path or strip_quotes(input("Enter the folder path of your .aup3 files: "))
+    results = extract_aup3_labels_in_folder(folder_path, recursive=recursive, output_csv=output_csv)
+    for aup3_file, status in results:
+        if status != 'done':
+            print(f"{os.path.basename(aup3_file)} : {status}")
+    print(f"==========\n{len(results)} files\n==========")
+    return results
+
 def run(client=None, aup_file_path=None):
     client = client or PipeClient()
     save(client=client, aup_file_path=aup_file_path)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+from __init__ import *
+sys.path.append(source_code_path)
+from _workplace.library.junLib import *
+from _workplace.util.audacity.pipeclient_jun import PipeClient_jun
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+class AudacitySession:
+    """Audacity 인스턴스 하나(파이프 한 쌍)에 대한 세션"""
+
+    def __init__(self, client: PipeClient_jun, name=''):
+        self.client = client
+        self.name = name or client.write_name
+        self.file_path = None
+        self.label_file_path = None
+
+    def load(self, file_path, label_file_path=None):
+        """기존 트랙을 지우고 오디오와 레이블을 가져옵니다."""
+        self.file_path = file_path
+        self.label_file_path = label_file_path or rename(file_path, new_extension='txt')
+        self.client.open_audio_with_labels(file_path, self.label_file_path)
+        return self
+
+    def export_labels(self, txt_file_path=None):
+        """현재 레이블 트랙을 txt로 내보냅니다."""
+        txt_file_path = txt_file_path or self.label_file_path
+        return self.client.save_to_label(txt_file_path)
+
+class AudacitySessionPool:
+    """
+    여러 Audacity 인스턴스를 파이프 이름으로 구분해 파일 큐를 처리하는 세션 관리자
+    한 세션에서 검수하는 동안 다른 세션은 다음 파일을 미리 가져오고(prefetch),
+    레이블 내보내기는 백그라운드에서 실행합니다.
+    """
+
+    def __init__(self, pipe_names=None, enc='utf-8', export_workers=2):
+        """
+        pipe_names : (write_name, read_name) 리스트. None이면 기본 파이프 하나만 사용
+        """
+        pipe_names = pipe_names or [(None, None)]
+        self.sessions = [AudacitySession(PipeClient_jun(enc, write_name, read_name)) for write_name, read_name in pipe_names]
+        self._queue = deque()
+        self._idle = deque(self.sessions)
+        self._ready = deque()
+        self._exports = []
+        self._cond = threading.Condition()
+        self._loader = ThreadPoolExecutor(max_workers=len(self.sessions))
+        self._exporter = ThreadPoolExecutor(max_workers=export_workers)
+
+    def add_files(self, file_paths):
+        """처리할 파일들을 큐에 추가하고 비어있는 세션에서 미리 가져오기를 시작합니다."""
+        with self._cond:
+            self._queue.extend(file_paths)
+            self._prefetch()
+        return self
+
+    def _prefetch(self):
+        # self._cond를 잡은 상태에서 호출합니다.
+        while self._idle and self._queue:
+            session = self._idle.popleft()
+            file_path = self._queue.popleft()
+            self._ready.append((session, self._loader.submit(self._load, session, file_path)))
+
+    def _load(self, session, file_path):
+        # 가져오기가 실패한 세션도 풀로 돌려보내야 세션 수가 줄지 않습니다. 예외는 next_session에서 올라갑니다.
+        try:
+            return session.load(file_path)
+        except BaseException:
+            with self._cond:
+                self._idle.append(session)
+                self._prefetch()
+                self._cond.notify_all()
+            raise
+
+    def next_session(self, timeout=None):
+        """
+        다음 파일이 준비된 세션을 반환합니다. 더 처리할 파일이 없으면 None
+        모든 세션이 내보내기 중이면 세션이 돌아올 때까지 기다립니다.
+        가져오기 중 오류가 나면 그 예외를 그대로 올립니다. (그 세션은 풀로 돌아가 다음 파일을 가져옵니다.)
+        """
+        with self._cond:
+            while True:
+                self._prefetch()
+                if self._ready:
+                    session, future = self._ready.popleft()
+                    break
+                if not self._queue:
+                    return None
+                if not self._cond.wait(timeout):
+                    raise TimeoutError('사용 가능한 Audacity 세션이 없습니다.')
+        return future.result(timeout=timeout)
+
+    def done(self, session: AudacitySession, export=True, txt_file_path=None):
+        """
+        검수가 끝난 세션을 반환합니다. 레이블 내보내기는 백그라운드에서 실행하고,
+        끝나면 세션이 다음 파일을 가져옵니다. 내보내기 Future를 반환합니다.
+        """
+        def finish():
+            try:
+                return session.export_labels(txt_file_path) if export else ''
+            finally:
+                with self._cond:
+                    self._idle.append(session)
+                    self._prefetch()
+                    self._cond.notify_all()
+        future = self._exporter.submit(finish)
+        self._exports.append(future)
+        return future
+
+    def run(self, review, export=True):
+        """
+        큐의 모든 파일에 대해 review(session)을 호출합니다.
+        review가 False를 반환하면 해당 파일의 레이블은 내보내지 않습니다.
+        """
+        while True:
+            session = self.next_session()
+            if session is None:
+                break
+            result = review(session)
+            self.done(session, export=export and result is not False)
+        return self.close()
+
+    def close(self):
+        """남은 내보내기가 끝날 때까지 기다리고 결과 리스트를 반환합니다."""
+        results = [future.result() for future in self._exports]
+        self._exports = []
+        self._loader.shutdown(wait=True)
+        self._exporter.shutdown(wait=True)
+        return results
+
+def run(folder_path=None, extension='mp3', pipe_names=None):
+    folder_path = folder_path or strip_quotes(input('Enter folder path : '))
+    pool = AudacitySessionPool(pipe_names)
+    pool.add_files(get_files_path_in_folder_via_ext(folder_path, extension))
+
+    def review(session):
+        print(f"==========\n[{session.name}] {os.path.basename(session.file_path)}\n==========")
+        return strip_quotes(input("Enter to save labels ('s' to skip) : ")).lower() != 's'
+
+    pool.run(review)
+
+if __name__ == "__main__":
+    run()
@@ -6,18 +6,34 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(os.path.dirname(
 from _workplace.library.junLib import *
 from _workplace.library.junLib_csv import *
 from pydub import AudioSegment
-from _workplace.Jun.cut_video.cut_video_via_label_personal import new_label_sentence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from _workplace.Jun.cut_video.rename_vocal_files import *
+from _workplace.library.label_utils import iter_labels, merge_sentences
+from _workplace.library.manifest_utils import MANIFEST_COLUMNS, build_segments, write_manifest
+from _workplace.library.csv_handler import CSVAppender
 
 class cut_audio:
     def __init__(self, input_path) -> None:
         self.input_path = input_path
+        self.audio = None
+
+    def load(self):
+        # 원본은 한 번만 디코딩하고 구간마다 재사용합니다.
+        if self.audio is None:
+            self.audio = AudioSegment.from_file(self.input_path)
+        return self.audio
+
+    def export_segment(self, segment, format='mp3'):
+        audio = self.load()
+        create_folder(parent_path(segment.output_path), show_msg=False)
+        audio[segment.start * 1000:segment.end * 1000].export(segment.output_path, format=format)
+        return segment.output_path
 
     def cut_audio(self, start_time, end_time, i=''):
         self.input_path
         parent = parent_path(self.input_path)
         base_name = os.path.splitext(os.path.basename(self.input_path))[0]
-        audio = AudioSegment.from_file(self.input_path)
+        audio = self.load()
 
         # 시작 및 종료 시간 계산 (단위: 밀리초)
         start_ms = start_time * 1000
@@ -39,40 +55,51 @@ def process2(source_file_path):
     target_folder_path = join_folder_path(parent, base_name)
     pass
 
-def process(input_file='', label_file=''):
+def cut_segments(input_file, label_file='', merge=True, extension='mp3', max_threads=4):
+    """
+    레이블 파일 -> 구간 목록 -> 자르기를 중간 파일 없이 메모리에서 처리하고 구간 목록을 반환합니다.
+    구간 파일 export(ffmpeg)는 스레드로 나눠 실행합니다.
+    """
+    label_file = label_file or rename(input_file, suffix='-label', new_extension='txt')
+    labels = iter_labels(label_file)
+    if merge:
+        labels = merge_sentences(labels)
+    segments = build_segments(labels, input_file, extension=extension)
+    obj = cut_audio(input_file)
+    obj.load()
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        list(executor.map(lambda segment: obj.export_segment(segment, format=extension), segments))
+    return segments
 
+def process(input_file='', label_file='', merge=True):
     # 오디오 파일 자를 경로와 저장할 경로 설정
     input_file = ifinput(input_file, 'audio file')
     label_file = label_file if label_file else rename(input_file, suffix='-label', new_extension='txt')
-    new_lines = new_label_sentence(label_file)
-    print(new_lines)
-    new_label_file = write_to_file(rename(label_file, suffix='-refined', new_extension='txt'), new_lines)
-    input()
-    # new_label_file = add_columns_and_vaules_for_csv(new_label_file, col_names=['start', 'end', 'text'])
-    obj = cut_audio(input_file)
-    new_lines = read_lines(new_label_file)
-    files_path_list = []
-    label_lines_for_csv = []
-    label_lines_for_csv.append('index\tstart\tend\ttext\tfilename')
-    for i, line in enumerate(new_lines, 1):
-        start_time_stamp, end_time_stamp, text = line.split('\t')
-        text = text.replace('\n', '').replace('\n', '').strip()
-        # 오디오 파일 자르기
-        output_file_path = obj.cut_audio(float(start_time_stamp), float(end_time_stamp), i)
-        files_path_list.append(output_file_path)
-        output_file_basename = os.path.basename(output_file_path)
-        # result_file_basename = output_file_basename.split('-')[0]
-        result_file_basename = output_file_basename
-        text_line = f"{str(i).zfill(3)}\t{start_time_stamp}\t{end_time_stamp}\t{text}\t{result_file_basename}"
-        label_lines_for_csv.append(text_line)
-    label_file_for_csv = write_to_file(rename(label_file, suffix='-csv'), label_lines_for_csv)
-    # new_label_file = add_files_name_for_csv(new_label_file, files_path_list)
-    csv_file = convert_text_to_csv(label_file_for_csv)
-    convert_csv_to_txt(csv_file)
+    segments = cut_segments(input_file, label_file, merge=merge)
+    csv_file = write_manifest(rename(label_file, suffix='-csv', new_extension='csv'), segments)
     move_file_to_current_other_folder(label_file)
-    move_file_to_current_other_folder(label_file_for_csv)
-
     process2(input_file)
+    return csv_file
+
+def process_folder(folder_path, extension='mp3', manifest_name='', merge=True, max_workers=None):
+    """
+    폴더의 오디오 파일들을 여러 프로세스로 나눠 자르고, 전체 구간을 매니페스트 하나로 저장합니다.
+    manifest_name : 매니페스트 파일 이름 (.csv 또는 .jsonl). 없으면 '폴더이름_manifest.csv'
+    """
+    files = get_files_path_in_folder_via_ext(folder_path, extension)
+    files = [file for file in files if path_exist(rename(file, suffix='-label', new_extension='txt'))]
+    manifest_name = manifest_name or os.path.basename(os.path.abspath(folder_path)) + '_manifest.csv'
+    manifest_path = join_folder_path(folder_path, manifest_name)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(cut_segments, files, [''] * len(files), [merge] * len(files))
+        if manifest_path.lower().endswith('.jsonl'):
+            return write_manifest(manifest_path, [segment for result in results for segment in result])
+        # CSV 매니페스트는 파일 하나가 끝날 때마다 이어 써서, 중간에 멈춰도 끝난 파일의 구간은 남습니다.
+        with CSVAppender(manifest_path, MANIFEST_COLUMNS, overwrite=True) as appender:
+            for result in results:
+                appender.append_many([getattr(segment, column) for column in MANIFEST_COLUMNS] for segment in result)
+                appender.flush()
+    return manifest_path
 
 def run():
     print('1. folder\n2. file')
@@ -80,9 +107,7 @@ def run():
     if select == '1':
         folder_path = strip_quotes(input('Enter folder path : '))
         extension = strip_quotes(input('Enter target extension(wav, mp3, etc.) : '))
-        files = get_files_path_in_folder_via_ext(folder_path, extension)
-        for i, file in enumerate(files):
-            process(file)
+        process_folder(folder_path, extension)
 
     elif select == '2':
         file_path = strip_quotes(input('Enter audio file path: '))
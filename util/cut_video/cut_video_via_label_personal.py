@@ -4,47 +4,33 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(os.path.dirname(__file__)))))
 from _workplace.library.junLib import *
+from _workplace.library.label_utils import SENTENCE_ENDINGS, merge_sentences, parse_label_line
 from _workplace.util.cut_video.cut_video import cut_time_by_time as cuttime
 from _workplace.util.media_files_control import transfer_mp4_to_mp3 as trans
 
-def new_label_sentence(label_file_path):
-    lines = read_lines(label_file_path)
-    new_lines = []
-    new_start: str = None
-    new_end: str = None
-    new_text = None
+def iter_labels_keeping_times(label_file_path, raw_times):
+    """
+    레이블 파일을 읽어 Label을 yield 하면서, 시간 값(float) -> 파일에 적힌 시간 문자열을 raw_times에 기록합니다.
+    """
+    with open(label_file_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            label = parse_label_line(line, label_file_path)
+            if label is not None:
+                starttime, endtime = line.split('\t', 2)[:2]
+                raw_times.setdefault(label.start, starttime)
+                raw_times.setdefault(label.end, endtime)
+                yield label
 
-    for i, line in enumerate(lines):
-        starttime, endtime, text = line.split('\t')
-        print(starttime, endtime, text)
-        new_end = endtime
-        text = text.strip()
-        # if text.endswith('근데'):
-        #     new_lines.append(new_start + '\t' + new_end + '\t' + new_text)
-        #     new_start = starttime
-        #     new_text = text
-        #     new_end = endtime
-        #     continue
-        if text.endswith('세요') or text.endswith('니다') or text.endswith('시다') or text.endswith('어요') or text.endswith('에요') or text.endswith('죠') or text.endswith('거야') or text.endswith('잖아') or text.endswith('데요') or text.endswith('왔어') or text.endswith('이야') or text.endswith('을까') or text.endswith('텐데') or text.endswith('싶다') or text.endswith('이구나') or text.endswith('텐데') or text.endswith('구만') or text.endswith('없어') or text.endswith('아니야') or text.endswith('예요') or text.endswith('워요') or text.endswith('어떤가요') or text.endswith('텐데') or text.endswith('해요') or text.endswith('였다') or text.endswith('하고요') or text.endswith('해요') or text.endswith('었어') or text.endswith('봐요') or text.endswith('잖아요') or text.endswith('였구나') or text.endswith('더라') or text.endswith('었어') or text.endswith('있어') or text.endswith('그랬어') or text.endswith('거든요') or text.endswith('거든') or text.endswith('니요') or text.endswith('겠다') or text.endswith('했어') or text.endswith('않나') or text.endswith('않다') or text.endswith('았어') or text.endswith('해줘') or text.endswith('찮다') or text.endswith('잖니') or text.endswith('많아') or text.endswith('있나') or text.endswith('인가') or text.endswith('뺄까') or text.endswith('빼자') or text.endswith('빼요') or text.endswith('했네') or text.endswith('게요') or text.endswith('아요') or text.endswith('져요') or text.endswith('데요') or text.endswith('니까') or text.endswith('갈게') or text.endswith('어디가'):
-            text += '.'
-        if (text.endswith('.') or text.endswith('?') or text.endswith('!')):
-            if new_text:
-                new_text += ' ' + text
-            else:
-                new_text = text
-                new_start = starttime
-            print(f"new text : {new_text}")
-            new_lines.append(new_start + '\t' + new_end + '\t' + new_text)
-            new_start = None
-            new_end = None
-            new_text = None
-        elif new_text:
-            print(f"new : {new_text} text : {text}")
-            new_text += ' ' + text
-        else:
-            new_start = starttime
-            new_text = text
-    return new_lines
+def new_label_sentence(label_file_path, endings=SENTENCE_ENDINGS, stats=None):
+    """
+    레이블 파일을 문장 단위로 병합한 "시작\t종료\t텍스트" 줄 리스트를 반환합니다.
+    시간은 파일에 적힌 문자열 그대로 씁니다. (process_sentence가 이 문자열로 자를 구간을 지정합니다.)
+    endings : 문장 끝으로 볼 어미 목록
+    stats : 병합 통계를 받을 SentenceMergeStats (optional)
+    """
+    raw_times = {}
+    labels = merge_sentences(iter_labels_keeping_times(label_file_path, raw_times), endings, stats)
+    return [f"{raw_times[label.start]}\t{raw_times[label.end]}\t{label.text}" for label in labels]
 
 def process_sentence(mp4_file_path, label_file_path):
     folder_path = parent_path(mp4_file_path)
@@ -87,21 +87,13 @@ def get_mp4_at_all_stats(directory):
 
     return total_files, total_duration, total_size
 
-def seconds_to_hms(seconds):
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
-    return f"{h:02d}:{m:02d}:{s:02d}"
-
 def process(directory):
     total_files, total_duration, total_size = get_mp4_at_all_stats(directory)
     sub_files, sub_duration, sub_size = get_subfolder_mp4_stats(directory)
     source_files, source_duration, source_size = get_directory_mp4_stats(directory)
     xml_files, xml_size = get_directory_xml_stats(directory)
     # Convert total_duration to hours:minutes:seconds format
-    hms_duration = seconds_to_hms(total_duration)
-    sub_hms = seconds_to_hms(sub_duration)
-    source_hms = seconds_to_hms(source_duration)
+    hms_duration, sub_hms, source_hms = seconds_to_hms(total_duration), seconds_to_hms(sub_duration), seconds_to_hms(source_duration)
 
     # Convert total_size to MB
     size_in_mb = total_size / (1024 * 1024)
@@ -1,27 +1,34 @@
 # -*- coding: utf-8 -*-
 import os
 import sys
+from functools import partial
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(os.path.dirname(__file__)))))
 from _workplace.library.junLib import *
+from _workplace.library.label_utils import shift_labels, clamp_labels, default_label_transforms, normalize_label_file, normalize_label_folder
 
 def process(file_path='', time_to_minus: float=0):
-    lines = read_lines(file_path)
-    new_lines = []
-    for i, line in enumerate(lines):
-        start, end, text = str(line).split('\t')
-        new_start = float(start)-float(time_to_minus)
-        if new_start < 0:
-            new_start = 0
-        new_end = float(end)-float(time_to_minus)
-        new_line = "{:.2f}\t{:.2f}\t{}".format(new_start, new_end, text.replace('\n', ''))
-        new_lines.append(new_line)
-    write_to_file(rename(file_path, suffix='-refined'), new_lines)
+    transforms = [partial(shift_labels, offset=-float(time_to_minus)), partial(clamp_labels, minimum=0.0)]
+    normalize_label_file(file_path, rename(file_path, suffix='-refined'), transforms, precision=2, force=True)
+
+def process_folder(folder_path='', time_to_minus: float=0, digits: int=2, merge: bool=False, recursive: bool=False):
+    transforms = default_label_transforms(offset=-float(time_to_minus), digits=digits, merge=merge)
+    results = normalize_label_folder(folder_path, transforms, recursive=recursive, precision=digits)
+    done = sum(1 for _, status in results if status == 'done')
+    print(f"{done}개 파일 처리, {len(results) - done}개 파일 건너뜀")
+    return results
 
 def run(file_path=''):
-    file_path = stqinput(file_path, 'txt file path')
-    time_to_minus = float(strip_quotes(input('Enter sec : ')))
-    process(file_path, time_to_minus)
+    print('1. folder\n2. file')
+    select = str(strip_quotes(input("Enter select process : ")))
+    if select == '1':
+        folder_path = stqinput(file_path, 'folder path')
+        time_to_minus = float(strip_quotes(input('Enter sec : ')) or 0)
+        process_folder(folder_path, time_to_minus)
+    else:
+        file_path = stqinput(file_path, 'txt file path')
+        time_to_minus = float(strip_quotes(input('Enter sec : ')))
+        process(file_path, time_to_minus)
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()